@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from graphql.execution.executors.asyncio import AsyncioExecutor
 from starlette.graphql import GraphQLApp
 
 from inject import *  # Should be present before any other project imports
@@ -11,4 +12,12 @@ except ImportError as err:
 from schema import schema
 
 app = FastAPI()
-app.add_route("/", GraphQLApp(schema=schema, graphiql=True))
+app.add_route(
+    "/",
+    GraphQLApp(
+        schema=schema,
+        graphiql=True,
+        # Required by the `AsyncElasticsearchConnectionField`
+        executor_class=AsyncioExecutor
+    )
+)
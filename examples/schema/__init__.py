@@ -21,6 +21,8 @@ class Query(
 ):
     """GraphQL query"""
 
+    node = graphene.relay.Node.Field()
+
 
 schema = graphene.Schema(
     query=Query,
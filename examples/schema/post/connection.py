@@ -1,7 +1,26 @@
 import graphene
 from graphene_elastic import ElasticsearchConnectionField
+from graphene_elastic.async_fields import AsyncElasticsearchConnectionField
+from graphene_elastic.versions import (
+    LOOSE_ELASTICSEARCH_VERSION,
+    LOOSE_VERSION_7_0,
+    LOOSE_VERSION_7_10,
+)
 
-from .object_type import Post, AlternativePost, PostForUser
+from .object_type import (
+    Post,
+    AlternativePost,
+    PostForUser,
+    SingleRoundTripPost,
+    CappedTotalHitsPost,
+    SearchAfterPost,
+    PointInTimePost,
+    CachedPost,
+    AsyncPost,
+    MultiSearchPost,
+    RawHitsPost,
+    RescorePost,
+)
 
 __all__ = (
     'ConnectionQueryMixin',
@@ -80,6 +99,59 @@ class ConnectionQueryMixin:
     )
     # Alternative Post behaviour
     alternative_post_documents = ElasticsearchConnectionField(AlternativePost)
+    # Total number of hits is taken from the search response (no separate
+    # count request is made)
+    single_round_trip_post_documents = ElasticsearchConnectionField(
+        SingleRoundTripPost,
+        single_round_trip=True
+    )
+
+    # Integer cap requires Elasticsearch 7.0 or later
+    capped_total_hits_post_documents = ElasticsearchConnectionField(
+        CappedTotalHitsPost,
+        track_total_hits=(
+            10 if LOOSE_ELASTICSEARCH_VERSION >= LOOSE_VERSION_7_0 else True
+        )
+    )
+
+    search_after_post_documents = ElasticsearchConnectionField(
+        SearchAfterPost,
+        pagination_mode="search_after"
+    )
+
+    # Point in time requires Elasticsearch 7.10 or later
+    point_in_time_post_documents = ElasticsearchConnectionField(
+        PointInTimePost,
+        pagination_mode="search_after",
+        point_in_time=LOOSE_ELASTICSEARCH_VERSION >= LOOSE_VERSION_7_10,
+        pit_keep_alive="30s"
+    )
+
+    cached_post_documents = ElasticsearchConnectionField(CachedPost)
+
+    # Requires an asynchronous executor (such as `AsyncioExecutor`). Blocking
+    # requests are made in the default executor of the event loop, unless
+    # the `client` (`AsyncElasticsearch`) is given.
+    async_post_documents = AsyncElasticsearchConnectionField(AsyncPost)
+
+    # Requests are made along with the ones of the other connection fields
+    # of the same GraphQL request (with a single `msearch` request), if the
+    # context is given.
+    multi_search_post_documents = ElasticsearchConnectionField(
+        MultiSearchPost,
+        multi_search=True
+    )
+
+    # Nodes are resolved from the raw hits of the response, instead of
+    # being materialized into documents.
+    raw_hits_post_documents = ElasticsearchConnectionField(
+        RawHitsPost,
+        raw_hits=True
+    )
+
+    # Top hits are reordered by the phrase proximity on the searched terms
+    # (unless sorted by fields)
+    rescore_post_documents = ElasticsearchConnectionField(RescorePost)
 
 
 class Query(
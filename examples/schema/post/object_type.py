@@ -1,4 +1,6 @@
+from anysearch.search_dsl.query import Q
 from graphene_elastic import ElasticsearchObjectType
+from graphene_elastic.cache import LocMemResultCache
 from graphene_elastic.filter_backends import (
     FacetedSearchFilterBackend,
     FilteringFilterBackend,
@@ -11,6 +13,7 @@ from graphene_elastic.filter_backends import (
     ScoreFilterBackend,
     SimpleQueryStringBackend,
     QueryStringBackend,
+    RescoreFilterBackend,
 )
 
 from search_index.documents import Post as PostDocument
@@ -22,6 +25,15 @@ __all__ = (
     "Post",
     "AlternativePost",
     "PostForUser",
+    "SingleRoundTripPost",
+    "CappedTotalHitsPost",
+    "SearchAfterPost",
+    "PointInTimePost",
+    "CachedPost",
+    "AsyncPost",
+    "MultiSearchPost",
+    "RawHitsPost",
+    "RescorePost",
 )
 
 
@@ -53,3 +65,86 @@ class PostForUser(ElasticsearchObjectType):
 
     class Meta(AbstractPostDocumentMeta):
         pass
+
+
+class SingleRoundTripPost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        pass
+
+
+class CappedTotalHitsPost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        pass
+
+
+class SearchAfterPost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        pass
+
+
+class PointInTimePost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        pass
+
+
+class CachedPost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        # Search results are kept for 5 seconds
+        result_cache = LocMemResultCache(max_entries=100, timeout=5)
+
+
+class AsyncPost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        pass
+
+
+class MultiSearchPost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        pass
+
+
+class RawHitsPost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        pass
+
+
+def get_rescore_query(backend):
+    """Phrase proximity on the searched terms."""
+    query = dict(backend.args).get("search", {}).get("query")
+    if query:
+        return Q("match_phrase", title={"query": query, "slop": 2})
+
+
+class RescorePost(ElasticsearchObjectType):
+
+    class Meta(AbstractPostDocumentMeta):
+        # `DefaultOrderingFilterBackend` is left out on purpose. Hits sorted
+        # by fields are never rescored.
+        filter_backends = [
+            FilteringFilterBackend,
+            PostFilterFilteringBackend,
+            SearchFilterBackend,
+            HighlightFilterBackend,
+            SourceFilterBackend,
+            FacetedSearchFilterBackend,
+            ScoreFilterBackend,
+            OrderingFilterBackend,
+            # After the ordering backends
+            RescoreFilterBackend,
+        ]
+
+        # For `RescoreFilterBackend` backend
+        rescore_options = {
+            "window_size": 50,
+            "rescore_query": get_rescore_query,
+            "query_weight": 0.7,
+            "rescore_query_weight": 10,
+        }
@@ -51,6 +51,9 @@ setup(
             "opensearch-py",
             "opensearch-dsl",
         ],
+        "orjson": [
+            "orjson",
+        ],
     },
     python_requires=">=3.6",
     zip_safe=True,
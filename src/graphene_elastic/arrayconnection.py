@@ -1,26 +1,260 @@
+import json
+
 from graphql_relay.connection.arrayconnection import (
     get_offset_with_default,
     offset_to_cursor,
 )
+from graphql_relay.utils import base64, unbase64
+from anysearch.search_dsl import connections
 from graphql_relay.connection.connectiontypes import (
     # Connection,
     PageInfo,
     Edge,
 )
 
+from .cache import count_search, execute_search
+from .hits import get_raw_hits
 from .relay.connectiontypes import Connection
 
-from .logging import logger
+from .logging import logger, trace_query
 
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
     'connection_from_list_slice',
+    'connection_from_search_after',
+    'cursor_to_pit_id',
+    'cursor_to_sort_values',
+    'get_total_hits',
+    'iter_connection_from_list_slice',
+    'iter_connection_from_search_after',
+    'resolve_requests',
+    'sort_values_to_cursor',
 )
 
+SEARCH_AFTER_PREFIX = 'searchafter:'
+
+
+def get_total_hits(response):
+    """Get total hits from the search response.
+
+    Reads the raw response body, so that hits are not materialized into
+    documents just to get the total. Elasticsearch 6.x returns the total
+    as an integer, while Elasticsearch 7.x (and OpenSearch) return a
+    dictionary with `value` and `relation` keys.
+
+    If total hits tracking was disabled for the search (`track_total_hits`
+    set to False), there's no total in the response and `(None, None)` is
+    returned.
+
+    :param response: Search response.
+    :type response: elasticsearch_dsl.response.Response
+    :return: Tuple of total hits and relation (`eq` or `gte`).
+    :rtype: tuple
+    """
+    total = response._d_.get('hits', {}).get('total')
+    if total is None:
+        return None, None
+    if isinstance(total, dict):
+        return total.get('value', 0), total.get('relation', 'eq')
+    return total, 'eq'
+
+
+def alter_connection(connection, response, connection_field):
+    """Let the filter backends alter the connection.
+
+    :param connection: Connection.
+    :param response: Search response.
+    :param connection_field: Connection field.
+    :return:
+    """
+    # This is certainly something to consider to change. Although there are
+    # some original `graphene` code parts that do alter the connection object
+    # directly, in principle, we shouldn't apply anything in this way, but
+    # rather include all the things by overriding appropriate parts,
+    # especially the connection class. However, at the moment of writing,
+    # due to, perhaps, too little investigation on how to do it properly with
+    # `graphene`, this seems to be the most simple and appropriate solution.
+    for backend_cls in connection_field.filter_backends:
+        if backend_cls.has_connection_fields:
+            backend = backend_cls(connection_field)
+            backend.alter_connection(connection, response)
+
+
+def sort_values_to_cursor(sort_values, pit_id=None):
+    """Create a cursor from the sort values of a hit.
+
+    :param sort_values: Sort values of the hit (`hit.meta.sort`).
+    :type sort_values: list
+    :param pit_id: Point in time id, if search is made against a point in
+        time.
+    :type pit_id: str
+    :return: Cursor.
+    :rtype: str
+    """
+    payload = list(sort_values)
+    if pit_id:
+        payload = {'search_after': payload, 'pit_id': pit_id}
+    return base64(SEARCH_AFTER_PREFIX + json.dumps(payload))
+
+
+def load_cursor(cursor):
+    """Load the payload of the cursor created with `sort_values_to_cursor`.
+
+    :param cursor: Cursor.
+    :type cursor: str
+    :return: Dictionary with `search_after` and `pit_id` keys or None if
+        cursor is invalid.
+    :rtype: dict
+    """
+    try:
+        value = unbase64(cursor)
+    except Exception:
+        return None
+    if not value.startswith(SEARCH_AFTER_PREFIX):
+        return None
+    try:
+        payload = json.loads(value[len(SEARCH_AFTER_PREFIX):])
+    except ValueError:
+        return None
+    if isinstance(payload, list):
+        payload = {'search_after': payload}
+    if not isinstance(payload, dict) \
+            or not isinstance(payload.get('search_after'), list):
+        return None
+    return payload
+
 
-def connection_from_list_slice(
+def cursor_to_sort_values(cursor):
+    """Extract the sort values from the cursor.
+
+    :param cursor: Cursor created with `sort_values_to_cursor`.
+    :type cursor: str
+    :return: Sort values or None if cursor is invalid.
+    :rtype: list
+    """
+    payload = load_cursor(cursor)
+    return payload['search_after'] if payload else None
+
+
+def cursor_to_pit_id(cursor):
+    """Extract the point in time id from the cursor.
+
+    :param cursor: Cursor created with `sort_values_to_cursor`.
+    :type cursor: str
+    :return: Point in time id or None if cursor doesn't have one.
+    :rtype: str
+    """
+    payload = load_cursor(cursor)
+    return payload.get('pit_id') if payload else None
+
+
+def open_point_in_time(list_slice, keep_alive):
+    """Open a point in time for the indices of the search.
+
+    :param list_slice: Search.
+    :param keep_alive: Keep alive of the point in time (for example, "1m").
+    :return: Point in time id.
+    :rtype: str
+    """
+    client = connections.get_connection(list_slice._using)
+    response = client.open_point_in_time(
+        index=','.join(list_slice._index or ['_all']),
+        keep_alive=keep_alive
+    )
+    return response['id']
+
+
+def close_point_in_time(list_slice, pit_id):
+    """Close the point in time.
+
+    Points in time expire on their own after the keep alive, but closing
+    them as soon as they're not needed frees the resources early.
+
+    :param list_slice: Search.
+    :param pit_id: Point in time id.
+    :return:
+    """
+    client = connections.get_connection(list_slice._using)
+    try:
+        client.close_point_in_time(body={'id': pit_id})
+    except Exception as err:
+        logger.debug(err)
+
+
+# Requests yielded by the connection builders (see `resolve_requests`). Each
+# request is a tuple of the request type, the search and a param: the result
+# cache for counts and searches, the keep alive for opening and the point in
+# time id for closing a point in time.
+REQUEST_COUNT = 'count'
+REQUEST_SEARCH = 'search'
+REQUEST_OPEN_POINT_IN_TIME = 'open_point_in_time'
+REQUEST_CLOSE_POINT_IN_TIME = 'close_point_in_time'
+
+REQUEST_HANDLERS = {
+    REQUEST_COUNT: count_search,
+    REQUEST_SEARCH: execute_search,
+    REQUEST_OPEN_POINT_IN_TIME: open_point_in_time,
+    REQUEST_CLOSE_POINT_IN_TIME: close_point_in_time,
+}
+
+
+def resolve_requests(requests):
+    """Make the requests yielded by the connection builder.
+
+    Connection builders (such as `iter_connection_from_list_slice`) are
+    generators, which yield the requests to be made to Elasticsearch and
+    receive their results back. This way, the very same builder can be
+    used with the blocking client (this function) and the asynchronous one
+    (see `graphene_elastic.async_fields.resolve_requests_async`).
+
+    :param requests: Generator yielding requests.
+    :return: The value returned by the generator (the connection).
+    """
+    result = None
+    try:
+        while True:
+            request, search, param = requests.send(result)
+            result = REQUEST_HANDLERS[request](search, param)
+    except StopIteration as stop:
+        return stop.value
+
+
+def get_sort_field_name(sort_item):
+    """Get field name of the sort item.
+
+    :param sort_item: Item of the `Search._sort`. Either a string
+        (optionally prefixed with `-`) or a dictionary.
+    :return: Field name.
+    :rtype: str
+    """
+    if isinstance(sort_item, dict):
+        return list(sort_item.keys())[0]
+    return sort_item.lstrip('-')
+
+
+def get_search_after_sort(list_slice, tiebreaker):
+    """Get sort to be used with `search_after`.
+
+    The sort produced by the ordering filter backends is kept as is. If
+    there's no sort, hits are sorted by relevance. The tiebreaker is
+    appended if not present, so that the sort values of each hit are unique.
+
+    :param list_slice: Search.
+    :param tiebreaker: Name of the field with unique values.
+    :return: List of sort items.
+    :rtype: list
+    """
+    sort = list(list_slice._sort) or [{'_score': {'order': 'desc'}}]
+    if tiebreaker and tiebreaker not in [
+        get_sort_field_name(_item) for _item in sort
+    ]:
+        sort.append({tiebreaker: {'order': 'asc'}})
+    return sort
+
+
+def iter_connection_from_list_slice(
         list_slice,
         args=None,
         connection_type=None,
@@ -29,7 +263,10 @@ def connection_from_list_slice(
         slice_start=0,
         list_length=0,
         list_slice_length=None,
-        connection_field=None):
+        connection_field=None,
+        track_total_hits=True,
+        fetch_hits=True,
+        raw_hits=False):
     """
     Given a slice (subset) of an array, returns a connection object for use in
     GraphQL.
@@ -37,10 +274,34 @@ def connection_from_list_slice(
     cases where you know the cardinality of the connection, consider it too
     large to materialize the entire array, and instead wish pass in a slice of
     the total result large enough to cover the range specified in `args`.
+
+    If `list_length` is None, the cardinality of the connection is taken from
+    the `hits.total` of the very search that fetches the requested page (the
+    search is executed with `track_total_hits`), so that no separate count
+    request is made. If the requested window can't be determined without
+    knowing the total upfront (for instance, `last` without `before`), we
+    fall back to counting first.
+
+    The `track_total_hits` is passed to the search as is. If it's not True
+    (that is, the total is capped at a given number of hits or not tracked
+    at all), `hasNextPage` is determined by fetching one extra hit and the
+    `total_count_exact` of the connection tells whether the `total_count`
+    is exact or a lower bound.
+
+    If `fetch_hits` is False, no hits are fetched (the connection has no
+    edges). The search is then skipped altogether if the total is already
+    known and there are no aggregations.
+
+    If `raw_hits` is True, nodes are `graphene_elastic.hits.RawHit`
+    wrappers around the raw hits of the response instead of documents.
+
+    This is a generator yielding the requests to be made (see
+    `resolve_requests`) and returning the connection.
     """
     connection_type = connection_type or Connection
     edge_type = edge_type or Edge
     pageinfo_type = pageinfo_type or PageInfo
+    result_cache = getattr(connection_field, 'result_cache', None)
 
     args = args or {}
 
@@ -76,10 +337,6 @@ def connection_from_list_slice(
         else:
             first = max_limit
 
-    if list_slice_length is None:
-        list_slice_length = len(list_slice)
-    slice_end = slice_start + list_slice_length
-    before_offset = get_offset_with_default(before, list_length)
     after_offset = get_offset_with_default(after, -1)
 
     start_offset = max(
@@ -87,66 +344,295 @@ def connection_from_list_slice(
         after_offset,
         -1
     ) + 1
-    end_offset = min(
-        slice_end,
-        before_offset,
-        list_length
-    )
-    if isinstance(first, int):
+
+    single_round_trip = list_length is None
+    if single_round_trip:
+        before_offset = get_offset_with_default(before, None)
+        end_offset = before_offset
+        if isinstance(first, int):
+            end_offset = start_offset + first if end_offset is None \
+                else min(end_offset, start_offset + first)
+        # Neither `first` nor `before` given, or `last` is given without
+        # `before`. We need to know the total upfront.
+        if end_offset is None or (isinstance(last, int) and before is None):
+            single_round_trip = False
+            list_length = yield REQUEST_COUNT, list_slice, result_cache
+            list_slice_length = list_length
+
+    if not single_round_trip:
+        if list_slice_length is None:
+            list_slice_length = len(list_slice)
+        slice_end = slice_start + list_slice_length
+        before_offset = get_offset_with_default(before, list_length)
         end_offset = min(
-            end_offset,
-            start_offset + first
+            slice_end,
+            before_offset,
+            list_length
         )
+        if isinstance(first, int):
+            end_offset = min(
+                end_offset,
+                start_offset + first
+            )
     if isinstance(last, int):
         start_offset = max(
             start_offset,
             end_offset - last
         )
 
-    # If supplied slice is too large, trim it down before mapping over it.
-    _slice_qs = list_slice[
-        max(start_offset - slice_start, 0):
-        list_slice_length - (slice_end - end_offset)
-    ]
-    logger.debug_json(_slice_qs.to_dict())
+    # If the total is not exact, we can't rely on it to tell whether there
+    # are more hits. Fetch one extra hit instead (unless we are bound by
+    # `before`).
+    over_fetch = (
+        single_round_trip
+        and track_total_hits is not True
+        and (before is None or end_offset < before_offset)
+    )
 
-    _slice = _slice_qs.execute()
+    if single_round_trip:
+        _slice_qs = list_slice.extra(track_total_hits=track_total_hits)[
+            max(start_offset - slice_start, 0):
+            max(end_offset - slice_start, 0) + (1 if over_fetch else 0)
+        ]
+    else:
+        # If supplied slice is too large, trim it down before mapping over it.
+        _slice_qs = list_slice[
+            max(start_offset - slice_start, 0):
+            list_slice_length - (slice_end - end_offset)
+        ]
+    if not fetch_hits:
+        _slice_qs = _slice_qs.extra(size=0)
+
+    if fetch_hits or single_round_trip or _slice_qs.aggs._params.get('aggs'):
+        trace_query(_slice_qs)
+        _slice = yield REQUEST_SEARCH, _slice_qs, result_cache
+        nodes = get_raw_hits(_slice) if raw_hits else list(_slice)
+    else:
+        _slice = None
+        nodes = []
+
+    total_count_exact = True
+    has_more = False
+    if single_round_trip:
+        list_length, relation = get_total_hits(_slice)
+        total_count_exact = relation == 'eq'
+        if track_total_hits is not True:
+            has_more = len(nodes) > end_offset - start_offset
+            nodes = nodes[:end_offset - start_offset]
+            end_offset = start_offset + len(nodes)
+        else:
+            end_offset = min(end_offset, list_length)
 
     edges = [
         edge_type(
             node=node,
             cursor=offset_to_cursor(start_offset + i)
         )
-        for i, node in enumerate(_slice)
+        for i, node in enumerate(nodes)
     ]
 
     first_edge_cursor = edges[0].cursor if edges else None
     last_edge_cursor = edges[-1].cursor if edges else None
     lower_bound = after_offset + 1 if after else 0
     upper_bound = before_offset if before else list_length
+    if single_round_trip and track_total_hits is not True:
+        has_next_page = isinstance(first, int) and has_more
+    else:
+        has_next_page = isinstance(first, int) and end_offset < upper_bound
 
     conn = connection_type(
         edges=edges,
+        total_count=list_length,
+        total_count_exact=total_count_exact,
         page_info=pageinfo_type(
             start_cursor=first_edge_cursor,
             end_cursor=last_edge_cursor,
             has_previous_page=(
                 isinstance(last, int) and start_offset > lower_bound
             ),
-            has_next_page=isinstance(first, int) and end_offset < upper_bound
+            has_next_page=has_next_page
         ),
     )
 
-    # This is certainly something to consider to change. Although there are
-    # some original `graphene` code parts that do alter the connection object
-    # directly, in principle, we shouldn't apply anything in this way, but
-    # rather include all the things by overriding appropriate parts,
-    # especially the connection class. However, at the moment of writing,
-    # due to, perhaps, too little investigation on how to do it properly with
-    # `graphene`, this seems to be the most simple and appropriate solution.
-    for backend_cls in connection_field.filter_backends:
-        if backend_cls.has_connection_fields:
-            backend = backend_cls(connection_field)
-            backend.alter_connection(conn, _slice)
+    if _slice is not None:
+        alter_connection(conn, _slice, connection_field)
+
+    conn.list_length = list_length
+    return conn
+
+
+def connection_from_list_slice(*args, **kwargs):
+    """Connection from list slice.
+
+    Blocking version of `iter_connection_from_list_slice` (takes the same
+    arguments).
+    """
+    return resolve_requests(iter_connection_from_list_slice(*args, **kwargs))
+
+
+def iter_connection_from_search_after(
+        list_slice,
+        args=None,
+        connection_type=None,
+        edge_type=None,
+        pageinfo_type=None,
+        connection_field=None,
+        track_total_hits=True,
+        tiebreaker='_id',
+        point_in_time=False,
+        pit_keep_alive='1m',
+        fetch_hits=True,
+        raw_hits=False):
+    """
+    Returns a connection object for use in GraphQL, using `search_after`
+    (keyset) pagination.
+
+    Cursors encode the sort values of the hits. Next page is fetched by
+    passing the sort values of the `after` cursor as `search_after`, so
+    the cost of the search doesn't depend on the depth of the page and
+    deep pages are not limited by the `max_result_window`. Only forward
+    pagination (`first` and `after`) is supported. `hasNextPage` is
+    determined by fetching one extra hit.
+
+    If `point_in_time` is True, a point in time is opened on the first page
+    and its id is carried inside the cursors, so that all pages are fetched
+    from the same snapshot of the index. The point in time is kept alive for
+    `pit_keep_alive` between pages. Hits are then sorted by the implicit
+    `_shard_doc` tiebreaker, instead of the given one.
+
+    If `fetch_hits` is False, no hits are fetched (the connection has no
+    edges), unless a point in time is used (its lifecycle is driven by the
+    pages fetched).
+
+    If `raw_hits` is True, nodes are `graphene_elastic.hits.RawHit`
+    wrappers around the raw hits of the response instead of documents.
+
+    This is a generator yielding the requests to be made (see
+    `resolve_requests`) and returning the connection.
+    """
+    connection_type = connection_type or Connection
+    edge_type = edge_type or Edge
+    pageinfo_type = pageinfo_type or PageInfo
+    result_cache = getattr(connection_field, 'result_cache', None)
+
+    args = args or {}
+
+    after = args.get('after')
+    first = args.get('first')
+
+    assert args.get('last') is None and args.get('before') is None, (
+        "Only `first` and `after` can be used to paginate the `{}` "
+        "connection."
+    ).format(connection_type)
+
+    enforce_first_or_last = args.get("enforce_first_or_last")
+    max_limit = args.get("max_limit")
+
+    if enforce_first_or_last:
+        assert first, (
+            "You must provide a `first` value to properly "
+            "paginate the `{}` connection."
+        ).format(connection_type)
+
+    if max_limit:
+        if first:
+            assert first <= max_limit, (
+                "Requesting {} records on the `{}` connection exceeds "
+                "the `first` limit of {} records."
+            ).format(first, connection_type, max_limit)
+            first = args["first"] = min(first, max_limit)
+        else:
+            first = max_limit
+
+    pit_id = None
+    if point_in_time:
+        # Searches against a point in time are implicitly sorted by
+        # `_shard_doc`, which is cheaper than any other tiebreaker.
+        tiebreaker = None
+        # Each point in time is a snapshot of its own, nothing to cache.
+        result_cache = None
+        pit_id = cursor_to_pit_id(after) if after else None
+        if not pit_id:
+            pit_id = yield (
+                REQUEST_OPEN_POINT_IN_TIME,
+                list_slice,
+                pit_keep_alive
+            )
+
+    _slice_qs = list_slice.sort(
+        *get_search_after_sort(list_slice, tiebreaker)
+    ).extra(track_total_hits=track_total_hits)
+
+    if pit_id:
+        # Index must not be given when searching against a point in time
+        _slice_qs = _slice_qs.index().extra(
+            pit={'id': pit_id, 'keep_alive': pit_keep_alive}
+        )
+
+    if after:
+        search_after = cursor_to_sort_values(after)
+        assert search_after is not None, (
+            "Invalid `after` cursor given for the `{}` connection."
+        ).format(connection_type)
+        _slice_qs = _slice_qs.extra(search_after=search_after)
+
+    # Fetch one extra hit to find out whether there's a next page
+    _slice_qs = _slice_qs[0:first + 1] if first is not None else _slice_qs
+    if not fetch_hits and not point_in_time:
+        _slice_qs = _slice_qs.extra(size=0)
+    trace_query(_slice_qs)
+
+    _slice = yield REQUEST_SEARCH, _slice_qs, result_cache
+
+    nodes = get_raw_hits(_slice) if raw_hits else list(_slice)
+    has_next_page = first is not None and len(nodes) > first
+    if first is not None:
+        nodes = nodes[:first]
+
+    if pit_id:
+        # The point in time id might change between searches
+        pit_id = _slice._d_.get('pit_id', pit_id)
+        if not has_next_page:
+            yield REQUEST_CLOSE_POINT_IN_TIME, list_slice, pit_id
+            pit_id = None
 
+    edges = [
+        edge_type(
+            node=node,
+            cursor=sort_values_to_cursor(
+                node.hit.get('sort') if raw_hits else node.meta.sort,
+                pit_id=pit_id
+            )
+        )
+        for node in nodes
+    ]
+
+    list_length, relation = get_total_hits(_slice)
+
+    conn = connection_type(
+        edges=edges,
+        total_count=list_length,
+        total_count_exact=relation == 'eq',
+        page_info=pageinfo_type(
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_previous_page=False,
+            has_next_page=has_next_page
+        ),
+    )
+
+    alter_connection(conn, _slice, connection_field)
+
+    conn.list_length = list_length
     return conn
+
+
+def connection_from_search_after(*args, **kwargs):
+    """Connection from search after.
+
+    Blocking version of `iter_connection_from_search_after` (takes the same
+    arguments).
+    """
+    return resolve_requests(
+        iter_connection_from_search_after(*args, **kwargs)
+    )
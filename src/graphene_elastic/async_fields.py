@@ -0,0 +1,241 @@
+"""
+Asynchronous connection field.
+
+To be used with an asynchronous executor (such as
+``graphql.execution.executors.asyncio.AsyncioExecutor``), so that
+searches of concurrent requests (and of the connection fields of the same
+request) do not block the event loop:
+
+.. code-block:: python
+
+    from elasticsearch import AsyncElasticsearch
+    from graphene_elastic.async_fields import (
+        AsyncElasticsearchConnectionField,
+    )
+
+    client = AsyncElasticsearch(["localhost:9200"])
+
+    class Query(graphene.ObjectType):
+
+        all_post_documents = AsyncElasticsearchConnectionField(
+            Post,
+            client=client
+        )
+"""
+import asyncio
+from functools import partial
+from inspect import isawaitable
+
+from .arrayconnection import (
+    REQUEST_CLOSE_POINT_IN_TIME,
+    REQUEST_COUNT,
+    REQUEST_HANDLERS,
+    REQUEST_OPEN_POINT_IN_TIME,
+    REQUEST_SEARCH,
+)
+from .fields import ElasticsearchConnectionField
+from .logging import logger
+
+__title__ = "graphene_elastic.async_fields"
+__author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
+__copyright__ = "2019-2022 Artur Barseghyan"
+__license__ = "GPL-2.0-only OR LGPL-2.1-or-later"
+__all__ = (
+    "AsyncElasticsearchConnectionField",
+    "count_search_async",
+    "execute_search_async",
+    "resolve_requests_async",
+)
+
+
+async def count_search_async(client, search, cache=None):
+    """Count the hits of the search, using the result cache if given.
+
+    :param client: Asynchronous Elasticsearch client.
+    :param search: Search.
+    :param cache: Result cache.
+    :type client: elasticsearch.AsyncElasticsearch
+    :type search: elasticsearch_dsl.search.Search
+    :type cache: graphene_elastic.cache.BaseResultCache
+    :return: Number of hits.
+    :rtype: int
+    """
+    key = None
+    if cache is not None:
+        key = cache.make_key(search, count=True)
+        count = cache.get(key)
+        if count is not None:
+            return count
+
+    response = await client.count(
+        index=search._index,
+        body=search.to_dict(count=True),
+        **search._params
+    )
+    count = response["count"]
+
+    if cache is not None:
+        cache.set(key, count)
+    return count
+
+
+async def execute_search_async(client, search, cache=None):
+    """Execute the search, using the result cache if given.
+
+    :param client: Asynchronous Elasticsearch client.
+    :param search: Search.
+    :param cache: Result cache.
+    :type client: elasticsearch.AsyncElasticsearch
+    :type search: elasticsearch_dsl.search.Search
+    :type cache: graphene_elastic.cache.BaseResultCache
+    :return: Search response.
+    :rtype: elasticsearch_dsl.response.Response
+    """
+    key = None
+    raw = None
+    if cache is not None:
+        key = cache.make_key(search)
+        raw = cache.get(key)
+
+    if raw is None:
+        raw = await client.search(
+            index=search._index,
+            body=search.to_dict(),
+            **search._params
+        )
+        # Newer clients wrap the response body
+        raw = getattr(raw, "body", raw)
+        if cache is not None:
+            cache.set(key, raw)
+
+    search._response = search._response_class(search, raw)
+    return search._response
+
+
+async def open_point_in_time_async(client, search, keep_alive):
+    """Open a point in time for the indices of the search.
+
+    :param client: Asynchronous Elasticsearch client.
+    :param search: Search.
+    :param keep_alive: Keep alive of the point in time (for example, "1m").
+    :return: Point in time id.
+    :rtype: str
+    """
+    response = await client.open_point_in_time(
+        index=",".join(search._index or ["_all"]),
+        keep_alive=keep_alive
+    )
+    return response["id"]
+
+
+async def close_point_in_time_async(client, search, pit_id):
+    """Close the point in time.
+
+    :param client: Asynchronous Elasticsearch client.
+    :param search: Search.
+    :param pit_id: Point in time id.
+    :return:
+    """
+    try:
+        await client.close_point_in_time(body={"id": pit_id})
+    except Exception as err:
+        logger.debug(err)
+
+
+ASYNC_REQUEST_HANDLERS = {
+    REQUEST_COUNT: count_search_async,
+    REQUEST_SEARCH: execute_search_async,
+    REQUEST_OPEN_POINT_IN_TIME: open_point_in_time_async,
+    REQUEST_CLOSE_POINT_IN_TIME: close_point_in_time_async,
+}
+
+
+async def resolve_requests_async(requests, client=None):
+    """Make the requests yielded by the connection builder.
+
+    Asynchronous version of the
+    `graphene_elastic.arrayconnection.resolve_requests`.
+
+    :param requests: Generator yielding requests.
+    :param client: Asynchronous Elasticsearch client. If not given, the
+        blocking requests are made in the default executor of the event
+        loop.
+    :type client: elasticsearch.AsyncElasticsearch
+    :return: The value returned by the generator (the connection).
+    """
+    loop = asyncio.get_event_loop()
+    result = None
+    try:
+        while True:
+            request, search, param = requests.send(result)
+            if client is not None:
+                result = await ASYNC_REQUEST_HANDLERS[request](
+                    client,
+                    search,
+                    param
+                )
+            else:
+                result = await loop.run_in_executor(
+                    None,
+                    partial(REQUEST_HANDLERS[request], search, param)
+                )
+    except StopIteration as stop:
+        return stop.value
+
+
+class AsyncElasticsearchConnectionField(ElasticsearchConnectionField):
+    """Asynchronous connection field.
+
+    Runs the same filter backends as the `ElasticsearchConnectionField`,
+    but the resolver returns a coroutine awaiting the Elasticsearch
+    requests.
+    """
+
+    def __init__(self, type, *args, **kwargs):
+        # Asynchronous Elasticsearch client
+        # (`elasticsearch.AsyncElasticsearch`). If not given, the blocking
+        # requests are made in the default executor of the event loop.
+        self.client = kwargs.pop("client", None)
+        # Requests are not batched into `msearch` requests (the
+        # `RELAY_CONNECTION_MULTI_SEARCH` setting is ignored)
+        assert not kwargs.get("multi_search"), \
+            "Attribute `multi_search` is not supported by {}.".format(
+                self.__class__.__name__
+            )
+        kwargs["multi_search"] = False
+        super(AsyncElasticsearchConnectionField, self).__init__(
+            type, *args, **kwargs
+        )
+
+    def default_resolver(self, _root, info, **args):
+        return resolve_requests_async(
+            self.iter_connection(info, **args),
+            client=self.client
+        )
+
+    @classmethod
+    async def connection_resolver(cls,
+                                  resolver,
+                                  connection_type,
+                                  root,
+                                  info,
+                                  connection_field=None,
+                                  **args):
+        # Validate (and clamp) the pagination arguments before making any
+        # request
+        args = cls.validate_connection_args(info, args)
+        resolved = resolver(root, info, **args)
+        if isawaitable(resolved):
+            resolved = await resolved
+
+        return super(
+            AsyncElasticsearchConnectionField,
+            cls
+        ).connection_resolver(
+            lambda *_args, **_kwargs: resolved,
+            connection_type,
+            root,
+            info,
+            connection_field=connection_field,
+            **args
+        )
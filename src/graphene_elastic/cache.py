@@ -0,0 +1,215 @@
+"""
+Search result cache.
+
+Results of the searches (and counts) made by the connection fields can be
+cached per ``ElasticsearchObjectType``:
+
+.. code-block:: python
+
+    from graphene_elastic.cache import LocMemResultCache
+
+    class Post(ElasticsearchObjectType):
+
+        class Meta:
+
+            document = PostDocument
+            interfaces = (Node,)
+            result_cache = LocMemResultCache(max_entries=1000, timeout=5)
+
+The cache key is made of the index, the search params and the body of the
+search, which is serialized after all the filter backends have been
+applied (thus including the pagination window). The cached value is the
+raw search response (hits, total and aggregations).
+"""
+import hashlib
+import json
+import pickle
+import threading
+import time
+from collections import OrderedDict
+
+__title__ = 'graphene_elastic.cache'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2019-2022 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'BaseResultCache',
+    'count_search',
+    'execute_search',
+    'LocMemResultCache',
+)
+
+
+class BaseResultCache(object):
+    """Base result cache.
+
+    Subclasses shall implement `get` and `set` (for instance, on top of
+    Redis or Memcached). Values are plain (JSON serializable) dicts and
+    integers.
+    """
+
+    # Prefix of the cache keys
+    key_prefix = 'graphene_elastic'
+
+    def __init__(self, timeout=None, key_prefix=None):
+        """Constructor.
+
+        :param timeout: Number of seconds the results are kept for. If set
+            to None, results do not expire.
+        :param key_prefix: Prefix of the cache keys.
+        """
+        self.timeout = timeout
+        if key_prefix is not None:
+            self.key_prefix = key_prefix
+
+    def make_key(self, search, count=False):
+        """Make cache key for the search given.
+
+        :param search: Search.
+        :param count: If set to True, key is made for the count request.
+        :type search: elasticsearch_dsl.search.Search
+        :type count: bool
+        :return: Cache key.
+        :rtype: str
+        """
+        data = json.dumps(
+            {
+                'index': search._index,
+                'using': search._using
+                if isinstance(search._using, str) else None,
+                'params': search._params,
+                'body': search.to_dict(count=count),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return '{}:{}:{}'.format(
+            self.key_prefix,
+            'count' if count else 'search',
+            hashlib.sha1(data.encode('utf8')).hexdigest()
+        )
+
+    def get(self, key):
+        """Get value from the cache.
+
+        :param key:
+        :return: Cached value or None if not found (or expired).
+        """
+        raise NotImplementedError(
+            "You should define a `get` method in your {} class".format(
+                self.__class__.__name__
+            )
+        )
+
+    def set(self, key, value):
+        """Set value in the cache.
+
+        :param key:
+        :param value:
+        :return:
+        """
+        raise NotImplementedError(
+            "You should define a `set` method in your {} class".format(
+                self.__class__.__name__
+            )
+        )
+
+    def clear(self):
+        """Clear the cache."""
+
+
+class LocMemResultCache(BaseResultCache):
+    """In-process result cache.
+
+    Least recently used entries are evicted once the number of entries
+    exceeds `max_entries`. Values are stored pickled, so that the cached
+    results can not be modified by the callers.
+    """
+
+    def __init__(self, max_entries=1000, timeout=5, key_prefix=None):
+        """Constructor.
+
+        :param max_entries: Max number of entries.
+        :param timeout: Number of seconds the results are kept for.
+        :param key_prefix: Prefix of the cache keys.
+        """
+        super(LocMemResultCache, self).__init__(
+            timeout=timeout,
+            key_prefix=key_prefix
+        )
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires, pickled = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+        return pickle.loads(pickled)
+
+    def set(self, key, value):
+        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        expires = time.monotonic() + self.timeout \
+            if self.timeout is not None else None
+        with self._lock:
+            self._cache[key] = (expires, pickled)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+
+def execute_search(search, cache=None):
+    """Execute the search, using the result cache if given.
+
+    :param search: Search.
+    :param cache: Result cache.
+    :type search: elasticsearch_dsl.search.Search
+    :type cache: graphene_elastic.cache.BaseResultCache
+    :return: Search response.
+    :rtype: elasticsearch_dsl.response.Response
+    """
+    if cache is None:
+        return search.execute()
+
+    key = cache.make_key(search)
+    raw = cache.get(key)
+    if raw is not None:
+        search._response = search._response_class(search, raw)
+        return search._response
+
+    response = search.execute()
+    cache.set(key, response.to_dict())
+    return response
+
+
+def count_search(search, cache=None):
+    """Count the hits of the search, using the result cache if given.
+
+    :param search: Search.
+    :param cache: Result cache.
+    :type search: elasticsearch_dsl.search.Search
+    :type cache: graphene_elastic.cache.BaseResultCache
+    :return: Number of hits.
+    :rtype: int
+    """
+    if cache is None:
+        return search.count()
+
+    key = cache.make_key(search, count=True)
+    count = cache.get(key)
+    if count is not None:
+        return count
+
+    count = search.count()
+    cache.set(key, count)
+    return count
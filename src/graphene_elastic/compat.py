@@ -1,3 +1,56 @@
+"""
+Compatibility module.
+
+JSON is encoded/decoded with ``orjson``, if installed (``pip install
+graphene-elastic[orjson]``), falling back to the standard ``json`` module.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2019-2022 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'json_dumps',
+    'json_loads',
+    'orjson',
+)
+
+
+def json_dumps(value, default=None):
+    """Serialize value to JSON string.
+
+    :param value: Value to serialize.
+    :param default: Function returning serializable version of the objects
+        which can't be serialized otherwise.
+    :return: JSON string.
+    :rtype: str
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=default,
+            option=orjson.OPT_NON_STR_KEYS
+        ).decode('utf8')
+    return json.dumps(value, default=default)
+
+
+def json_loads(value):
+    """Deserialize JSON string.
+
+    :param value: JSON string.
+    :type value: str
+    :return: Deserialized value.
+    """
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
 # """
 # Transitional compatibility module. Contains various field wrappers and
 # helpers for painless (testing of) Elastic 6.x to Elastic 7.x transition. This
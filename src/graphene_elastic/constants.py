@@ -20,6 +20,9 @@ __all__ = (
     "EXTENDED_STRING_LOOKUP_FILTERS",
     "FALSE_VALUES",
     "FIELD",
+    "FILTER_CONTEXTS",
+    "FILTER_CONTEXT_FILTER",
+    "FILTER_CONTEXT_QUERY",
     "FRAGMENT_SIZE",
     "FUNCTIONAL_SUGGESTER_COMPLETION_MATCH",
     "FUNCTIONAL_SUGGESTER_COMPLETION_PREFIX",
@@ -55,6 +58,9 @@ __all__ = (
     "MATCHING_OPTION_SHOULD",
     "MATCHING_OPTIONS",
     "NUMBER_LOOKUP_FILTERS",
+    "PAGINATION_MODES",
+    "PAGINATION_MODE_OFFSET",
+    "PAGINATION_MODE_SEARCH_AFTER",
     "SEARCH_QUERY_PARAM",
     "SEPARATOR_LOOKUP_COMPLEX_MULTIPLE_VALUE",
     "SEPARATOR_LOOKUP_COMPLEX_VALUE",
@@ -530,3 +536,26 @@ MATCHING_OPTION_MUST = "must"
 MATCHING_OPTION_SHOULD = "should"
 MATCHING_OPTIONS = (MATCHING_OPTION_MUST, MATCHING_OPTION_SHOULD)
 DEFAULT_MATCHING_OPTION = MATCHING_OPTION_SHOULD
+
+# Filter lookups are applied in the (non-scoring, cacheable) filter context
+FILTER_CONTEXT_FILTER = "filter"
+
+# Functional filter lookups are applied in the (scoring) query context
+FILTER_CONTEXT_QUERY = "query"
+
+FILTER_CONTEXTS = (FILTER_CONTEXT_FILTER, FILTER_CONTEXT_QUERY)
+
+# ****************************************************************************
+# ******************************** Pagination ********************************
+# ****************************************************************************
+
+# Cursors encode the offset of the hit (`from`/`size` pagination)
+PAGINATION_MODE_OFFSET = "offset"
+
+# Cursors encode the sort values of the hit (`search_after` pagination)
+PAGINATION_MODE_SEARCH_AFTER = "search_after"
+
+PAGINATION_MODES = (
+    PAGINATION_MODE_OFFSET,
+    PAGINATION_MODE_SEARCH_AFTER,
+)
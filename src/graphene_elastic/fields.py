@@ -10,6 +10,7 @@ import graphene
 # from graphene import NonNull
 # from graphql_relay import connection_from_list
 from anysearch.search_dsl import InnerDoc, Search
+from anysearch.search_dsl.query import Q
 from promise import Promise
 from graphene.relay import ConnectionField, PageInfo
 from graphene.types.argument import to_arguments
@@ -21,7 +22,14 @@ from .advanced_types import (
     PointFieldType,
     MultiPolygonFieldType,
 )
-from .arrayconnection import connection_from_list_slice
+from .arrayconnection import (
+    REQUEST_COUNT,
+    connection_from_list_slice,
+    iter_connection_from_list_slice,
+    iter_connection_from_search_after,
+    resolve_requests,
+)
+from .constants import PAGINATION_MODES, PAGINATION_MODE_SEARCH_AFTER
 from .converter import (
     convert_elasticsearch_field,
     ElasticsearchConversionError,
@@ -32,11 +40,27 @@ from .converter import (
 #     OrderingFilterBackend,
 #     DefaultOrderingFilterBackend,
 # )
-from .logging import logger
+from .loaders import get_multi_search_loader, resolve_requests_batched
+from .logging import logger, trace_query
 from .registry import get_global_registry
+from .selections import (
+    CONNECTION_FIELDS,
+    get_field_names,
+    get_selected_fields,
+    get_source_fields,
+)
 from .settings import graphene_settings
 from .types import ElasticsearchObjectType
-from .utils import get_node_from_global_id  # get_model_reference_fields
+from .utils import (
+    freeze,
+    get_node_from_global_id,  # get_model_reference_fields
+    is_score_sort,
+)
+from .versions import (
+    LOOSE_ELASTICSEARCH_VERSION,
+    LOOSE_VERSION_7_0,
+    LOOSE_VERSION_7_10,
+)
 
 __title__ = "graphene_elastic.fields"
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
@@ -61,6 +85,102 @@ class ElasticsearchConnectionField(ConnectionField):
             "enforce_first_or_last",
             graphene_settings.RELAY_CONNECTION_ENFORCE_FIRST_OR_LAST,
         )  # From graphene-django
+        # If set to True, the total number of hits is taken from the search
+        # response (using `track_total_hits`) instead of making a separate
+        # count request.
+        self.single_round_trip = kwargs.pop(
+            "single_round_trip",
+            graphene_settings.RELAY_CONNECTION_SINGLE_ROUND_TRIP,
+        )
+        # Either True (exact total), an integer (total is counted up to the
+        # given number of hits) or False (total is not counted). Anything
+        # but True implies single round trip.
+        self.track_total_hits = kwargs.pop(
+            "track_total_hits",
+            graphene_settings.RELAY_CONNECTION_TRACK_TOTAL_HITS,
+        )
+        assert self.track_total_hits in (True, False) or isinstance(
+            self.track_total_hits, int
+        ), "Attribute `track_total_hits` on {} must be a boolean or " \
+           "an integer.".format(self)
+        # Elasticsearch 6.x only accepts a boolean
+        assert self.track_total_hits in (True, False) \
+            or LOOSE_ELASTICSEARCH_VERSION >= LOOSE_VERSION_7_0, \
+            "Attribute `track_total_hits` on {} must be a boolean " \
+            "(integer requires Elasticsearch 7.0 or later).".format(self)
+        # Either "offset" (`from`/`size`) or "search_after" (keyset)
+        # pagination.
+        self.pagination_mode = kwargs.pop(
+            "pagination_mode",
+            graphene_settings.RELAY_CONNECTION_PAGINATION_MODE,
+        )
+        assert self.pagination_mode in PAGINATION_MODES, \
+            "Attribute `pagination_mode` on {} must be one of {}.".format(
+                self, ", ".join(PAGINATION_MODES)
+            )
+        self.search_after_tiebreaker = kwargs.pop(
+            "search_after_tiebreaker",
+            graphene_settings.RELAY_CONNECTION_SEARCH_AFTER_TIEBREAKER,
+        )
+        # If set to True, all pages are fetched from the same point in time
+        # (snapshot) of the index.
+        self.point_in_time = kwargs.pop("point_in_time", False)
+        assert not self.point_in_time or \
+            self.pagination_mode == PAGINATION_MODE_SEARCH_AFTER, \
+            "Attribute `point_in_time` on {} requires `pagination_mode` " \
+            "to be {}.".format(self, PAGINATION_MODE_SEARCH_AFTER)
+        assert not self.point_in_time \
+            or LOOSE_ELASTICSEARCH_VERSION >= LOOSE_VERSION_7_10, \
+            "Attribute `point_in_time` on {} requires Elasticsearch 7.10 " \
+            "or later.".format(self)
+        self.pit_keep_alive = kwargs.pop(
+            "pit_keep_alive",
+            graphene_settings.RELAY_CONNECTION_PIT_KEEP_ALIVE,
+        )
+        # Sorting on `_id` loads its field data into the heap (and is
+        # deprecated as of Elasticsearch 7.6)
+        if (
+            self.pagination_mode == PAGINATION_MODE_SEARCH_AFTER
+            and not self.point_in_time
+            and self.search_after_tiebreaker == "_id"
+        ):
+            logger.warning(
+                "Connection field %s sorts on the `_id` tiebreaker, which "
+                "is expensive on large indices. Set `search_after_tiebreaker` "
+                "to a unique keyword field with doc values instead.",
+                self
+            )
+        # If set to True, the count and search requests are made along
+        # with the ones of the other connection fields (of the same GraphQL
+        # request) with a single `msearch` request. Requires a context.
+        self.multi_search = kwargs.pop(
+            "multi_search",
+            graphene_settings.RELAY_CONNECTION_MULTI_SEARCH,
+        )
+        # If set to True, only the document fields selected on the nodes
+        # are fetched (unless `_source` is set by the filter backends).
+        self.source_from_selection = kwargs.pop(
+            "source_from_selection",
+            graphene_settings.RELAY_CONNECTION_SOURCE_FROM_SELECTION,
+        )
+        # If set to True, aggregations, highlighting and hits are not
+        # requested unless `facets`, `highlight` and `edges` are selected.
+        self.skip_unselected = kwargs.pop(
+            "skip_unselected",
+            graphene_settings.RELAY_CONNECTION_SKIP_UNSELECTED,
+        )
+        # If set to True, nodes are resolved from the raw hits of the
+        # response (see `graphene_elastic.hits`) instead of documents.
+        self.raw_hits = kwargs.pop(
+            "raw_hits",
+            graphene_settings.RELAY_CONNECTION_RAW_HITS,
+        )
+        # If set to True, hits are not scored (the query is run in the
+        # filter context) if sorted by fields and `score` is not selected.
+        self.constant_score = kwargs.pop(
+            "constant_score",
+            graphene_settings.RELAY_CONNECTION_CONSTANT_SCORE,
+        )
         get_queryset = kwargs.pop("get_queryset", None)
         if get_queryset:
             assert callable(
@@ -116,10 +236,14 @@ class ElasticsearchConnectionField(ConnectionField):
 
     @property
     def args(self):
-        return to_arguments(
-            self._base_args or OrderedDict(),
-            dict(self.field_args, **self.reference_args),
-        )
+        # Backend query fields (and their input types) are constructed once
+        args = getattr(self, "_args", None)
+        if args is None:
+            args = self._args = to_arguments(
+                self._base_args or OrderedDict(),
+                dict(self.field_args, **self.reference_args),
+            )
+        return args
 
     @property
     def default_filter_backends(self):
@@ -138,9 +262,27 @@ class ElasticsearchConnectionField(ConnectionField):
             self.default_filter_backends,
         )
 
+    @property
+    def result_cache(self):
+        return getattr(self.node_type._meta, "result_cache", None)
+
     @args.setter
     def args(self, args):
         self._base_args = args
+        self._args = None
+
+    def convert_field(self, field):
+        """Convert the mapping field, using the conversions of the registry.
+
+        :param field: Mapping field.
+        :type field: elasticsearch_dsl.field.Field
+        :return: Converted field.
+        """
+        converted = self.registry.get_converted_field(field)
+        if converted is None:
+            converted = convert_elasticsearch_field(field, self.registry)
+            self.registry.register_converted_field(field, converted)
+        return converted
 
     def _field_args(self, items):
         def is_filterable(k):
@@ -153,9 +295,8 @@ class ElasticsearchConnectionField(ConnectionField):
             if k not in self.doc_type.mapping.properties.properties._d_:
                 return False
             try:
-                converted = convert_elasticsearch_field(
-                    self.doc_type.mapping.properties.properties._d_.get(k),
-                    self.registry,
+                converted = self.convert_field(
+                    self.doc_type.mapping.properties.properties._d_.get(k)
                 )
             except ElasticsearchConversionError:
                 return False
@@ -243,17 +384,123 @@ class ElasticsearchConnectionField(ConnectionField):
                 args.update(queryset_or_filters)
         qs = document.search()
 
+        # Arguments are frozen once and shared by all backends
+        args = freeze(args)
         for backend_cls in self.filter_backends:
-            backend = backend_cls(self, args=dict(args))
+            backend = backend_cls(self, args=args)
             qs = backend.filter(qs)
 
-        try:
-            logger.debug(qs.to_dict())
-        except Exception as err:
-            logger.debug(err)
+        trace_query(qs, "queryset")
         return qs
 
-    def default_resolver(self, _root, info, **args):
+    def skip_unselected_parts(self, queryset, info, skip_highlight=True):
+        """Drop the parts of the search not needed for the selection.
+
+        Aggregations are dropped unless `facets` are selected and
+        highlighting is dropped unless `highlight` is selected on the nodes.
+        If neither `edges` nor the parts of the `pageInfo` that depend on
+        the hits are selected, hits are not fetched. Nothing is dropped if
+        unknown connection fields are selected.
+
+        :param queryset: Search.
+        :param info: Resolve info.
+        :param skip_highlight: Whether highlighting may be dropped.
+        :return: Tuple of search and whether hits shall be fetched.
+        :rtype: tuple
+        """
+        selected = get_selected_fields(info)
+        if not selected.issubset(CONNECTION_FIELDS):
+            return queryset, True
+
+        if "facets" not in selected and queryset.aggs._params.get("aggs"):
+            queryset = queryset._clone()
+            queryset.aggs._params = {"aggs": {}}
+
+        page_info = get_selected_fields(info, ("pageInfo",))
+        fetch_hits = "edges" in selected \
+            or bool(page_info & {"startCursor", "endCursor"}) \
+            or ("hasNextPage" in page_info and (
+                self.pagination_mode == PAGINATION_MODE_SEARCH_AFTER
+                or self.track_total_hits is not True
+            ))
+
+        if queryset._highlight:
+            names = get_field_names(
+                self.node_type,
+                getattr(info.schema, "auto_camelcase", True)
+            )
+            highlight_selected = "highlight" in {
+                names.get(_name)
+                for _name in get_selected_fields(info, ("edges", "node"))
+            }
+            if not fetch_hits or (skip_highlight and not highlight_selected):
+                queryset = queryset._clone()
+                queryset._highlight = {}
+                queryset._highlight_opts = {}
+
+        return queryset, fetch_hits
+
+    def skip_scoring(self, queryset, info, nodes_known=True):
+        """Don't score hits if scores are not needed.
+
+        If hits are sorted by fields (not by `_score`) and `score` is not
+        selected on the nodes, the query is wrapped into a `constant_score`
+        query (filter context) and `track_scores` is turned off. Nothing is
+        changed if `min_score` or `track_scores` are set, or if the query
+        would match other hits in the filter context.
+
+        :param queryset: Search.
+        :param info: Resolve info.
+        :param nodes_known: Whether all of the fields selected on the nodes
+            are known (otherwise, nodes might need the score).
+        :return: Search.
+        """
+        if (
+            not nodes_known
+            or not queryset._sort
+            or is_score_sort(queryset._sort)
+            or "min_score" in queryset._extra
+            or "track_scores" in queryset._extra
+        ):
+            return queryset
+
+        query = queryset.query._proxied
+        query_name = getattr(query, "name", None)
+        if query_name in (None, "match_all", "constant_score"):
+            return queryset
+        if query_name == "bool":
+            params = query._params
+            # Nothing is scored (filter context) already
+            if not params.get("must") and not params.get("should"):
+                return queryset
+            # Optional `should` clauses (which might be required in the
+            # filter context, depending on the Elasticsearch version)
+            if params.get("should") \
+                    and (params.get("must") or params.get("filter")) \
+                    and "minimum_should_match" not in params:
+                return queryset
+
+        names = get_field_names(
+            self.node_type,
+            getattr(info.schema, "auto_camelcase", True)
+        )
+        if "score" in {
+            names.get(_name)
+            for _name in get_selected_fields(info, ("edges", "node"))
+        }:
+            return queryset
+
+        queryset = queryset.extra(track_scores=False)
+        queryset.query = Q("constant_score", filter=query)
+        return queryset
+
+    def iter_connection(self, info, **args):
+        """Build the connection.
+
+        This is a generator yielding the requests to be made to
+        Elasticsearch and returning the connection (see
+        `graphene_elastic.arrayconnection.resolve_requests`).
+        """
         args = args or {}
         connection_args = {
             "first": args.pop("first", None),
@@ -271,6 +518,9 @@ class ElasticsearchConnectionField(ConnectionField):
         }
 
         _id = args.pop("id", None)
+        fetch_hits = True
+        # Nodes fetched by id are documents
+        raw_hits = False
 
         if _id is not None:
             iterables = [get_node_from_global_id(self.node_type, info, _id)]
@@ -279,11 +529,57 @@ class ElasticsearchConnectionField(ConnectionField):
         # functionality that must be there is present
         elif callable(getattr(self.document, "search", None)):
             iterables = self.get_queryset(self.document, info, **args)
-            list_length = iterables.count()
+            raw_hits = self.raw_hits
+            source_fields = get_source_fields(info, self.node_type)
+            if self.source_from_selection \
+                    and source_fields is not None \
+                    and iterables._source is None:
+                iterables = iterables.source(source_fields or False)
+            if self.skip_unselected:
+                iterables, fetch_hits = self.skip_unselected_parts(
+                    iterables,
+                    info,
+                    # Nodes might need any part of the hits, unless all of
+                    # the selected fields are known
+                    skip_highlight=source_fields is not None
+                )
+            if self.constant_score:
+                iterables = self.skip_scoring(
+                    iterables,
+                    info,
+                    nodes_known=source_fields is not None
+                )
+            if self.pagination_mode == PAGINATION_MODE_SEARCH_AFTER:
+                connection = yield from iter_connection_from_search_after(
+                    list_slice=iterables,
+                    args=connection_args,
+                    connection_type=self.type,
+                    edge_type=self.type.Edge,
+                    pageinfo_type=graphene.PageInfo,
+                    connection_field=self,
+                    track_total_hits=self.track_total_hits,
+                    tiebreaker=self.search_after_tiebreaker,
+                    point_in_time=self.point_in_time,
+                    pit_keep_alive=self.pit_keep_alive,
+                    fetch_hits=fetch_hits,
+                    raw_hits=raw_hits
+                )
+                connection.iterable = iterables
+                return connection
+            # In single round trip mode, the total is taken from the
+            # response of the search that fetches the page.
+            if self.single_round_trip or self.track_total_hits is not True:
+                list_length = None
+            else:
+                list_length = yield (
+                    REQUEST_COUNT,
+                    iterables,
+                    self.result_cache
+                )
         else:
             iterables = []
             list_length = 0
-        connection = connection_from_list_slice(
+        connection = yield from iter_connection_from_list_slice(
             list_slice=iterables,
             args=connection_args,
             list_length=list_length,
@@ -291,12 +587,24 @@ class ElasticsearchConnectionField(ConnectionField):
             connection_type=self.type,
             edge_type=self.type.Edge,
             pageinfo_type=graphene.PageInfo,
-            connection_field=self
+            connection_field=self,
+            track_total_hits=self.track_total_hits,
+            fetch_hits=fetch_hits,
+            raw_hits=raw_hits
         )
         connection.iterable = iterables
-        connection.list_length = list_length
         return connection
 
+    def default_resolver(self, _root, info, **args):
+        if self.multi_search:
+            loader = get_multi_search_loader(info)
+            if loader is not None:
+                return resolve_requests_batched(
+                    self.iter_connection(info, **args),
+                    loader
+                )
+        return resolve_requests(self.iter_connection(info, **args))
+
     def chained_resolver(self, resolver, is_partial, root, info, **args):
         if not bool(args) or not is_partial:
             resolved = resolver(root, info, **args)
@@ -337,18 +645,23 @@ class ElasticsearchConnectionField(ConnectionField):
         return connection
 
     @classmethod
-    def connection_resolver(cls,
-                            resolver,
-                            connection_type,
-                            root,
-                            info,
-                            connection_field=None,
-                            **args):
+    def validate_connection_args(cls, info, args):
+        """Validate the pagination arguments and clamp them to the limit.
+
+        Made before any request to Elasticsearch, so that requests over the
+        limit fail early.
+
+        :param info: Resolve info.
+        :param args: Arguments of the connection field. `first` and `last`
+            are clamped to the `max_limit` in place.
+        :type args: dict
+        :return: Arguments.
+        :rtype: dict
+        """
         first = args.get("first")
         last = args.get("last")
         enforce_first_or_last = args.get("enforce_first_or_last")
         max_limit = args.get("max_limit")
-        # connection_field = args.get("connection_field")
 
         if enforce_first_or_last:
             assert first or last, (
@@ -371,6 +684,18 @@ class ElasticsearchConnectionField(ConnectionField):
                 ).format(last, info.field_name, max_limit)
                 args["last"] = min(last, max_limit)
 
+        return args
+
+    @classmethod
+    def connection_resolver(cls,
+                            resolver,
+                            connection_type,
+                            root,
+                            info,
+                            connection_field=None,
+                            **args):
+        args = cls.validate_connection_args(info, args)
+
         iterable = resolver(root, info, **args)
         if isinstance(connection_type, graphene.NonNull):
             connection_type = connection_type.of_type
@@ -1,8 +1,9 @@
 import graphene
 from collections import OrderedDict
-from copy import deepcopy
 from stringcase import pascalcase as to_pascal_case
 
+from ..interning import intern_type
+from ..utils import freeze
 from ..constants import (
     DYNAMIC_CLASS_NAME_PREFIX,
     SEPARATOR_LOOKUP_NAME,
@@ -34,10 +35,59 @@ class BaseBackend(object):
     has_connection_fields = False
 
     def __init__(self, connection_field, args=None):
+        """Constructor.
+
+        :param connection_field: Connection field.
+        :param args: Query arguments. Frozen (see `freeze`) once per request
+            and shared by all backends, thus never modified by backends.
+        :type connection_field:
+            graphene_elastic.fields.ElasticsearchConnectionField
+        :type args: graphene_elastic.utils.FrozenDict
+        """
         self.connection_field = connection_field
-        self.args = deepcopy(args) or {}
+        self.args = freeze(args or {})
         assert self.prefix
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile backend options.
+
+        Called once for each `ElasticsearchObjectType` (on class creation)
+        with the `Meta` options of the type. Backends shall normalize their
+        options here, so that nothing has to be copied or normalized on
+        each request. The result is frozen and shared between requests,
+        thus shall never be modified.
+
+        :param options: `Meta` options of the `ElasticsearchObjectType`.
+        :type options: dict
+        :return: Compiled options.
+        :rtype: graphene_elastic.utils.FrozenDict
+        """
+        return freeze({})
+
+    @property
+    def compiled_options(self):
+        """Compiled backend options.
+
+        Options are compiled once per `ElasticsearchObjectType` and then
+        reused (see `compile_options`).
+
+        :return: Compiled options.
+        :rtype: graphene_elastic.utils.FrozenDict
+        """
+        _meta = self.connection_field.type._meta.node._meta
+        compiled = getattr(_meta, 'compiled_filter_backend_options', None)
+        backend_cls = self.__class__
+        if compiled is not None and backend_cls in compiled:
+            return compiled[backend_cls]
+
+        compiled_options = backend_cls.compile_options(
+            getattr(_meta, 'filter_backend_options', {})
+        )
+        if compiled is not None:
+            compiled[backend_cls] = compiled_options
+        return compiled_options
+
     def field_belongs_to(self, field_name):
         """Check if given filter field belongs to the backend.
 
@@ -183,7 +233,7 @@ class BaseBackend(object):
 
         return {
             self.prefix: graphene.Argument(
-                type(
+                intern_type(
                     "{}{}{}BackendFilter".format(
                         DYNAMIC_CLASS_NAME_PREFIX,
                         to_pascal_case(self.prefix),
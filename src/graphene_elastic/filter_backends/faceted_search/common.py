@@ -1,6 +1,4 @@
-from copy import deepcopy
 # from collections import OrderedDict
-import enum
 
 from anysearch.search_dsl import TermsFacet
 from anysearch.search_dsl.query import Q
@@ -11,6 +9,8 @@ from stringcase import pascalcase as to_pascal_case
 
 from ...constants import DYNAMIC_CLASS_NAME_PREFIX
 from ..base import BaseBackend
+from ...interning import intern_enum
+from ...utils import freeze
 
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
@@ -74,15 +74,24 @@ class FacetedSearchFilterBackend(BaseBackend):
         except Exception as err:
             connection.facets = {}
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        faceted_search_fields = options.get('faceted_search_fields', {})
+        return freeze({
+            'faceted_search_fields': faceted_search_fields,
+            'prepared_faceted_search_fields':
+                cls.compile_faceted_search_fields(faceted_search_fields),
+        })
+
     @property
     def faceted_search_fields(self):
         """Faceted search filter fields."""
-        search_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            'filter_backend_options',
-            {}
-        ).get('faceted_search_fields', {})
-        return deepcopy(search_fields)
+        return self.compiled_options['faceted_search_fields']
 
     def field_belongs_to(self, field_name):
         """Check if given filter field belongs to the backend.
@@ -112,22 +121,21 @@ class FacetedSearchFilterBackend(BaseBackend):
         return {
             self.prefix: graphene.Argument(
                 graphene.List(
-                    graphene.Enum.from_enum(
-                        enum.Enum(
-                            "{}{}{}BackendEnum".format(
-                                DYNAMIC_CLASS_NAME_PREFIX,
-                                to_pascal_case(self.prefix),
-                                self.connection_field.type.__name__
-                            ),
-                            params
-                        )
+                    intern_enum(
+                        "{}{}{}BackendEnum".format(
+                            DYNAMIC_CLASS_NAME_PREFIX,
+                            to_pascal_case(self.prefix),
+                            self.connection_field.type.__name__
+                        ),
+                        params.items()
                     )
                 )
             )
         }
 
-    def prepare_faceted_search_fields(self):
-        """Prepare faceted search fields.
+    @classmethod
+    def compile_faceted_search_fields(cls, faceted_search_fields):
+        """Compile faceted search fields.
 
         Prepares the following structure:
 
@@ -147,40 +155,60 @@ class FacetedSearchFilterBackend(BaseBackend):
             >>>     },
             >>> }
 
+        The `enabled` tells whether the facet is always enabled. Otherwise
+        it's enabled only if requested.
+
         :return: Faceted search fields options.
         :rtype: dict
         """
-        if not self.faceted_search_fields:
-            return {}
-
-        faceted_search_args = dict(self.args).get(self.prefix, [])
-
-        faceted_search_fields = deepcopy(self.faceted_search_fields)
+        compiled_faceted_search_fields = {}
 
         for field, options in faceted_search_fields.items():
             if options is None or isinstance(options, str):
-                faceted_search_fields[field] = {
-                    'field': options or field
-                }
-            elif 'field' not in faceted_search_fields[field]:
-                faceted_search_fields[field]['field'] = field
-
-            if 'enabled' in faceted_search_fields[field] \
-                    or field in faceted_search_args:
-                faceted_search_fields[field]['enabled'] = True
+                options = {'field': options or field}
             else:
-                faceted_search_fields[field]['enabled'] = False
+                options = dict(options)
+                if 'field' not in options:
+                    options['field'] = field
+
+            options['enabled'] = 'enabled' in options
+
+            if 'facet' not in options:
+                options['facet'] = TermsFacet
+
+            if 'options' not in options:
+                options['options'] = {}
 
-            if 'facet' not in faceted_search_fields[field]:
-                faceted_search_fields[field]['facet'] = TermsFacet
+            options['global'] = options.get('global', False)
 
-            if 'options' not in faceted_search_fields[field]:
-                faceted_search_fields[field]['options'] = {}
+            compiled_faceted_search_fields[field] = options
 
-            faceted_search_fields[field]['global'] = \
-                faceted_search_fields[field].get('global', False)
+        return compiled_faceted_search_fields
 
-        return faceted_search_fields
+    def prepare_faceted_search_fields(self):
+        """Prepare faceted search fields.
+
+        Faceted search fields are compiled once (see
+        `compile_faceted_search_fields`), only the `enabled` is set
+        depending on the requested facets.
+
+        :return: Faceted search fields options.
+        :rtype: dict
+        """
+        faceted_search_fields = \
+            self.compiled_options['prepared_faceted_search_fields']
+        if not faceted_search_fields:
+            return {}
+
+        faceted_search_args = dict(self.args).get(self.prefix, [])
+
+        return {
+            field: dict(
+                options,
+                enabled=options['enabled'] or field in faceted_search_args
+            )
+            for field, options in faceted_search_fields.items()
+        }
 
     def get_faceted_search_query_params(self):
         """Get highlight query params.
@@ -1,4 +1,3 @@
-from copy import deepcopy
 import graphene
 from stringcase import pascalcase as to_pascal_case
 
@@ -6,26 +5,14 @@ from ..base import BaseBackend
 from ...constants import (
     ALL_LOOKUP_FILTERS_AND_QUERIES,
     DYNAMIC_CLASS_NAME_PREFIX,
-    LOOKUP_FILTER_EXISTS,
-    LOOKUP_FILTER_PREFIX,
-    LOOKUP_FILTER_RANGE,
-    LOOKUP_FILTER_TERM,
-    LOOKUP_FILTER_TERMS,
-    LOOKUP_FILTER_WILDCARD,
-    LOOKUP_QUERY_CONTAINS,
-    LOOKUP_QUERY_ENDSWITH,
-    LOOKUP_QUERY_EXCLUDE,
-    LOOKUP_QUERY_GT,
-    LOOKUP_QUERY_GTE,
-    LOOKUP_QUERY_IN,
-    LOOKUP_QUERY_ISNULL,
-    LOOKUP_QUERY_LT,
-    LOOKUP_QUERY_LTE,
-    LOOKUP_QUERY_STARTSWITH,
+    FILTER_CONTEXT_FILTER,
+    FILTER_CONTEXTS,
     VALUE,
 )
 from .mixins import FilteringFilterMixin
 from .queries import LOOKUP_FILTER_MAPPING
+from ...interning import intern_type
+from ...utils import freeze
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2019-2022 Artur Barseghyan"
@@ -39,20 +26,33 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
     prefix = "filter"
     has_query_fields = True
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        filter_fields = options.get('filter_fields', {})
+        prepared_filter_fields = cls.compile_filter_fields(filter_fields)
+        return freeze({
+            'filter_fields': filter_fields,
+            'flat_filter_fields': cls.flatten_filter_fields(filter_fields),
+            'filter_args_mapping': {
+                field: field for field, value in filter_fields.items()
+            },
+            'prepared_filter_fields': prepared_filter_fields,
+            'filter_plan': cls.compile_filter_plan(prepared_filter_fields),
+        })
+
     @property
     def filter_fields(self):
         """Filtering filter fields."""
-        filter_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            'filter_backend_options',
-            {}
-        ).get('filter_fields', {})
-
-        return deepcopy(filter_fields)
+        return self.compiled_options['filter_fields']
 
     @property
     def filter_args_mapping(self):
-        return {field: field for field, value in self.filter_fields.items()}
+        return self.compiled_options['filter_args_mapping']
 
     def field_belongs_to(self, field_name):
         """Check if given filter field belongs to the backend.
@@ -113,7 +113,7 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
             params.update({lookup: query_cls()})
 
         return graphene.Argument(
-            type(
+            intern_type(
                 "{}{}{}{}".format(
                     DYNAMIC_CLASS_NAME_PREFIX,
                     to_pascal_case(self.prefix),
@@ -146,7 +146,7 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
             params.update({sub_field_name: _field_type})
 
         return graphene.Argument(
-            type(
+            intern_type(
                 "{}{}{}{}".format(
                     DYNAMIC_CLASS_NAME_PREFIX,
                     to_pascal_case(self.prefix),
@@ -164,8 +164,9 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
     #         return self.filter_fields[field_name]
     #     return {}
 
-    def prepare_filter_fields(self):
-        """Prepare filter fields
+    @classmethod
+    def compile_filter_fields(cls, filter_fields):
+        """Compile filter fields.
 
         Assume that we have a document like this.
 
@@ -201,6 +202,7 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
                         ... # custom lookup list
                     ],
                     'default_lookup': ... # custom default lookup
+                    'context': 'filter|query' # `filter` by default
                 },
                 'created_at': {
                     'type': 'normal',
@@ -245,13 +247,15 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
         def _recursive_correct_filter_fields(
             filter_fields,
             root_field=None,
-            is_nested=False
+            is_nested=False,
+            root_context=FILTER_CONTEXT_FILTER
         ):
             # TODO: Generate complete filter_fields
             data = {}
             for field_name, field_options in filter_fields.items():
                 data[field_name] = {}
                 default_lookup, lookups = None, None
+                context = root_context
                 if isinstance(field_options, str):
                     field = field_options
                     field_type = "normal"
@@ -260,10 +264,18 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
                     default_lookup = field_options.get("default_lookup")
                     lookups = field_options.get("lookups")
                     field_type = field_options.get("type", "normal")
+                    context = field_options.get("context", root_context)
                 else:
                     raise TypeError(
                         "Field option must be type of str or dict.")
 
+                if context not in FILTER_CONTEXTS:
+                    raise ValueError(
+                        "Field context must be one of {}.".format(
+                            ", ".join(FILTER_CONTEXTS)
+                        )
+                    )
+
                 if lookups is None:
                     lookups = ALL_LOOKUP_FILTERS_AND_QUERIES
 
@@ -274,6 +286,7 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
                     root_field, field) if root_field else field
                 data[field_name]["field"] = field
                 data[field_name]["type"] = field_type
+                data[field_name]["context"] = context
 
                 if field_type == "normal":
                     data[field_name]["lookups"] = lookups
@@ -283,13 +296,125 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
                         _recursive_correct_filter_fields(
                             field_options["properties"],
                             root_field=field,
-                            is_nested=field_type == "nested"
+                            is_nested=field_type == "nested",
+                            root_context=context
                         )
                 if is_nested:
                     data[field_name]["path"] = root_field
             return data
 
-        return _recursive_correct_filter_fields(self.filter_fields)
+        return _recursive_correct_filter_fields(filter_fields)
+
+    @classmethod
+    def flatten_filter_fields(cls, filter_fields, prefix=""):
+        """Flatten filter fields (as given in Meta) by dotted field name.
+
+        Sample output:
+
+            {
+                'category': 'category.raw',
+                'comments': {
+                    'type': 'nested',
+                    'properties': {...}
+                },
+                'comments.author': {...},
+                ...
+            }
+
+        :param filter_fields:
+        :param prefix:
+        :return:
+        """
+        data = {}
+        for field_name, field_options in filter_fields.items():
+            data[prefix + field_name] = field_options
+            if isinstance(field_options, dict) \
+                    and "properties" in field_options:
+                data.update(
+                    cls.flatten_filter_fields(
+                        field_options["properties"],
+                        prefix="{}{}.".format(prefix, field_name)
+                    )
+                )
+        return data
+
+    @classmethod
+    def compile_filter_plan(cls, prepared_filter_fields, prefix=""):
+        """Compile filter plan.
+
+        Flattens the prepared filter fields by dotted field name. For
+        normal fields, lookup params are mapped directly to the
+        methods applying them (see `compile_lookup_plan`).
+
+        Sample output:
+
+            {
+                'category': {
+                    'field': 'category.raw',
+                    'path': None,
+                    'context': 'filter',
+                    'lookups': {
+                        'value': ('term', 'apply_filter_term'),
+                        'terms': ('terms', 'apply_filter_terms'),
+                        ...
+                    }
+                },
+                'comments': {
+                    'field': 'comments',
+                    'path': None,
+                    'context': 'filter',
+                    'lookups': None,
+                },
+                'comments.author': {
+                    'field': 'comments.author.raw',
+                    'path': 'comments',
+                    'context': 'filter',
+                    'lookups': {...}
+                },
+                ...
+            }
+
+        :param prepared_filter_fields:
+        :param prefix:
+        :return:
+        """
+        plan = {}
+        for field_name, field_options in prepared_filter_fields.items():
+            key = prefix + field_name
+            if field_options["type"] in ("nested", "object"):
+                plan[key] = {
+                    "field": field_options["field"],
+                    "path": field_options.get("path"),
+                    "context": field_options["context"],
+                    "lookups": None,
+                }
+                plan.update(
+                    cls.compile_filter_plan(
+                        field_options["properties"],
+                        prefix="{}.".format(key)
+                    )
+                )
+            else:
+                plan[key] = {
+                    "field": field_options.get("field", field_name),
+                    "path": field_options.get("path"),
+                    "context": field_options["context"],
+                    "lookups": cls.compile_lookup_plan(
+                        field_options.get("lookups", ()),
+                        field_options.get("default_lookup", None)
+                    ),
+                }
+        return plan
+
+    def prepare_filter_fields(self):
+        """Prepare filter fields.
+
+        Filter fields are compiled once (see `compile_filter_fields`).
+
+        :return: Filter fields.
+        :rtype: graphene_elastic.utils.FrozenDict
+        """
+        return self.compiled_options['prepared_filter_fields']
 
     def prepare_query_params(self):
         """Prepare query params.
@@ -329,10 +454,12 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
         3. comments.author.name
         """
         if filter_fields is None:
-            filter_fields = self.filter_fields
+            return self.compiled_options['flat_filter_fields'].get(
+                field_name
+            ) or None
 
         search_path = field_name.split(".")
-        data = deepcopy(filter_fields)
+        data = filter_fields
         for p in search_path:
             if "properties" in data:
                 data = data["properties"]
@@ -445,192 +572,46 @@ class FilteringFilterBackend(BaseBackend, FilteringFilterMixin):
 
         query_params = self.prepare_query_params()     # Shall be fixed
         filter_query_params = []
-        filter_fields = self.prepare_filter_fields()   # Correct
+        filter_plan = self.compiled_options['filter_plan']
+        doc_type_name = self.doc_type.mapping.properties.name
 
-        def _recursive_get_lookup_param_options(
-            query_dict: dict,
-            predefined_filter_fields: dict,
-            ret=None
-        ):
+        def _recursive_get_lookup_param_options(query_dict, prefix=""):
             """In-depth traversal of the tree dict to generate a query list."""
-            filter_fields = deepcopy(predefined_filter_fields)
             for field_name, lookup_params in query_dict.items():
-                if field_name not in filter_fields:
+                field_plan = filter_plan.get(prefix + field_name)
+                if field_plan is None:
                     continue
 
-                field_options = filter_fields[field_name]
-                field_type = field_options["type"]
-
-                if field_type in ("nested", "object"):
+                if field_plan["lookups"] is None:
                     _recursive_get_lookup_param_options(
                         query_dict=lookup_params,
-                        predefined_filter_fields=filter_fields[
-                            field_name
-                        ]["properties"],
-                        ret=ret
+                        prefix="{}{}.".format(prefix, field_name)
                     )
-                else:
-                    valid_lookup = field_options.get("lookups", ())
-                    default_lookup = field_options.get("default_lookup", None)
-
-                    for lookup_param, lookup_options in lookup_params.items():
-                        lookup = None
-                        if lookup_param is VALUE:
-                            lookup = default_lookup
-                        elif lookup_param in valid_lookup:
-                            lookup = lookup_param
-
-                        if lookup_options is not None:
-                            ret.append({
-                                "lookup": lookup,
-                                "values": lookup_options,
-                                "path": field_options.get("path"),
-                                "field": field_options.get(
-                                    "field",
-                                    field_name
-                                ),
-                                "type": self.doc_type.mapping.properties.name,
-                            })
-
-        _recursive_get_lookup_param_options(
-            query_dict=query_params,
-            predefined_filter_fields=filter_fields,
-            ret=filter_query_params
-        )
+                    continue
+
+                for lookup_param, lookup_options in lookup_params.items():
+                    if lookup_options is None:
+                        continue
+                    lookup, apply_method = field_plan["lookups"].get(
+                        lookup_param,
+                        self.default_lookup_plan
+                    )
+                    filter_query_params.append({
+                        "lookup": lookup,
+                        "values": lookup_options,
+                        "path": field_plan["path"],
+                        "field": field_plan["field"],
+                        "type": doc_type_name,
+                        "context": field_plan["context"],
+                        "apply": apply_method,
+                    })
+
+        _recursive_get_lookup_param_options(query_dict=query_params)
         return filter_query_params
 
     def filter(self, queryset):
         """Filter."""
-        filter_query_params = self.get_filter_query_params()
-
-        for filter_query in filter_query_params:
-
-            # For all other cases, when we don't have multiple values,
-            # we follow the normal flow.
-            if filter_query["lookup"] == LOOKUP_FILTER_TERMS:
-                queryset = self.apply_filter_terms(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `prefix` filter lookup
-            elif filter_query["lookup"] in (
-                LOOKUP_FILTER_PREFIX,
-                LOOKUP_QUERY_STARTSWITH,
-            ):
-                queryset = self.apply_filter_prefix(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `range` filter lookup
-            elif filter_query["lookup"] == LOOKUP_FILTER_RANGE:
-                queryset = self.apply_filter_range(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `exists` filter lookup
-            elif filter_query["lookup"] == LOOKUP_FILTER_EXISTS:
-                queryset = self.apply_query_exists(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `wildcard` filter lookup
-            elif filter_query["lookup"] == LOOKUP_FILTER_WILDCARD:
-                queryset = self.apply_query_wildcard(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `contains` filter lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_CONTAINS:
-                queryset = self.apply_query_contains(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `in` functional query lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_IN:
-                queryset = self.apply_query_in(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `gt` functional query lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_GT:
-                queryset = self.apply_query_gt(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `gte` functional query lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_GTE:
-                queryset = self.apply_query_gte(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `lt` functional query lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_LT:
-                queryset = self.apply_query_lt(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `lte` functional query lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_LTE:
-                queryset = self.apply_query_lte(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `endswith` filter lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_ENDSWITH:
-                queryset = self.apply_query_endswith(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `isnull` functional query lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_ISNULL:
-                queryset = self.apply_query_isnull(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `exclude` functional query lookup
-            elif filter_query["lookup"] == LOOKUP_QUERY_EXCLUDE:
-                queryset = self.apply_query_exclude(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-            # `term` filter lookup. This is default if no `default_lookup`
-            # filter_query has been given or explicit lookup provided.
-            else:
-                queryset = super(
-                    FilteringFilterBackend,
-                    self
-                ).apply_filter_term(
-                    queryset,
-                    filter_query,
-                    filter_query['values']
-                )
-
-        return queryset
+        return self.apply_filter_query_params(
+            queryset,
+            self.get_filter_query_params()
+        )
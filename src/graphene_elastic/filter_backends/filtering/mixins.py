@@ -11,12 +11,32 @@ from graphene_elastic.constants import (
     GTE,
     LTE,
     BOOST,
+    FILTER_CONTEXT_FILTER,
+    FILTER_CONTEXT_QUERY,
+    LOOKUP_FILTER_EXISTS,
+    LOOKUP_FILTER_PREFIX,
+    LOOKUP_FILTER_RANGE,
+    LOOKUP_FILTER_TERMS,
+    LOOKUP_FILTER_WILDCARD,
+    LOOKUP_QUERY_CONTAINS,
+    LOOKUP_QUERY_ENDSWITH,
+    LOOKUP_QUERY_EXCLUDE,
+    LOOKUP_QUERY_GT,
+    LOOKUP_QUERY_GTE,
+    LOOKUP_QUERY_IN,
+    LOOKUP_QUERY_ISNULL,
+    LOOKUP_QUERY_LT,
+    LOOKUP_QUERY_LTE,
+    LOOKUP_QUERY_STARTSWITH,
+    VALUE,
 )
+from .queries import LOOKUP_FILTER_MAPPING
 
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
+    'BoolQueryCollector',
     'FilteringFilterMixin',
 )
 
@@ -31,6 +51,105 @@ def q_params(lookup, options, query=None):
     return Q(lookup, **query)
 
 
+class BoolQueryCollector(object):
+    """Collects clauses of a single `bool` query.
+
+    Stands in for the queryset in the `apply_*` methods of the
+    `FilteringFilterMixin`: it supports the `filter`, `query` and
+    `post_filter` calls made by them, but instead of cloning the search
+    on every call, the clauses are collected in the `filter`, `must` and
+    `must_not` lists. The collected clauses shall be applied at once
+    (see `to_query`).
+
+    Clauses added with `query` go to the `must` list only if `context` is
+    set to `FILTER_CONTEXT_QUERY`. Otherwise they are put into the
+    (non-scoring, cacheable) `filter` list.
+    """
+
+    def __init__(self):
+        self.filter_clauses = []
+        self.must_clauses = []
+        self.must_not_clauses = []
+        self.context = FILTER_CONTEXT_FILTER
+
+    @classmethod
+    def get_negated_clauses(cls, q):
+        """Get clauses of a negated query.
+
+        :param q:
+        :return: List of negated clauses or None if the query is not a
+            `bool` query having `must_not` clauses only.
+        """
+        if getattr(q, "name", None) == "bool" \
+                and q.must_not \
+                and not (q.must or q.should or q.filter) \
+                and "minimum_should_match" not in q._params:
+            return q.must_not
+        return None
+
+    def add(self, *args, **kwargs):
+        """Add a non-scoring clause.
+
+        Negated clauses are unwrapped into the `must_not` list.
+
+        :param args:
+        :param kwargs:
+        :return: self
+        """
+        q = Q(*args, **kwargs)
+        negated = self.get_negated_clauses(q)
+        if negated:
+            self.must_not_clauses.extend(negated)
+        else:
+            self.filter_clauses.append(q)
+        return self
+
+    def add_query(self, *args, **kwargs):
+        """Add a clause in the current context.
+
+        :param args:
+        :param kwargs:
+        :return: self
+        """
+        if self.context != FILTER_CONTEXT_QUERY:
+            return self.add(*args, **kwargs)
+
+        q = Q(*args, **kwargs)
+        negated = self.get_negated_clauses(q)
+        if negated:
+            self.must_not_clauses.extend(negated)
+        else:
+            self.must_clauses.append(q)
+        return self
+
+    filter = add
+    query = add_query
+    # Post filter does not take part in scoring
+    post_filter = add
+
+    def __bool__(self):
+        return bool(
+            self.filter_clauses
+            or self.must_clauses
+            or self.must_not_clauses
+        )
+
+    def to_query(self):
+        """Get the `bool` query of all collected clauses.
+
+        :return:
+        :rtype: elasticsearch_dsl.query.Bool
+        """
+        params = {}
+        if self.filter_clauses:
+            params["filter"] = self.filter_clauses
+        if self.must_clauses:
+            params["must"] = self.must_clauses
+        if self.must_not_clauses:
+            params["must_not"] = self.must_not_clauses
+        return Q("bool", **params)
+
+
 class FilteringFilterMixin(object):
     """Filtering filter mixin."""
 
@@ -38,6 +157,103 @@ class FilteringFilterMixin(object):
     apply_filter: Callable
     split_lookup_complex_value: Callable
 
+    # Names of the methods applying the lookups. Lookups which are not
+    # listed here (`term` included) are applied by `apply_filter_term`.
+    lookup_apply_methods = {
+        LOOKUP_FILTER_TERMS: 'apply_filter_terms',
+        LOOKUP_FILTER_PREFIX: 'apply_filter_prefix',
+        LOOKUP_QUERY_STARTSWITH: 'apply_filter_prefix',
+        LOOKUP_FILTER_RANGE: 'apply_filter_range',
+        LOOKUP_FILTER_EXISTS: 'apply_query_exists',
+        LOOKUP_FILTER_WILDCARD: 'apply_query_wildcard',
+        LOOKUP_QUERY_CONTAINS: 'apply_query_contains',
+        LOOKUP_QUERY_IN: 'apply_query_in',
+        LOOKUP_QUERY_GT: 'apply_query_gt',
+        LOOKUP_QUERY_GTE: 'apply_query_gte',
+        LOOKUP_QUERY_LT: 'apply_query_lt',
+        LOOKUP_QUERY_LTE: 'apply_query_lte',
+        LOOKUP_QUERY_ENDSWITH: 'apply_query_endswith',
+        LOOKUP_QUERY_ISNULL: 'apply_query_isnull',
+        LOOKUP_QUERY_EXCLUDE: 'apply_query_exclude',
+    }
+
+    # Used for lookup params not known to the field.
+    default_lookup_plan = (None, 'apply_filter_term')
+
+    def apply_filter_query_params(self, queryset, filter_query_params):
+        """Apply filter query params.
+
+        Clauses of all filter query params are collected (see
+        `BoolQueryCollector`) and applied in a single `bool` query. Unless
+        the `context` of the field is set to `FILTER_CONTEXT_QUERY`, all
+        clauses go to the filter context.
+
+        :param queryset: Original queryset.
+        :param filter_query_params: Filter query params (see
+            `get_filter_query_params`).
+        :type queryset: elasticsearch_dsl.search.Search
+        :type filter_query_params: list
+        :return: Modified queryset.
+        :rtype: elasticsearch_dsl.search.Search
+        """
+        collector = BoolQueryCollector()
+        for filter_query in filter_query_params:
+            collector.context = filter_query.get(
+                "context",
+                FILTER_CONTEXT_FILTER
+            )
+            collector = getattr(self, filter_query["apply"])(
+                collector,
+                filter_query,
+                filter_query['values']
+            )
+
+        if not collector:
+            return queryset
+
+        return self.apply_query(
+            queryset=queryset,
+            args=[collector.to_query()],
+        )
+
+    @classmethod
+    def compile_lookup_plan(cls, lookups, default_lookup=None):
+        """Compile lookup plan of a field.
+
+        Maps each lookup param (as given in the GraphQL query) to a
+        (lookup, apply method name) pair. The `value` param is mapped to
+        the default lookup.
+
+        Sample output:
+
+            {
+                'value': ('term', 'apply_filter_term'),
+                'term': ('term', 'apply_filter_term'),
+                'terms': ('terms', 'apply_filter_terms'),
+                'gt': ('gt', 'apply_query_gt'),
+                ...
+            }
+
+        :param lookups: Lookups allowed for the field.
+        :param default_lookup: Lookup to use for the `value` param.
+        :type lookups: list|tuple
+        :type default_lookup: str
+        :return: Lookup plan.
+        :rtype: dict
+        """
+        plan = {}
+        for lookup in lookups:
+            if lookup in LOOKUP_FILTER_MAPPING:
+                plan[lookup] = (
+                    lookup,
+                    cls.lookup_apply_methods.get(lookup, 'apply_filter_term')
+                )
+        plan[VALUE] = (
+            default_lookup,
+            cls.lookup_apply_methods.get(default_lookup, 'apply_filter_term')
+        )
+        return plan
+
     @classmethod
     def get_range_param_value(cls, value):
         """Get range param value.
@@ -51,11 +267,11 @@ class FilteringFilterMixin(object):
             return None
 
         return (
-            value.decimal
-            or value.float
-            or value.int
-            or value.date
-            or value.datetime
+            value.get('decimal')
+            or value.get('float')
+            or value.get('int')
+            or value.get('date')
+            or value.get('datetime')
         )
 
     @classmethod
@@ -1,11 +1,12 @@
-from copy import deepcopy
-import enum
 import graphene
 from graphene_elastic.types.json_string import ElasticJSONString
 from stringcase import pascalcase as to_pascal_case
 
 from ...constants import DYNAMIC_CLASS_NAME_PREFIX
 from ..base import BaseBackend
+from ...hits import RawHit
+from ...interning import intern_enum
+from ...utils import freeze
 
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
@@ -25,6 +26,8 @@ def highlight_resolver(parent, args, context=None, info=None):
     :return:
     """
     # return parent.meta.highlight
+    if isinstance(parent, RawHit):
+        return parent.hit.get('highlight')
     return parent.meta._d_.get('highlight')
 
 
@@ -38,15 +41,26 @@ class HighlightFilterBackend(BaseBackend):
     prefix = 'highlight'
     has_query_fields = True
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        highlight_fields = options.get('highlight_fields', {})
+        return freeze({
+            'highlight_fields': highlight_fields,
+            'highlight_options': {
+                field: (field_options or {}).get('options', {})
+                for field, field_options in highlight_fields.items()
+            },
+        })
+
     @property
     def highlight_fields(self):
         """Highlight filter fields."""
-        highlight_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            'filter_backend_options',
-            {}
-        ).get('highlight_fields', {})
-        return deepcopy(highlight_fields)
+        return self.compiled_options['highlight_fields']
 
     def field_belongs_to(self, field_name):
         """Check if given filter field belongs to the backend.
@@ -76,15 +90,13 @@ class HighlightFilterBackend(BaseBackend):
         return {
             self.prefix: graphene.Argument(
                 graphene.List(
-                    graphene.Enum.from_enum(
-                        enum.Enum(
-                            "{}{}{}BackendEnum".format(
-                                DYNAMIC_CLASS_NAME_PREFIX,
-                                to_pascal_case(self.prefix),
-                                self.connection_field.type.__name__
-                            ),
-                            params
-                        )
+                    intern_enum(
+                        "{}{}{}BackendEnum".format(
+                            DYNAMIC_CLASS_NAME_PREFIX,
+                            to_pascal_case(self.prefix),
+                            self.connection_field.type.__name__
+                        ),
+                        params.items()
                     )
                 )
             )
@@ -136,18 +148,18 @@ class HighlightFilterBackend(BaseBackend):
         if not self.highlight_fields:
             return {}
         highlight_args = dict(self.args).get(self.prefix, [])
+        highlight_options = self.compiled_options['highlight_options']
 
-        highlight_fields = dict(self.highlight_fields)
+        highlight_fields = {}
 
         for field, options in self.highlight_fields.items():
-            if 'enabled' in highlight_fields[field] \
-                    or field not in highlight_args:
-                highlight_fields[field]['enabled'] = True
-            else:
-                highlight_fields[field]['enabled'] = False
-
-            if 'options' not in highlight_fields[field]:
-                highlight_fields[field]['options'] = {}
+            highlight_fields[field] = {
+                'enabled': (
+                    'enabled' in (options or {})
+                    or field not in highlight_args
+                ),
+                'options': highlight_options[field],
+            }
 
         return highlight_fields
 
@@ -1,12 +1,12 @@
 """
 Ordering backend.
 """
-from copy import deepcopy
 import graphene
 from six import string_types
 
 from ..base import BaseBackend
 from ..queries import Direction
+from ...utils import freeze
 
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
@@ -19,62 +19,72 @@ __all__ = (
 
 class OrderingMixin(object):
 
+    @classmethod
+    def compile_ordering_options(cls, options):
+        """Compile ordering options.
+
+        :param options:
+        :return:
+        """
+        ordering_fields = options.get('ordering_fields', {})
+        if isinstance(ordering_fields, (list, tuple, set)):
+            ordering_fields = {k: k for k in ordering_fields}
+        return freeze({
+            'ordering_fields': ordering_fields,
+            'ordering_args_mapping': {
+                k: k for k, v in ordering_fields.items()
+            },
+            'ordering_defaults': options.get('ordering_defaults', {}),
+            'prepared_ordering_fields': cls.compile_ordering_fields(
+                ordering_fields
+            ),
+        })
+
     @property
     def _ordering_fields(self):
         """Ordering filter fields."""
-        ordering_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            'filter_backend_options',
-            {}
-        ).get('ordering_fields', {})
-        _ordering_fields = deepcopy(ordering_fields)
-        if isinstance(_ordering_fields, (list, tuple, set)):
-            _ordering_fields = {k: k for k in _ordering_fields}
-        return _ordering_fields
+        return self.compiled_options['ordering_fields']
 
     @property
     def _ordering_args_mapping(self):
-        if isinstance(self.ordering_fields, dict):
-            return {k: k for k, v in self.ordering_fields.items()}
-        elif isinstance(self.ordering_fields, (tuple, list, set)):
-            return {k: k for k in self.ordering_fields}
+        return self.compiled_options['ordering_args_mapping']
 
     @property
     def _ordering_defaults(self):
         """Ordering filter fields."""
-        ordering_defaults = getattr(
-            self.connection_field.type._meta.node._meta,
-            'filter_backend_options',
-            {}
-        ).get('ordering_defaults', {})
-        return deepcopy(ordering_defaults)
+        return self.compiled_options['ordering_defaults']
+
+    @classmethod
+    def compile_ordering_fields(cls, ordering_fields):
+        """Compile ordering fields.
+
+        :param ordering_fields:
+        :return: Ordering options.
+        :rtype: dict
+        """
+        compiled_ordering_fields = {}
+
+        for field, options in ordering_fields.items():
+            if options is None or isinstance(options, string_types):
+                compiled_ordering_fields[field] = {
+                    'field': options or field
+                }
+            else:
+                compiled_ordering_fields[field] = {'field': field}
+        return compiled_ordering_fields
 
     def prepare_ordering_fields(self):
         """Prepare ordering fields.
 
+        Ordering fields are compiled once (see `compile_ordering_fields`).
+
         :return: Ordering options.
         :rtype: dict
         """
         ordering_args = dict(self.args).get(self.prefix)
         if not ordering_args:
             return {}
-
-        ordering_fields = {}
-
-        for arg, value in ordering_args.items():
-            field = self.ordering_args_mapping.get(arg, None)
-            if field is None:
-                continue
-            ordering_fields.update({field: {}})
-            options = self.ordering_fields.get(field)
-
-            if options is None or isinstance(options, string_types):
-                ordering_fields[field] = {
-                    'field': options or field
-                }
-            elif 'field' not in ordering_fields[field]:
-                ordering_fields[field]['field'] = field
-        return ordering_fields
+        return self.compiled_options['prepared_ordering_fields']
 
     @classmethod
     def transform_ordering_params(cls, ordering_params, ordering_fields):
@@ -212,6 +222,15 @@ class OrderingFilterBackend(BaseBackend, OrderingMixin):
     has_query_fields = True
     score_field_name = 'score'
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        return cls.compile_ordering_options(options)
+
     @property
     def ordering_fields(self):
         """Ordering filter fields."""
@@ -359,6 +378,15 @@ class DefaultOrderingFilterBackend(BaseBackend, OrderingMixin):
     prefix = 'ordering'
     has_query_fields = False
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        return cls.compile_ordering_options(options)
+
     @property
     def ordering_fields(self):
         """Ordering filter fields."""
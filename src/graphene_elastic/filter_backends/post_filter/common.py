@@ -1,4 +1,3 @@
-from copy import deepcopy
 import graphene
 import six
 from stringcase import pascalcase as to_pascal_case
@@ -7,27 +6,14 @@ from ..base import BaseBackend
 from ...constants import (
     ALL_LOOKUP_FILTERS_AND_QUERIES,
     DYNAMIC_CLASS_NAME_PREFIX,
-    LOOKUP_FILTER_EXISTS,
-    LOOKUP_FILTER_PREFIX,
-    LOOKUP_FILTER_RANGE,
     LOOKUP_FILTER_TERM,
-    LOOKUP_FILTER_TERMS,
-    LOOKUP_FILTER_WILDCARD,
-    LOOKUP_QUERY_CONTAINS,
-    LOOKUP_QUERY_ENDSWITH,
-    LOOKUP_QUERY_EXCLUDE,
-    LOOKUP_QUERY_GT,
-    LOOKUP_QUERY_GTE,
-    LOOKUP_QUERY_IN,
-    LOOKUP_QUERY_ISNULL,
-    LOOKUP_QUERY_LT,
-    LOOKUP_QUERY_LTE,
-    LOOKUP_QUERY_STARTSWITH,
     VALUE,
 )
 
 from ..filtering.mixins import FilteringFilterMixin
 from ..filtering.queries import LOOKUP_FILTER_MAPPING
+from ...interning import intern_type
+from ...utils import freeze
 
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2019-2022 Artur Barseghyan"
@@ -41,25 +27,40 @@ class PostFilterFilteringBackend(BaseBackend, FilteringFilterMixin):
     prefix = 'postFilter'
     has_query_fields = True
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        filter_fields = options.get('post_filter_fields', {})
+        if not filter_fields:
+            filter_fields = options.get('filter_fields', {})
+        prepared_filter_fields = cls.compile_filter_fields(filter_fields)
+        return freeze({
+            'filter_fields': filter_fields,
+            'filter_args_mapping': {
+                field: field for field, value in filter_fields.items()
+            },
+            'prepared_filter_fields': prepared_filter_fields,
+            'filter_plan': {
+                field: cls.compile_lookup_plan(
+                    options["lookups"],
+                    options.get("default_lookup", None)
+                )
+                for field, options in prepared_filter_fields.items()
+            },
+        })
+
     @property
     def filter_fields(self):
         """Filtering filter fields."""
-        filter_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            'filter_backend_options',
-            {}
-        ).get('post_filter_fields', {})
-        if not filter_fields:
-            filter_fields = getattr(
-                self.connection_field.type._meta.node._meta,
-                'filter_backend_options',
-                {}
-            ).get('filter_fields', {})
-        return deepcopy(filter_fields)
+        return self.compiled_options['filter_fields']
 
     @property
     def filter_args_mapping(self):
-        return {field: field for field, value in self.filter_fields.items()}
+        return self.compiled_options['filter_args_mapping']
 
     def field_belongs_to(self, field_name):
         """Check if given filter field belongs to the backend.
@@ -114,7 +115,7 @@ class PostFilterFilteringBackend(BaseBackend, FilteringFilterMixin):
             params.update({lookup: query_cls()})
 
         return graphene.Argument(
-            type(
+            intern_type(
                 "{}{}{}{}".format(
                     DYNAMIC_CLASS_NAME_PREFIX,
                     to_pascal_case(self.prefix),
@@ -132,8 +133,9 @@ class PostFilterFilteringBackend(BaseBackend, FilteringFilterMixin):
     #         return self.filter_fields[field_name]
     #     return {}
 
-    def prepare_filter_fields(self):
-        """Prepare filter fields.
+    @classmethod
+    def compile_filter_fields(cls, filter_fields):
+        """Compile filter fields.
 
         Possible structures:
 
@@ -184,45 +186,40 @@ class PostFilterFilteringBackend(BaseBackend, FilteringFilterMixin):
                 }
             }
         """
-        filter_args = dict(self.args).get(self.prefix)
-        if not filter_args:
-            return {}
-
-        filter_fields = {}
+        compiled_filter_fields = {}
 
-        for arg, value in filter_args.items():
-            field = self.filter_args_mapping.get(arg, None)
-            if field is None:
-                continue
-            filter_fields.update({field: {}})
-            options = self.filter_fields.get(field)
+        for field, options in filter_fields.items():
             # For constructions like 'category': 'category.raw' we shall
             # have the following:
             # TODO: Make sure to use custom (user specified) lookups
             if options is None or isinstance(options, six.string_types):
-                filter_fields.update(
-                    {
-                        field: {
-                            "field": options or field,
-                            "default_lookup": LOOKUP_FILTER_TERM,
-                            "lookups": tuple(ALL_LOOKUP_FILTERS_AND_QUERIES),
-                        }
-                    }
-                )
-            elif "field" not in options:
-                filter_fields.update({field: options})
-                filter_fields[field]["field"] = field
+                compiled_filter_fields[field] = {
+                    "field": options or field,
+                    "default_lookup": LOOKUP_FILTER_TERM,
+                    "lookups": tuple(ALL_LOOKUP_FILTERS_AND_QUERIES),
+                }
             else:
-                filter_fields.update({field: options})
-
-            if (
-                field in filter_fields
-                and "lookups" not in filter_fields[field]
-            ):
-                filter_fields[field].update(
-                    {"lookups": tuple(ALL_LOOKUP_FILTERS_AND_QUERIES)}
-                )
-        return filter_fields
+                compiled_filter_fields[field] = dict(options)
+                if "field" not in options:
+                    compiled_filter_fields[field]["field"] = field
+
+            if "lookups" not in compiled_filter_fields[field]:
+                compiled_filter_fields[field]["lookups"] = \
+                    tuple(ALL_LOOKUP_FILTERS_AND_QUERIES)
+        return compiled_filter_fields
+
+    def prepare_filter_fields(self):
+        """Prepare filter fields.
+
+        Filter fields are compiled once (see `compile_filter_fields`).
+
+        :return: Filter fields.
+        :rtype: graphene_elastic.utils.FrozenDict
+        """
+        filter_args = dict(self.args).get(self.prefix)
+        if not filter_args:
+            return {}
+        return self.compiled_options['prepared_filter_fields']
 
     def prepare_query_params(self):
         """Prepare query params.
@@ -327,173 +324,43 @@ class PostFilterFilteringBackend(BaseBackend, FilteringFilterMixin):
 
         filter_query_params = {}
         filter_fields = self.prepare_filter_fields()  # Correct
+        filter_plan = self.compiled_options['filter_plan']
+        doc_type_name = self.doc_type.mapping.properties.name
 
         for field_name, lookup_params in query_params.items():
 
             if field_name in filter_fields:
                 filter_query_params[field_name] = []
-                valid_lookups = filter_fields[field_name]["lookups"]
-
-                # If we have default lookup given use it as a default and
-                # do not require further suffix specification.
-                default_lookup = None
-                if "default_lookup" in filter_fields[field_name]:
-                    default_lookup = \
-                        filter_fields[field_name]["default_lookup"]
+                field = filter_fields[field_name].get("field", field_name)
+                lookup_plan = filter_plan[field_name]
 
                 for lookup_param, lookup_options in lookup_params.items():
-                    lookup = None
-                    if lookup_param == VALUE:
-                        if default_lookup is not None:
-                            lookup = default_lookup
-                    elif lookup_param in valid_lookups:
-                        lookup = lookup_param
-
-                    if lookup_options is not None:
-                        filter_query_params[field_name].append({
-                            "lookup": lookup,
-                            "values": lookup_options,
-                            "field": filter_fields[field_name].get(
-                                "field", field_name
-                            ),
-                            "type": self.doc_type.mapping.properties.name,
-                        })
+                    if lookup_options is None:
+                        continue
+                    lookup, apply_method = lookup_plan.get(
+                        lookup_param,
+                        self.default_lookup_plan
+                    )
+                    filter_query_params[field_name].append({
+                        "lookup": lookup,
+                        "values": lookup_options,
+                        "field": field,
+                        "type": doc_type_name,
+                        "apply": apply_method,
+                    })
         return filter_query_params
 
     def filter(self, queryset):
         """Filter."""
         filter_query_params = self.get_filter_query_params()
-
-        for options in filter_query_params.values():
-
-            # For all other cases, when we don't have multiple values,
-            # we follow the normal flow.
-            for option in options:
-
-                if option["lookup"] == LOOKUP_FILTER_TERMS:
-                    queryset = self.apply_filter_terms(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `prefix` filter lookup
-                elif option["lookup"] in (
-                    LOOKUP_FILTER_PREFIX,
-                    LOOKUP_QUERY_STARTSWITH,
-                ):
-                    queryset = self.apply_filter_prefix(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `range` filter lookup
-                elif option["lookup"] == LOOKUP_FILTER_RANGE:
-                    queryset = self.apply_filter_range(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `exists` filter lookup
-                elif option["lookup"] == LOOKUP_FILTER_EXISTS:
-                    queryset = self.apply_query_exists(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `wildcard` filter lookup
-                elif option["lookup"] == LOOKUP_FILTER_WILDCARD:
-                    queryset = self.apply_query_wildcard(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `contains` filter lookup
-                elif option["lookup"] == LOOKUP_QUERY_CONTAINS:
-                    queryset = self.apply_query_contains(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `in` functional query lookup
-                elif option["lookup"] == LOOKUP_QUERY_IN:
-                    queryset = self.apply_query_in(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `gt` functional query lookup
-                elif option["lookup"] == LOOKUP_QUERY_GT:
-                    queryset = self.apply_query_gt(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `gte` functional query lookup
-                elif option["lookup"] == LOOKUP_QUERY_GTE:
-                    queryset = self.apply_query_gte(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `lt` functional query lookup
-                elif option["lookup"] == LOOKUP_QUERY_LT:
-                    queryset = self.apply_query_lt(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `lte` functional query lookup
-                elif option["lookup"] == LOOKUP_QUERY_LTE:
-                    queryset = self.apply_query_lte(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `endswith` filter lookup
-                elif option["lookup"] == LOOKUP_QUERY_ENDSWITH:
-                    queryset = self.apply_query_endswith(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `isnull` functional query lookup
-                elif option["lookup"] == LOOKUP_QUERY_ISNULL:
-                    queryset = self.apply_query_isnull(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `exclude` functional query lookup
-                elif option["lookup"] == LOOKUP_QUERY_EXCLUDE:
-                    queryset = self.apply_query_exclude(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-                # `term` filter lookup. This is default if no `default_lookup`
-                # option has been given or explicit lookup provided.
-                else:
-                    queryset = self.apply_filter_term(
-                        queryset,
-                        option,
-                        option['values']
-                    )
-
-        return queryset
+        return self.apply_filter_query_params(
+            queryset,
+            [
+                option
+                for options in filter_query_params.values()
+                for option in options
+            ]
+        )
 
     @classmethod
     def apply_filter(cls, queryset, options=None, args=None, kwargs=None):
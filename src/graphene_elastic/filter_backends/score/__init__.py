@@ -1,4 +1,5 @@
 from .common import *
+from .rescore import *
 
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
@@ -2,6 +2,7 @@ import graphene
 from graphene import Float
 
 from ..base import BaseBackend
+from ...hits import RawHit
 
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
@@ -20,6 +21,8 @@ def score_resolver(parent, args, context=None, info=None):
     :param info:
     :return:
     """
+    if isinstance(parent, RawHit):
+        return parent.hit.get('_score')
     return parent.meta._d_.get('score')
 
 
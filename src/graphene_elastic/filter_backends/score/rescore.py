@@ -0,0 +1,137 @@
+from anysearch.search_dsl.query import Q
+
+from ..base import BaseBackend
+from ...constants import PAGINATION_MODE_SEARCH_AFTER
+from ...utils import freeze
+
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2019-2022 Artur Barseghyan'
+__license__ = 'GPL 2.0/LGPL 2.1'
+__all__ = (
+    'RescoreFilterBackend',
+)
+
+
+def is_sorted_by_score(sort):
+    """Whether hits are sorted by the score (descending) only.
+
+    :param sort: Sort (`_sort` of the search).
+    :type sort: list
+    :return: True if there's no sort or hits are sorted by the score only.
+    :rtype: bool
+    """
+    for item in sort:
+        if item == '_score':
+            continue
+        if isinstance(item, dict) and list(item) == ['_score']:
+            order = item['_score']
+            if isinstance(order, dict):
+                order = order.get('order', 'desc')
+            if order == 'desc':
+                continue
+        return False
+    return True
+
+
+class RescoreFilterBackend(BaseBackend):
+    """Rescore filter backend.
+
+    The main query (made by the search backends) shall be cheap, as it's
+    run on all the documents. The (expensive) rescore query is run on the
+    top hits (`window_size` per shard) only, to reorder them. Rescore query
+    might be a query (`dict` or `Q`), such as a `function_score` query with
+    decay functions or a script, or a callable, which gets the backend (the
+    query arguments are in its `args`) and returns the query (or None to
+    skip rescoring):
+
+        def get_rescore_query(backend):
+            query = dict(backend.args).get('search', {}).get('query')
+            if query:
+                return Q('match_phrase', title={'query': query, 'slop': 2})
+
+        rescore_options = {
+            'window_size': 50,
+            'rescore_query': get_rescore_query,
+            'query_weight': 0.7,
+            'rescore_query_weight': 1.2,
+            'score_mode': 'total',
+        }
+
+    Elasticsearch does not allow rescoring hits sorted by anything but the
+    score, thus the rescore is skipped if hits are sorted by fields (place
+    this backend after the ordering backends) or paginated with
+    `search_after`. Note, that the `DefaultOrderingFilterBackend` always
+    sorts (unless the score is the default ordering).
+    """
+
+    prefix = 'rescore'
+    has_query_fields = False
+
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        rescore_options = dict(options.get('rescore_options') or {})
+        rescore_query = rescore_options.pop('rescore_query', None)
+        if rescore_query is not None and not callable(rescore_query):
+            rescore_query = Q(rescore_query)
+        window_size = rescore_options.pop('window_size', None)
+        return freeze({
+            'rescore_query': rescore_query,
+            'window_size': window_size,
+            # `query_weight`, `rescore_query_weight` and `score_mode`
+            'query_options': rescore_options,
+        })
+
+    @property
+    def rescore_options(self):
+        """Rescore options."""
+        return self.compiled_options
+
+    def field_belongs_to(self, field_name):
+        """Check if given filter field belongs to the backend.
+
+        :param field_name:
+        :return:
+        """
+        return False
+
+    def get_rescore_query(self):
+        """Get rescore query.
+
+        :return: Rescore query.
+        :rtype: elasticsearch_dsl.query.Query
+        """
+        rescore_query = self.rescore_options['rescore_query']
+        if callable(rescore_query):
+            rescore_query = rescore_query(self)
+            if isinstance(rescore_query, dict):
+                rescore_query = Q(rescore_query)
+        return rescore_query
+
+    def filter(self, queryset):
+        """Filter.
+
+        :param queryset:
+        :return:
+        """
+        if (
+            not is_sorted_by_score(queryset._sort)
+            or getattr(self.connection_field, 'pagination_mode', None)
+            == PAGINATION_MODE_SEARCH_AFTER
+        ):
+            return queryset
+
+        rescore_query = self.get_rescore_query()
+        if rescore_query is None:
+            return queryset
+
+        query = {'rescore_query': rescore_query.to_dict()}
+        query.update(self.rescore_options['query_options'])
+        rescore = {'query': query}
+        if self.rescore_options['window_size'] is not None:
+            rescore['window_size'] = self.rescore_options['window_size']
+        return queryset.extra(rescore=rescore)
@@ -10,6 +10,9 @@ from anysearch.search_dsl.query import Q
 from stringcase import pascalcase as to_pascal_case
 
 from ..base import BaseBackend
+from .query_backends import MultiMatchQueryBackend
+from ...interning import intern_type
+from ...utils import freeze
 from ...constants import (
     DYNAMIC_CLASS_NAME_PREFIX,
     ALL,
@@ -32,35 +35,81 @@ class SearchFilterBackend(BaseBackend):
     prefix = "search"
     has_query_fields = True
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        search_fields = options.get("search_fields", {})
+        search_nested_fields = options.get("search_nested_fields", {})
+        search_multi_match_options = options.get(
+            "search_multi_match_options"
+        )
+        prepared_search_fields = cls.compile_search_fields(search_fields)
+        return freeze({
+            "search_fields": search_fields,
+            "search_nested_fields": search_nested_fields,
+            "search_args_mapping": {
+                field: field for field, value in search_fields.items()
+            },
+            "nested_search_args_mapping": {
+                field: field for field, value in search_nested_fields.items()
+            },
+            "prepared_search_fields": prepared_search_fields,
+            "prepared_search_nested_fields":
+                cls.compile_search_nested_fields(search_nested_fields),
+            "search_nested_plan":
+                cls.compile_search_nested_plan(search_nested_fields),
+            "search_multi_match_options": search_multi_match_options,
+            "prepared_multi_match_query": (
+                MultiMatchQueryBackend.compile_query(
+                    prepared_search_fields,
+                    search_multi_match_options
+                )
+                if search_multi_match_options is not None
+                else None
+            ),
+        })
+
     @property
     def search_fields(self):
         """Search filter fields."""
-        search_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            "filter_backend_options",
-            {},
-        ).get("search_fields", {})
-        return deepcopy(search_fields)
+        return self.compiled_options["search_fields"]
 
     @property
     def search_nested_fields(self):
         """Search nested filter fields."""
-        search_nested_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            "filter_backend_options",
-            {},
-        ).get("search_nested_fields", {})
-        return deepcopy(search_nested_fields)
+        return self.compiled_options["search_nested_fields"]
+
+    @property
+    def search_multi_match_options(self):
+        """Search multi match options.
+
+        If set, search in all fields (`query`) is made with a single
+        `multi_match` (or `combined_fields`) query instead of a `match`
+        query per field (see `MultiMatchQueryBackend`):
+
+            search_multi_match_options = {
+                'type': 'cross_fields',
+                'operator': 'and',
+            }
+        """
+        return self.compiled_options["search_multi_match_options"]
+
+    @property
+    def prepared_multi_match_query(self):
+        """Multi match query compiled once (see `compile_options`)."""
+        return self.compiled_options["prepared_multi_match_query"]
 
     @property
     def search_args_mapping(self):
-        return {field: field for field, value in self.search_fields.items()}
+        return self.compiled_options["search_args_mapping"]
 
     @property
     def nested_search_args_mapping(self):
-        return {
-            field: field for field, value in self.search_nested_fields.items()
-        }
+        return self.compiled_options["nested_search_args_mapping"]
 
     def field_belongs_to(self, field_name):
         """Check if given filter field belongs to the backend.
@@ -82,6 +131,18 @@ class SearchFilterBackend(BaseBackend):
         return {ALL: graphene.String()}
 
     def get_search_nested_fields_tree(self, start=None, value=None):
+        """Get search nested fields tree.
+
+        See `build_search_nested_fields_tree`.
+        """
+        return self.build_search_nested_fields_tree(
+            self.search_nested_fields, start=start, value=value
+        )
+
+    @classmethod
+    def build_search_nested_fields_tree(
+        cls, search_nested_fields, start=None, value=None
+    ):
         """
         We got a prepared nested fields ,
 
@@ -117,7 +178,7 @@ class SearchFilterBackend(BaseBackend):
 
 
         """
-        source = self.search_nested_fields
+        source = search_nested_fields
         path_field_mapping = {
             option["path"]: field for field, option in source.items()
         }
@@ -183,7 +244,7 @@ class SearchFilterBackend(BaseBackend):
             global nested_input_count
             nested_input_count += 1
             return graphene.Argument(
-                type(
+                intern_type(
                     "{}{}{}{}{}".format(
                         DYNAMIC_CLASS_NAME_PREFIX,
                         to_pascal_case(self.prefix),
@@ -233,8 +294,9 @@ class SearchFilterBackend(BaseBackend):
 
             return get_graphene_argument_type(field_name, params)
 
-    def prepare_search_fields(self):
-        """Prepare search fields.
+    @classmethod
+    def compile_search_fields(cls, search_fields):
+        """Compile search fields.
 
         Possible structures:
 
@@ -287,33 +349,38 @@ class SearchFilterBackend(BaseBackend):
         :return: Filtering options.
         :rtype: dict
         """
-        filter_args = dict(self.args).get(self.prefix)
-        if not filter_args:
-            return {}
-
-        filter_fields = {}
-
-        # {'query': '', 'title': {'query': '', 'boost': 1}}
+        compiled_search_fields = {}
 
-        for field, _ in self.search_args_mapping.items():
-            filter_fields.update({field: {}})
-            options = self.search_fields.get(field)
+        for field, options in search_fields.items():
             # For constructions like 'category': 'category.raw' we shall
             # have the following:
             #
             if options is None or isinstance(options, six.string_types):
-                filter_fields.update({field: {"field": options or field}})
-            elif "field" not in options:
-                filter_fields.update({field: options})
-                filter_fields[field]["field"] = field
+                compiled_search_fields[field] = {"field": options or field}
             else:
-                filter_fields.update({field: options})
+                compiled_search_fields[field] = dict(options)
+                if "field" not in options:
+                    compiled_search_fields[field]["field"] = field
 
-        return filter_fields
+        return compiled_search_fields
 
-    def prepare_search_nested_fields(self):
+    def prepare_search_fields(self):
         """Prepare search fields.
 
+        Search fields are compiled once (see `compile_search_fields`).
+
+        :return: Search fields.
+        :rtype: graphene_elastic.utils.FrozenDict
+        """
+        filter_args = dict(self.args).get(self.prefix)
+        if not filter_args:
+            return {}
+        return self.compiled_options["prepared_search_fields"]
+
+    @classmethod
+    def compile_search_nested_fields(cls, search_nested_fields):
+        """Compile search nested fields.
+
         Possible structures:
 
         Type1
@@ -372,29 +439,93 @@ class SearchFilterBackend(BaseBackend):
         :return: Filtering options.
         :rtype: dict
         """
-        filter_args = dict(self.args).get(self.prefix)
-        if not filter_args:
-            return {}
-
-        filter_fields = {}
-        search_nested_fields = self.search_nested_fields
-        # {'query': '', 'title': {'query': '', 'boost': 1}}
-        for field, _ in self.nested_search_args_mapping.items():
-            filter_fields.update({field: {}})
-            options = deepcopy(search_nested_fields.get(field, {}))
-            if "fields" not in options:
-                options["fields"] = []
-
+        compiled_search_nested_fields = {}
+        for field, options in search_nested_fields.items():
+            options = dict(options or {})
             fields = []
-            for _field in options["fields"]:
+            for _field in options.get("fields", []):
                 if isinstance(_field, six.string_types):
                     fields.append({_field: {"field": _field}})
                 elif isinstance(_field, dict):
                     fields.append(_field)
             options["fields"] = fields
-            filter_fields.update({field: options})
+            compiled_search_nested_fields[field] = options
+
+        return compiled_search_nested_fields
 
-        return filter_fields
+    @classmethod
+    def compile_search_nested_plan(cls, search_nested_fields):
+        """Compile search nested plan.
+
+        Everything `construct_nested_search` needs, indexed by the nested
+        field name, so that requests only walk their own arguments:
+
+            search_nested_plan = {
+                'comments': {
+                    'path': 'comments',
+                    # Field options (without the `field`) by name, along
+                    # with the full name of the field
+                    'fields': {
+                        'tag': ('comments.tag', {}),
+                        'content': ('comments.content.raw', {'boost': 3}),
+                    },
+                    # Fields (`None`) and nested fields (nodes) searched
+                    # with the `query` (see `get_search_nested_fields_tree`)
+                    'tree': {
+                        'tag': None,
+                        'content': None,
+                        'author': {
+                            'name': None,
+                        },
+                    },
+                },
+                ...
+            }
+
+        :param search_nested_fields: Search nested fields.
+        :type search_nested_fields: dict
+        :return: Search nested plan.
+        :rtype: dict
+        """
+        prepared_search_nested_fields = cls.compile_search_nested_fields(
+            search_nested_fields
+        )
+        plan = {}
+        for field, options in prepared_search_nested_fields.items():
+            path = options["path"]
+            fields = {}
+            for _field in options["fields"]:
+                name = list(_field.keys())[0]
+                if name in fields:
+                    continue
+                field_options = dict(_field[name] or {})
+                fields[name] = (
+                    "{}.{}".format(path, field_options.pop(FIELD, name)),
+                    field_options,
+                )
+            plan[field] = {
+                "path": path,
+                "fields": fields,
+                "tree": cls.build_search_nested_fields_tree(
+                    search_nested_fields, start=path
+                ).get(field),
+            }
+
+        return plan
+
+    def prepare_search_nested_fields(self):
+        """Prepare search nested fields.
+
+        Search nested fields are compiled once (see
+        `compile_search_nested_fields`).
+
+        :return: Search nested fields.
+        :rtype: graphene_elastic.utils.FrozenDict
+        """
+        filter_args = dict(self.args).get(self.prefix)
+        if not filter_args:
+            return {}
+        return self.compiled_options["prepared_search_nested_fields"]
 
     def get_all_query_params(self):
         filter_args = dict(self.args).get(self.prefix)
@@ -402,6 +533,10 @@ class SearchFilterBackend(BaseBackend):
             return {}
         return filter_args
 
+    def get_search_query_params(self):
+        """Get search query params (used by the query backends)."""
+        return self.get_all_query_params()
+
     def construct_search(self):
         """Construct search.
 
@@ -478,7 +613,12 @@ class SearchFilterBackend(BaseBackend):
         search_fields = self.prepare_search_fields()
         _queries = []
         for search_field, value in all_query_params.items():
-            if search_field == ALL:
+            if search_field == ALL and self.prepared_multi_match_query:
+                # A single multi match query on all fields
+                _queries.extend(
+                    MultiMatchQueryBackend(self).construct_search()
+                )
+            elif search_field == ALL:
                 for (
                     field_name_param,
                     field_name,
@@ -489,8 +629,8 @@ class SearchFilterBackend(BaseBackend):
                     if isinstance(value, dict):
                         # For constructions like:
                         # {'title': {'value': 'Produce', 'boost': 1}}
-                        _query = value.pop(VALUE)
                         _field_options = copy(value)
+                        _query = _field_options.pop(VALUE)
                         value = _query
                         field_options.update(_field_options)
                     field_kwargs = {field: {"query": value}}
@@ -505,8 +645,8 @@ class SearchFilterBackend(BaseBackend):
                 if isinstance(value, dict):
                     # For constructions like:
                     # {'title': {'value': 'Produce', 'boost': 1}}
-                    _query = value.pop(VALUE)
                     _field_options = copy(value)
+                    _query = _field_options.pop(VALUE)
                     value = _query
                     field_options.update(_field_options)
                 field_kwargs = {field: {"query": value}}
@@ -634,12 +774,12 @@ class SearchFilterBackend(BaseBackend):
         ):
             return []
 
-        search_fields = self.prepare_search_nested_fields()
-        all_query_params = {
-            search_field: search_terms
-            for search_field, search_terms in self.get_all_query_params().items()
-            if search_field in search_fields
-        }
+        filter_args = self.get_all_query_params()
+        if not filter_args:
+            return []
+
+        # Compiled once (see `compile_search_nested_plan`)
+        plan = self.compiled_options["search_nested_plan"]
         queries = []
 
         def get_query(queries):
@@ -648,17 +788,40 @@ class SearchFilterBackend(BaseBackend):
             elif len(queries) == 1:
                 return queries[0]
 
+        def get_all_search_terms(tree, query):
+            """Search terms of the fields searched with the `query`."""
+            return {
+                field: (
+                    {VALUE: query}
+                    if node is None
+                    else get_all_search_terms(node, query)
+                )
+                for field, node in tree.items()
+            }
+
+        def clean_query_params(query_params):
+            """Query params without the `query` (at any depth)."""
+            return {
+                lookup: (
+                    clean_query_params(value)
+                    if isinstance(value, dict)
+                    else value
+                )
+                for lookup, value in query_params.items()
+                if lookup != ALL
+            }
+
         def recursive_construct_search(
             query_params, current_search=None, searched_path=None
         ):
             _queries = []
             for search_field, search_terms in query_params.items():
-                if search_field in search_fields:
+                if search_field in plan:
                     # dive in nested field
                     __queries = recursive_construct_search(
                         search_terms,
                         current_search=search_field,
-                        searched_path=search_fields[search_field]["path"],
+                        searched_path=plan[search_field]["path"],
                     )
                     query = get_query(__queries)
 
@@ -666,21 +829,23 @@ class SearchFilterBackend(BaseBackend):
                         queries.append(
                             Q(
                                 "nested",
-                                path=search_fields[search_field]["path"],
+                                path=plan[search_field]["path"],
                                 query=query
                             )
                         )
                 elif search_field == ALL:
-                    # query all fields
-                    search_terms = self.get_search_nested_fields_tree(
-                        start=searched_path, value={VALUE: search_terms}
+                    # query all fields, unless given explicitly
+                    search_terms = get_all_search_terms(
+                        plan[current_search]["tree"], search_terms
                     )
-                    cleaned_query_params = self.clean_all_query_params()
+                    cleaned_query_params = filter_args
                     for path in searched_path.split("."):
                         cleaned_query_params = cleaned_query_params[path]
-                    search_terms[current_search].update(cleaned_query_params)
+                    search_terms.update(
+                        clean_query_params(cleaned_query_params)
+                    )
                     __queries = recursive_construct_search(
-                        search_terms[current_search],
+                        search_terms,
                         current_search=current_search,
                         searched_path=searched_path,
                     )
@@ -690,30 +855,29 @@ class SearchFilterBackend(BaseBackend):
                         queries.append(
                             Q(
                                 "nested",
-                                path=search_fields[current_search]["path"],
+                                path=plan[current_search]["path"],
                                 query=query
                             )
                         )
                 else:
                     # normal field in a nested field
-                    path = search_fields[current_search]["path"]
-                    field_option = deepcopy(
-                        next(
-                            field[search_field]
-                            for field in search_fields[current_search]["fields"]
-                            if list(field.keys())[0] == search_field
-                        )
-                    )
-                    field = "{}.{}".format(path, field_option.pop("field"))
-                    query = search_terms.pop(VALUE)
-                    field_kwargs = {field: {"query": query}}
-                    if field_option:
-                        field_kwargs[field].update(field_option)
+                    field, field_options = \
+                        plan[current_search]["fields"][search_field]
+                    field_kwargs = {field: {"query": search_terms[VALUE]}}
+                    if field_options:
+                        field_kwargs[field].update(field_options)
                     _queries.append(Q("match", **field_kwargs))
 
             return _queries
 
-        recursive_construct_search(all_query_params, None)
+        recursive_construct_search(
+            {
+                search_field: search_terms
+                for search_field, search_terms in filter_args.items()
+                if search_field in plan
+            },
+            None
+        )
         return queries
 
     def filter(self, queryset):
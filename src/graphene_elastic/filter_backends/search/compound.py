@@ -1,5 +1,4 @@
 """Compound search backend."""
-import copy
 import graphene
 
 from stringcase import pascalcase as to_pascal_case
@@ -16,6 +15,9 @@ from .query_backends import (
     MatchQueryBackend,
     # NestedQueryBackend,
 )
+from .query_backends.base import BaseSearchQueryBackend
+from ...interning import intern_type
+from ...utils import freeze
 
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
@@ -35,19 +37,40 @@ class CompoundSearchFilterBackend(BaseSearchFilterBackend):
         # NestedQueryBackend,
     ]
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        search_fields = options.get('search_fields', {})
+        return freeze({
+            'search_fields': search_fields,
+            'search_args_mapping': {
+                field: field for field, value in search_fields.items()
+            },
+            'prepared_search_fields':
+                BaseSearchQueryBackend.compile_search_fields(search_fields),
+        })
+
     @property
     def search_fields(self):
         """Search filter fields."""
-        search_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            'filter_backend_options',
-            {}
-        ).get('search_fields', {})
-        return copy.deepcopy(search_fields)
+        return self.compiled_options['search_fields']
 
     @property
     def search_args_mapping(self):
-        return {field: field for field, value in self.search_fields.items()}
+        return self.compiled_options['search_args_mapping']
+
+    @property
+    def prepared_search_fields(self):
+        """Prepared search fields.
+
+        Search fields are compiled once (see
+        `BaseSearchQueryBackend.compile_search_fields`).
+        """
+        return self.compiled_options['prepared_search_fields']
 
     def field_belongs_to(self, field_name):
         """Check if given filter field belongs to the backend.
@@ -82,7 +105,7 @@ class CompoundSearchFilterBackend(BaseSearchFilterBackend):
             BOOST: graphene.Int(),  # Boost the given field with. Optional.
         }
         return graphene.Argument(
-            type(
+            intern_type(
                 "{}{}{}{}".format(
                     DYNAMIC_CLASS_NAME_PREFIX,
                     to_pascal_case(self.prefix),
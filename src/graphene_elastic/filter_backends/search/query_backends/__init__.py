@@ -6,7 +6,7 @@ from .base import BaseSearchQueryBackend
 from .match import MatchQueryBackend
 from .match_phrase import MatchPhraseQueryBackend
 from .match_phrase_prefix import MatchPhrasePrefixQueryBackend
-# from .multi_match import MultiMatchQueryBackend
+from .multi_match import MultiMatchQueryBackend
 # from .nested import NestedQueryBackend
 # from .simple_query_string import SimpleQueryStringQueryBackend
 
@@ -18,7 +18,7 @@ __all__ = (
     'MatchQueryBackend',
     'MatchPhraseQueryBackend',
     'MatchPhrasePrefixQueryBackend',
-    # 'MultiMatchQueryBackend',
+    'MultiMatchQueryBackend',
     # 'NestedQueryBackend',
     # 'SimpleQueryStringQueryBackend',
 )
@@ -28,8 +28,9 @@ class BaseSearchQueryBackend(object):
     def search_fields(self) -> dict:
         return self.search_backend.search_fields
 
-    def prepare_search_fields(self):
-        """Prepare search fields.
+    @classmethod
+    def compile_search_fields(cls, search_fields):
+        """Compile search fields.
 
         Possible structures:
 
@@ -81,33 +82,43 @@ class BaseSearchQueryBackend(object):
         :return: Filtering options.
         :rtype: dict
         """
-        filter_args = dict(self.args).get(self.prefix)
-        if not filter_args:
-            return {}
+        compiled_search_fields = {}
 
-        filter_fields = {}
-
-        # {'query': '', 'title': {'query': '', 'boost': 1}}
-
-        for field, _ in self.search_args_mapping.items():
-            filter_fields.update({field: {}})
-            options = self.search_fields.get(field)
+        for field, options in search_fields.items():
             # For constructions like 'category': 'category.raw' we shall
             # have the following:
             #
             if options is None or isinstance(options, six.string_types):
-                filter_fields.update(
-                    {
-                        field: {"field": options or field}
-                    }
-                )
-            elif "field" not in options:
-                filter_fields.update({field: options})
-                filter_fields[field]["field"] = field
+                compiled_search_fields[field] = {"field": options or field}
             else:
-                filter_fields.update({field: options})
+                compiled_search_fields[field] = dict(options)
+                if "field" not in options:
+                    compiled_search_fields[field]["field"] = field
+
+        return compiled_search_fields
 
-        return filter_fields
+    def prepare_search_fields(self):
+        """Prepare search fields.
+
+        If the search backend has the search fields compiled already
+        (`prepared_search_fields`), they are used. Otherwise, search fields
+        are compiled on the fly (see `compile_search_fields`).
+
+        :return: Search fields.
+        :rtype: dict
+        """
+        filter_args = dict(self.args).get(self.prefix)
+        if not filter_args:
+            return {}
+
+        prepared_search_fields = getattr(
+            self.search_backend,
+            'prepared_search_fields',
+            None
+        )
+        if prepared_search_fields is not None:
+            return prepared_search_fields
+        return self.compile_search_fields(self.search_fields)
 
     def construct_search(self):
         """Construct search.
@@ -37,8 +37,8 @@ class MatchQueryBackend(BaseSearchQueryBackend):
                     if isinstance(value, dict):
                         # For constructions like:
                         # {'title': {'value': 'Produce', 'boost': 1}}
-                        _query = value.pop(VALUE)
                         _field_options = copy.copy(value)
+                        _query = _field_options.pop(VALUE)
                         value = _query
                         field_options.update(_field_options)
                     field_kwargs = {field: {"query": value}}
@@ -53,8 +53,8 @@ class MatchQueryBackend(BaseSearchQueryBackend):
                 if isinstance(value, dict):
                     # For constructions like:
                     # {'title': {'value': 'Produce', 'boost': 1}}
-                    _query = value.pop(VALUE)
                     _field_options = copy.copy(value)
+                    _query = _field_options.pop(VALUE)
                     value = _query
                     field_options.update(_field_options)
                 field_kwargs = {field: {"query": value}}
@@ -38,8 +38,8 @@ class MatchPhrasePrefixQueryBackend(BaseSearchQueryBackend):
                     if isinstance(value, dict):
                         # For constructions like:
                         # {'title': {'value': 'Produce', 'boost': 1}}
-                        _query = value.pop(VALUE)
                         _field_options = copy.copy(value)
+                        _query = _field_options.pop(VALUE)
                         value = _query
                         field_options.update(_field_options)
                     field_kwargs = {field: {"query": value}}
@@ -54,8 +54,8 @@ class MatchPhrasePrefixQueryBackend(BaseSearchQueryBackend):
                 if isinstance(value, dict):
                     # For constructions like:
                     # {'title': {'value': 'Produce', 'boost': 1}}
-                    _query = value.pop(VALUE)
                     _field_options = copy.copy(value)
+                    _query = _field_options.pop(VALUE)
                     value = _query
                     field_options.update(_field_options)
                 field_kwargs = {field: {"query": value}}
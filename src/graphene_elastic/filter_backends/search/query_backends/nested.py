@@ -25,6 +25,20 @@ class NestedQueryBackend(BaseSearchQueryBackend):
     def search_fields(self) -> dict:
         return getattr('search_nested_fields', self.search_backend, {})
 
+    def prepare_search_fields(self):
+        """Prepare search fields.
+
+        Nested search fields are not the search fields of the search
+        backend, so they are compiled on the fly.
+
+        :return: Search fields.
+        :rtype: dict
+        """
+        filter_args = dict(self.args).get(self.prefix)
+        if not filter_args:
+            return {}
+        return self.compile_search_fields(self.search_fields)
+
     def construct_search(self):
         """Construct search.
 
@@ -91,8 +105,8 @@ class NestedQueryBackend(BaseSearchQueryBackend):
                         if isinstance(value, dict):
                             # For constructions like:
                             # {'title': {'value': 'Produce', 'boost': 1}}
-                            _query = value.pop(VALUE)
                             _field_options = copy.copy(value)
+                            _query = _field_options.pop(VALUE)
                             value = _query
                             field_options.update(_field_options)
 
@@ -131,8 +145,8 @@ class NestedQueryBackend(BaseSearchQueryBackend):
                     if isinstance(value, dict):
                         # For constructions like:
                         # {'title': {'value': 'Produce', 'boost': 1}}
-                        _query = value.pop(VALUE)
                         _field_options = copy.copy(value)
+                        _query = _field_options.pop(VALUE)
                         value = _query
                         field_options.update(_field_options)
 
@@ -1,4 +1,4 @@
-from copy import copy, deepcopy
+from copy import copy
 import operator
 
 import graphene
@@ -8,6 +8,7 @@ from anysearch.search_dsl.query import Q
 from stringcase import pascalcase as to_pascal_case
 
 from ..base import BaseBackend
+from ...utils import freeze
 from ...constants import (
     DYNAMIC_CLASS_NAME_PREFIX,
     ALL,
@@ -26,6 +27,22 @@ class QueryStringBackend(BaseBackend):
     prefix = "query_string"
     has_query_fields = True
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        query_string_options = options.get("query_string_options", {})
+        query_options = dict(query_string_options)
+        fields = query_options.pop("fields", [])
+        return freeze({
+            "query_string_options": query_string_options,
+            "query_options": query_options,
+            "fields": fields,
+        })
+
     @property
     def query_string_options(self):
         """Query string options.
@@ -41,12 +58,7 @@ class QueryStringBackend(BaseBackend):
 
         For list of all options: https://www.elastic.co/guide/en/elasticsearch/reference/current/query-dsl-simple-query-string-query.html
         """  # NOQA
-        query_string_options = getattr(
-            self.connection_field.type._meta.node._meta,
-            "filter_backend_options",
-            {},
-        ).get("query_string_options", {})
-        return deepcopy(query_string_options)
+        return self.compiled_options["query_string_options"]
 
     def get_backend_query_fields(
         self, items, is_filterable_func, get_type_func
@@ -66,8 +78,8 @@ class QueryStringBackend(BaseBackend):
         :return:
         """
 
-        options = self.query_string_options
-        fields = options.pop("fields", [])
+        options = self.compiled_options["query_options"]
+        fields = self.compiled_options["fields"]
         query = self.get_all_query_params()
         if query:
             queryset = queryset.query(
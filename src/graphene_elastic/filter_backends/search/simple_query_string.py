@@ -1,4 +1,4 @@
-from copy import copy, deepcopy
+from copy import copy
 import operator
 
 import graphene
@@ -8,6 +8,7 @@ from anysearch.search_dsl.query import Q
 from stringcase import pascalcase as to_pascal_case
 
 from ..base import BaseBackend
+from ...utils import freeze
 from ...constants import (
     DYNAMIC_CLASS_NAME_PREFIX,
     ALL,
@@ -26,6 +27,24 @@ class SimpleQueryStringBackend(BaseBackend):
     prefix = "simple_query_string"
     has_query_fields = True
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        simple_query_string_options = options.get(
+            "simple_query_string_options", {}
+        )
+        query_options = dict(simple_query_string_options)
+        fields = query_options.pop("fields", [])
+        return freeze({
+            "simple_query_string_options": simple_query_string_options,
+            "query_options": query_options,
+            "fields": fields,
+        })
+
     @property
     def simple_query_string_options(self):
         """Simple query string options.
@@ -42,12 +61,7 @@ class SimpleQueryStringBackend(BaseBackend):
         For list of all options: 
         https://www.elastic.co/guide/en/elasticsearch/reference/current/query-dsl-simple-query-string-query.html
         """  # NOQA
-        simple_query_string_options = getattr(
-            self.connection_field.type._meta.node._meta,
-            "filter_backend_options",
-            {},
-        ).get("simple_query_string_options", {})
-        return deepcopy(simple_query_string_options)
+        return self.compiled_options["simple_query_string_options"]
 
     def get_backend_query_fields(
         self, items, is_filterable_func, get_type_func
@@ -66,8 +80,8 @@ class SimpleQueryStringBackend(BaseBackend):
         :param queryset:
         :return:
         """
-        options = self.simple_query_string_options
-        fields = options.pop("fields", [])
+        options = self.compiled_options["query_options"]
+        fields = self.compiled_options["fields"]
         query = self.get_all_query_params()
         if query:
             queryset = queryset.query(
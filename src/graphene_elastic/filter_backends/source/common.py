@@ -1,10 +1,10 @@
-from copy import deepcopy
-import enum
 import graphene
 from stringcase import pascalcase as to_pascal_case
 
 from ..base import BaseBackend
 from ...constants import DYNAMIC_CLASS_NAME_PREFIX
+from ...interning import intern_enum
+from ...utils import freeze
 
 __title__ = 'graphene_elastic.filter_backends.ordering.common'
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
@@ -21,15 +21,21 @@ class SourceFilterBackend(BaseBackend):
     prefix = 'source'
     has_query_fields = True
 
+    @classmethod
+    def compile_options(cls, options):
+        """Compile options.
+
+        :param options:
+        :return:
+        """
+        return freeze({
+            'source_fields': options.get('source_fields', {}),
+        })
+
     @property
     def source_fields(self):
         """Source filter fields."""
-        source_fields = getattr(
-            self.connection_field.type._meta.node._meta,
-            'filter_backend_options',
-            {}
-        ).get('source_fields', {})
-        return deepcopy(source_fields)
+        return self.compiled_options['source_fields']
 
     def get_backend_query_fields(self,
                                  items,
@@ -51,15 +57,13 @@ class SourceFilterBackend(BaseBackend):
         return {
             self.prefix: graphene.Argument(
                 graphene.List(
-                    graphene.Enum.from_enum(
-                        enum.Enum(
-                            "{}{}{}BackendEnum".format(
-                                DYNAMIC_CLASS_NAME_PREFIX,
-                                to_pascal_case(self.prefix),
-                                self.connection_field.type.__name__
-                            ),
-                            params
-                        )
+                    intern_enum(
+                        "{}{}{}BackendEnum".format(
+                            DYNAMIC_CLASS_NAME_PREFIX,
+                            to_pascal_case(self.prefix),
+                            self.connection_field.type.__name__
+                        ),
+                        params
                     )
                 )
             )
@@ -88,11 +92,10 @@ class SourceFilterBackend(BaseBackend):
         """
         source_args = dict(self.args).get(self.prefix, [])
 
-        source_fields = dict(self.source_fields)
-
         if source_args:
-            return source_args
-        return source_fields
+            # Arguments are frozen (lists are tuples)
+            return list(source_args)
+        return self.source_fields
 
     def filter(self, queryset):
         """Filter.
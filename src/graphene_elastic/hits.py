@@ -0,0 +1,214 @@
+"""
+Raw hits.
+
+By default, each hit of the search response is materialized into a
+``Document`` (with ``AttrDict`` and ``AttrList`` wrappers for the inner
+objects and for the meta). With ``raw_hits`` enabled on the connection
+field, nodes are light wrappers around the raw hits (``hits.hits`` of the
+response body) instead:
+
+.. code-block:: python
+
+    class Query(graphene.ObjectType):
+
+        all_post_documents = ElasticsearchConnectionField(
+            Post,
+            raw_hits=True
+        )
+
+Fields are read straight from the ``_source`` of the hit, deserialized
+according to the document mapping (dates, numbers, booleans) and inner
+objects are wrapped lazily, only when selected. The ``id``, ``score`` and
+``highlight`` resolvers read the ``_id``, ``_score`` and ``highlight`` of the
+hit directly.
+
+Custom resolvers get the ``RawHit`` as the parent. It's not a ``Document``
+(no ``save``, ``update``, etc.), although the ``meta`` and ``to_dict`` are
+there.
+"""
+from anysearch.search_dsl import AttrDict, Field, Object
+
+__title__ = 'graphene_elastic.hits'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2019-2022 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'get_raw_hits',
+    'RawHit',
+    'RawObject',
+)
+
+# Mapping fields (by name) of the documents and inner objects, by id of the
+# document class or field. The document class (or field) is kept along,
+# so that the id is not reused.
+_FIELDS_CACHE = {}
+
+# Whether values of the field class need to be deserialized, by field class
+_DESERIALIZE_CACHE = {}
+
+
+def get_fields(owner, properties):
+    """Get mapping fields by name, cached per owner."""
+    cached = _FIELDS_CACHE.get(id(owner))
+    if cached is None or cached[0] is not owner:
+        cached = _FIELDS_CACHE[id(owner)] = (owner, dict(properties._d_))
+    return cached[1]
+
+
+def get_document_fields(document):
+    """Get mapping fields of the document class by name."""
+    if document is None:
+        return {}
+    return get_fields(
+        document,
+        document._doc_type.mapping.properties.properties
+    )
+
+
+def get_inner_fields(field):
+    """Get mapping fields of the object (or nested) field by name."""
+    return get_fields(field, field._mapping.properties.properties)
+
+
+def needs_deserialize(field):
+    """Whether the values of the field shall be deserialized.
+
+    Values of the fields not overriding the `_deserialize` (such as `Text`
+    or `Keyword`) are returned as is.
+    """
+    field_class = type(field)
+    needs = _DESERIALIZE_CACHE.get(field_class)
+    if needs is None:
+        needs = _DESERIALIZE_CACHE[field_class] = \
+            field_class._deserialize is not Field._deserialize
+    return needs
+
+
+def deserialize(field, value):
+    """Deserialize the raw value of the field."""
+    if value is None:
+        return None
+    if isinstance(field, Object):
+        inner_fields = get_inner_fields(field)
+        if isinstance(value, list):
+            return [
+                None if item is None else RawObject(item, inner_fields)
+                for item in value
+            ]
+        return RawObject(value, inner_fields)
+    if needs_deserialize(field):
+        return field.deserialize(value)
+    return value
+
+
+class RawObject(object):
+    """Inner object of a raw hit.
+
+    Values are read from the raw dictionary and deserialized on access.
+    Missing (though mapped) fields are empty, as they are in documents.
+    """
+
+    __slots__ = ('_d_', '_fields')
+
+    def __init__(self, data, fields):
+        """Constructor.
+
+        :param data: Raw data.
+        :param fields: Mapping fields by name.
+        :type data: dict
+        :type fields: dict
+        """
+        self._d_ = data
+        self._fields = fields
+
+    def __getattr__(self, name):
+        # Slots not set yet (for instance, on copy) and special names
+        if name.startswith('__') or name in RawObject.__slots__:
+            raise AttributeError(name)
+
+        field = self._fields.get(name)
+        try:
+            value = self._d_[name]
+        except KeyError:
+            if field is None:
+                raise AttributeError(name)
+            if field._multi:
+                return []
+            if isinstance(field, Object):
+                return RawObject({}, get_inner_fields(field))
+            return None
+
+        if field is None:
+            return value
+        return deserialize(field, value)
+
+    def to_dict(self):
+        return self._d_
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, self._d_)
+
+
+class RawHit(RawObject):
+    """Raw hit of the search response."""
+
+    __slots__ = ('hit', 'document', '_meta')
+
+    def __init__(self, hit, document=None):
+        """Constructor.
+
+        :param hit: Raw hit (item of the `hits.hits` of the response).
+        :param document: Document class.
+        :type hit: dict
+        :type document: elasticsearch_dsl.Document
+        """
+        super(RawHit, self).__init__(
+            hit.get('_source') or {},
+            get_document_fields(document)
+        )
+        self.hit = hit
+        self.document = document
+        self._meta = None
+
+    def __getattr__(self, name):
+        if name in RawHit.__slots__:
+            raise AttributeError(name)
+        return super(RawHit, self).__getattr__(name)
+
+    @property
+    def meta(self):
+        """Meta of the hit, as in documents (`id`, `score`, etc.)."""
+        if self._meta is None:
+            self._meta = AttrDict({
+                key[1:] if key.startswith('_') else key: value
+                for key, value in self.hit.items()
+                if key not in ('_source', '_fields')
+            })
+        return self._meta
+
+
+def get_raw_hits(response):
+    """Get raw hits of the search response.
+
+    :param response: Search response.
+    :type response: elasticsearch_dsl.response.Response
+    :return: List of raw hits.
+    :rtype: list
+    """
+    hits = response._d_.get('hits', {}).get('hits', [])
+    doc_types = [
+        doc_type
+        for doc_type in response._search._doc_type
+        if hasattr(doc_type, '_matches')
+    ]
+    if len(doc_types) <= 1:
+        document = doc_types[0] if doc_types else None
+        return [RawHit(hit, document) for hit in hits]
+
+    def get_document(hit):
+        for doc_type in doc_types:
+            if doc_type._matches(hit):
+                return doc_type
+        return None
+
+    return [RawHit(hit, get_document(hit)) for hit in hits]
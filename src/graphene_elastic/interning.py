@@ -0,0 +1,164 @@
+"""
+Interning of the dynamic types.
+
+Object types of the object (and nested) fields and the input types (and
+enums) of the filter backends are generated per document field and per
+connection. Most of them have the very same shape (for instance, the
+lookups of every integer field). Types are interned by their structural
+signature (base classes along with the names, order and types of their
+fields), so that identical shapes share a single GraphQL type. The name of
+the type created first is kept, thus names of the types depend on the order
+types are created in.
+
+Interning is off by default (names of the types are then unique per
+connection, as before). Set the ``INTERN_TYPES`` setting to True to turn it
+on.
+
+Types having fields which can't be signed (for instance, default values
+which are not hashable) are not interned.
+"""
+import enum
+from types import FunctionType, MethodType
+
+import graphene
+from graphene.utils.orderedtype import OrderedType
+
+from .settings import graphene_settings
+
+__title__ = 'graphene_elastic.interning'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2019-2022 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'clear_interned_types',
+    'get_signature',
+    'intern_enum',
+    'intern_type',
+)
+
+# Interned types by signature
+_INTERNED_TYPES = {}
+
+# Values signed as is
+_PLAIN_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    type,
+    FunctionType,
+    MethodType,
+)
+
+
+def get_signature(value):
+    """Get structural signature of the value.
+
+    Classes (graphene types included) and functions are signed by identity,
+    mounted and unmounted graphene types (``Field``, ``Argument``,
+    ``String()``, ``List(...)``, etc.) by their class and attributes
+    (except for the creation counter and the special attributes, which do
+    not make it to the schema).
+
+    :param value: Value.
+    :return: Hashable signature.
+    :raise TypeError: If the value can't be signed.
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return value
+
+    if isinstance(value, OrderedType):
+        return (type(value),) + tuple(
+            (key, get_signature(item))
+            for key, item in vars(value).items()
+            if key != 'creation_counter' and not key.startswith('__')
+        )
+
+    if isinstance(value, dict):
+        return tuple(
+            (key, get_signature(item)) for key, item in value.items()
+        )
+
+    if isinstance(value, (list, tuple)):
+        return tuple(get_signature(item) for item in value)
+
+    raise TypeError(
+        "Can't sign {} ({})".format(value, value.__class__.__name__)
+    )
+
+
+def get_attrs_signature(attrs):
+    """Get signature of the class attributes, in the order of the fields.
+
+    Attributes other than the fields and callables (resolvers, inner
+    classes) do not make it to the schema and are ignored.
+    """
+    # Fields are ordered by their creation counter
+    return tuple(
+        (name, get_signature(value))
+        for name, value in sorted(
+            attrs.items(),
+            key=lambda item: getattr(item[1], 'creation_counter', 0)
+        )
+        if isinstance(value, OrderedType) or callable(value)
+    )
+
+
+def intern_type(name, bases, attrs):
+    """Create the type, unless an identical one has been created before.
+
+    :param name: Name of the type.
+    :param bases: Base classes.
+    :param attrs: Class attributes (fields).
+    :type name: str
+    :type bases: tuple
+    :type attrs: dict
+    :return: Type.
+    """
+    if not graphene_settings.INTERN_TYPES:
+        return type(name, bases, attrs)
+
+    try:
+        signature = (tuple(bases), get_attrs_signature(attrs))
+        interned = _INTERNED_TYPES.get(signature)
+    except TypeError:
+        return type(name, bases, attrs)
+
+    if interned is None:
+        interned = _INTERNED_TYPES[signature] = type(name, bases, attrs)
+    return interned
+
+
+def intern_enum(name, members):
+    """Create the enum, unless an identical one has been created before.
+
+    :param name: Name of the enum.
+    :param members: Members (names along with values).
+    :type name: str
+    :type members: dict or iterable
+    :return: Graphene enum.
+    :rtype: graphene.Enum
+    """
+    if isinstance(members, dict):
+        members = members.items()
+    members = tuple(members)
+    if not graphene_settings.INTERN_TYPES:
+        return graphene.Enum.from_enum(enum.Enum(name, members))
+
+    try:
+        signature = (graphene.Enum, members)
+        interned = _INTERNED_TYPES.get(signature)
+    except TypeError:
+        return graphene.Enum.from_enum(enum.Enum(name, members))
+
+    if interned is None:
+        interned = _INTERNED_TYPES[signature] = graphene.Enum.from_enum(
+            enum.Enum(name, members)
+        )
+    return interned
+
+
+def clear_interned_types():
+    """Clear interned types."""
+    _INTERNED_TYPES.clear()
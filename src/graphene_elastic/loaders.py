@@ -0,0 +1,259 @@
+"""
+Batched loading.
+
+Nodes fetched by id (``node(id: ...)`` queries, ``get_node_from_global_id``)
+during the same GraphQL request are collected per document class and
+fetched with a single ``mget`` request. Duplicate ids are fetched once and
+the documents are memoized for the rest of the request.
+
+Loaders are stored on the context of the request (``info.context``), thus
+batching is only possible when a context is given. When there is no
+context, documents are fetched one by one (as before).
+
+Likewise, the count and search requests of the connection fields with
+``multi_search`` enabled are collected and made with a single ``msearch``
+request (see ``resolve_requests_batched``).
+"""
+from collections import OrderedDict
+
+from anysearch.search import TransportError
+from anysearch.search_dsl import connections
+from promise import Promise
+from promise.dataloader import DataLoader
+
+from .arrayconnection import (
+    get_total_hits,
+    REQUEST_COUNT,
+    REQUEST_HANDLERS,
+    REQUEST_SEARCH,
+)
+from .settings import graphene_settings
+
+__title__ = 'graphene_elastic.loaders'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2019-2022 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'DocumentLoader',
+    'get_document_loader',
+    'get_loaders',
+    'get_multi_search_loader',
+    'load_document',
+    'MultiSearchLoader',
+    'resolve_requests_batched',
+)
+
+# Name of the key (or attribute) of the context to store the loaders in
+CONTEXT_LOADERS_KEY = 'graphene_elastic_loaders'
+
+# Key of the multi search loader among the loaders of the request
+MULTI_SEARCH_LOADER_KEY = 'msearch'
+
+
+class DocumentLoader(DataLoader):
+    """Loads documents of the given class by id, using `mget`."""
+
+    def __init__(self, document, **kwargs):
+        """Constructor.
+
+        :param document: Document class.
+        :type document: elasticsearch_dsl.Document
+        """
+        self.document = document
+        super(DocumentLoader, self).__init__(**kwargs)
+
+    def batch_load_fn(self, keys):
+        # Documents are returned in the order of the ids given, with `None`
+        # in place of the missing ones.
+        return Promise.resolve(
+            self.document.mget(list(keys), missing='none')
+        )
+
+
+def get_loaders(context):
+    """Get the loaders of the request.
+
+    :param context: Context of the request.
+    :return: Dictionary of loaders by document class, or None if the
+        context given can't hold them.
+    :rtype: dict
+    """
+    if context is None:
+        return None
+
+    if isinstance(context, dict):
+        return context.setdefault(CONTEXT_LOADERS_KEY, {})
+
+    loaders = getattr(context, CONTEXT_LOADERS_KEY, None)
+    if loaders is None:
+        loaders = {}
+        try:
+            setattr(context, CONTEXT_LOADERS_KEY, loaders)
+        except AttributeError:
+            return None
+    return loaders
+
+
+def get_document_loader(info, document):
+    """Get the loader of the given document class for the current request.
+
+    :param info: Resolve info.
+    :param document: Document class.
+    :type info: graphql.execution.base.ResolveInfo
+    :type document: elasticsearch_dsl.Document
+    :return: Document loader or None if batching is not possible.
+    :rtype: graphene_elastic.loaders.DocumentLoader
+    """
+    if not graphene_settings.RELAY_NODE_BATCH_LOAD:
+        return None
+
+    loaders = get_loaders(getattr(info, 'context', None))
+    if loaders is None:
+        return None
+
+    loader = loaders.get(document)
+    if loader is None:
+        loader = loaders[document] = DocumentLoader(document)
+    return loader
+
+
+def load_document(info, document, id):
+    """Load document by id.
+
+    :param info: Resolve info.
+    :param document: Document class.
+    :param id: Document id.
+    :return: Promise of the document when batching is possible, the
+        document otherwise. None if not found (in both cases).
+    """
+    loader = get_document_loader(info, document)
+    if loader is None:
+        # Same as `mget(..., missing='none')` of the loader
+        return document.get(id, ignore=404)
+    return loader.load(id)
+
+
+class MultiSearchLoader(DataLoader):
+    """Makes count and search requests with a single `msearch` request.
+
+    Loads requests yielded by the connection builders (see
+    `graphene_elastic.arrayconnection.resolve_requests`) of the type
+    `REQUEST_COUNT` or `REQUEST_SEARCH`. Searches made against different
+    connections are sent as separate `msearch` requests. Counts are made as
+    searches of no hits, with the exact total tracked.
+    """
+
+    def __init__(self, **kwargs):
+        # Searches are not hashable, nothing to memoize
+        kwargs.setdefault('cache', False)
+        super(MultiSearchLoader, self).__init__(**kwargs)
+
+    @staticmethod
+    def get_body(request, search):
+        if request == REQUEST_COUNT:
+            body = search.to_dict(count=True)
+            body.update({'size': 0, 'track_total_hits': True})
+            return body
+        return search.to_dict()
+
+    @staticmethod
+    def get_result(request, search, raw):
+        response = search._response_class(search, raw)
+        if request == REQUEST_COUNT:
+            return get_total_hits(response)[0]
+        search._response = response
+        return response
+
+    def batch_load_fn(self, requests):
+        results = [None] * len(requests)
+        pending = OrderedDict()
+        for position, (request, search, cache) in enumerate(requests):
+            key = None
+            if cache is not None:
+                key = cache.make_key(search, count=request == REQUEST_COUNT)
+                cached = cache.get(key)
+                if cached is not None:
+                    results[position] = cached \
+                        if request == REQUEST_COUNT \
+                        else self.get_result(request, search, cached)
+                    continue
+            pending.setdefault(search._using, []).append(
+                (position, request, search, cache, key)
+            )
+
+        for using, items in pending.items():
+            body = []
+            for _position, request, search, _cache, _key in items:
+                header = dict(search._params)
+                if search._index:
+                    header['index'] = search._index
+                body.extend([header, self.get_body(request, search)])
+
+            responses = connections.get_connection(using).msearch(
+                body=body
+            )['responses']
+
+            for (position, request, search, cache, key), raw in zip(
+                items,
+                responses
+            ):
+                if raw.get('error'):
+                    results[position] = TransportError(
+                        'N/A', raw['error']['type'], raw['error']
+                    )
+                    continue
+                result = self.get_result(request, search, raw)
+                if cache is not None:
+                    cache.set(
+                        key,
+                        result if request == REQUEST_COUNT else raw
+                    )
+                results[position] = result
+
+        return Promise.resolve(results)
+
+
+def get_multi_search_loader(info):
+    """Get the multi search loader for the current request.
+
+    :param info: Resolve info.
+    :type info: graphql.execution.base.ResolveInfo
+    :return: Multi search loader or None if batching is not possible.
+    :rtype: graphene_elastic.loaders.MultiSearchLoader
+    """
+    loaders = get_loaders(getattr(info, 'context', None))
+    if loaders is None:
+        return None
+
+    loader = loaders.get(MULTI_SEARCH_LOADER_KEY)
+    if loader is None:
+        loader = loaders[MULTI_SEARCH_LOADER_KEY] = MultiSearchLoader()
+    return loader
+
+
+def resolve_requests_batched(requests, loader):
+    """Make the requests yielded by the connection builder.
+
+    Batched version of the
+    `graphene_elastic.arrayconnection.resolve_requests`. Counts and
+    searches are loaded with the multi search loader given, so that they
+    are made along with the requests of the other connection fields of the
+    GraphQL request. Other requests are made right away.
+
+    :param requests: Generator yielding requests.
+    :param loader: Multi search loader.
+    :type loader: graphene_elastic.loaders.MultiSearchLoader
+    :return: Promise of the value returned by the generator (the
+        connection).
+    :rtype: promise.Promise
+    """
+    def send(result):
+        try:
+            request, search, param = requests.send(result)
+        except StopIteration as stop:
+            return stop.value
+        if request in (REQUEST_COUNT, REQUEST_SEARCH):
+            return loader.load((request, search, param)).then(send)
+        return send(REQUEST_HANDLERS[request](search, param))
+
+    return Promise.resolve(send(None))
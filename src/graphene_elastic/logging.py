@@ -9,7 +9,10 @@ __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2020 Artur Barseghyan'
 __license__ = 'GPL 2.0/LGPL 2.1'
 __all__ = (
+    'add_query_trace_sink',
     'logger',
+    'remove_query_trace_sink',
+    'trace_query',
 )
 
 # Logger
@@ -42,7 +45,11 @@ def debug_json(msg, *args, **kwargs):
     a true value, e.g.
 
     logger.debug("Houston, we have a %s", "thorny problem", exc_info=1)
+
+    The `msg` is only serialized if DEBUG level is enabled.
     """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return None
     try:
         msg = json.dumps(msg)
     except Exception:
@@ -51,3 +58,71 @@ def debug_json(msg, *args, **kwargs):
 
 
 logger.debug_json = debug_json
+
+
+# Callables receiving the traced queries (see `trace_query`)
+QUERY_TRACE_SINKS = []
+
+
+def add_query_trace_sink(sink):
+    """Add query trace sink.
+
+    The sink is called with the name of the event (such as "queryset" or
+    "search") and the body of the search (as dict), for each traced query.
+
+    Sample usage:
+
+        def print_query(event, body):
+            print(event, body)
+
+        add_query_trace_sink(print_query)
+
+    :param sink: Callable accepting `event` and `body` arguments.
+    :return: The sink given (so that it could be used as a decorator).
+    """
+    if sink not in QUERY_TRACE_SINKS:
+        QUERY_TRACE_SINKS.append(sink)
+    return sink
+
+
+def remove_query_trace_sink(sink):
+    """Remove query trace sink.
+
+    :param sink:
+    :return:
+    """
+    if sink in QUERY_TRACE_SINKS:
+        QUERY_TRACE_SINKS.remove(sink)
+
+
+def trace_query(search, event="search"):
+    """Log the search body (at DEBUG level) and pass it to the trace sinks.
+
+    The search is only serialized if DEBUG level is enabled or any trace
+    sink is attached.
+
+    :param search: Search.
+    :param event: Name of the event.
+    :type search: elasticsearch_dsl.search.Search
+    :type event: str
+    :return:
+    """
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if not (debug or QUERY_TRACE_SINKS):
+        return None
+
+    try:
+        body = search.to_dict()
+    except Exception as err:
+        logger.debug(err)
+        return None
+
+    if debug:
+        debug_json(body)
+
+    for sink in list(QUERY_TRACE_SINKS):
+        # A faulty sink shall never break the search
+        try:
+            sink(event, body)
+        except Exception as err:
+            logger.exception(err)
@@ -1,3 +1,5 @@
+from .utils import get_document_dependencies
+
 __title__ = "graphene_elastic.registry"
 __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2019-2022 Artur Barseghyan"
@@ -14,6 +16,8 @@ class Registry(object):
     def __init__(self):
         self._registry = {}
         self._field_registry = {}
+        # Types by the documents their fields refer to
+        self._dependents = {}
 
     def register(self, cls):
         from .types import ElasticsearchObjectType
@@ -27,20 +31,31 @@ class Registry(object):
         assert (
             cls._meta.registry == self
         ), "Registry for a document have to match."
-        self._registry[cls._meta.document] = cls
+        document = cls._meta.document
+        self._registry[document] = cls
+
+        for dependency in get_document_dependencies(document):
+            dependents = self._dependents.setdefault(dependency, [])
+            if cls not in dependents:
+                dependents.append(cls)
 
-        # Rescan all fields
-        for document, cls in self._registry.items():
-            cls.rescan_fields()
+        # Rescan fields of the types referring to the document registered
+        for dependent in self._dependents.get(document, ()):
+            dependent.rescan_fields()
 
     def get_type_for_document(self, document):
         return self._registry.get(document)
 
     def register_converted_field(self, field, converted):
-        self._field_registry[field] = converted
+        # Mapping fields are not hashable. The field is kept along, so that
+        # its id is not reused.
+        self._field_registry[id(field)] = (field, converted)
 
     def get_converted_field(self, field):
-        return self._field_registry.get(field)
+        registered = self._field_registry.get(id(field))
+        if registered is None or registered[0] is not field:
+            return None
+        return registered[1]
 
 
 registry = None
@@ -14,9 +14,9 @@ from collections import (
 # from graphql_relay import connection_from_list
 
 from graphene.types import (
-    # Boolean,
+    Boolean,
     Enum,
-    # Int,
+    Int,
     Interface,
     List,
     NonNull,
@@ -150,6 +150,27 @@ class Connection(ObjectType):
                         description="Contains the nodes in this connection.",
                     ),
                 ),
+                (
+                    "total_count",
+                    Field(
+                        Int,
+                        name="totalCount",
+                        required=False,
+                        description="Total number of items in this "
+                                    "connection. Might be a lower bound "
+                                    "(see `totalCountExact`).",
+                    ),
+                ),
+                (
+                    "total_count_exact",
+                    Field(
+                        Boolean,
+                        name="totalCountExact",
+                        required=False,
+                        description="Whether the `totalCount` is exact or "
+                                    "a lower bound.",
+                    ),
+                ),
                 # TODO: Construct this dynamically from the filter backends.
                 (
                     "facets",
@@ -0,0 +1,251 @@
+"""
+Inspection of the GraphQL selection.
+
+Source fields
+-------------
+Hits ship their full document (``_source``) by default, even if only a
+couple of fields are selected. The connection field inspects the selection
+under ``edges { node { ... } }`` and maps the selected fields back to the
+document paths, so that only those are fetched:
+
+.. code-block:: javascript
+
+    query {
+      allPostDocuments {
+        edges {
+          node {
+            id
+            title
+            comments {
+              author {
+                name
+              }
+            }
+          }
+        }
+      }
+    }
+
+Would fetch ``["comments.author.name", "title"]`` only. If no document
+fields are selected (for instance, only ``id``), ``_source`` is disabled
+altogether. If any of the selected fields can't be mapped (custom fields or
+fields with custom resolvers, which might need the other fields), the full
+document is fetched.
+
+Unselected parts
+----------------
+Likewise, aggregations are dropped unless ``facets`` are selected,
+highlighting is dropped unless ``highlight`` is selected on the nodes and no
+hits are fetched unless ``edges`` (or the parts of ``pageInfo`` that depend
+on the hits) are selected.
+
+Hits sorted by fields are not scored unless ``score`` is selected on the
+nodes.
+"""
+from graphene.types.structures import Structure
+from graphene.utils.str_converters import to_camel_case
+from graphql.language import ast
+
+from .utils import get_document_fields
+
+__title__ = 'graphene_elastic.selections'
+__author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
+__copyright__ = '2019-2022 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'get_field_names',
+    'get_selected_fields',
+    'get_selection_sets',
+    'get_source_fields',
+    'iter_selected_fields',
+)
+
+# Fields resolved from the hit meta (not from the `_source`)
+META_FIELDS = ('_id', 'id')
+
+# Fields of the connection (any other field might be added by a custom
+# connection class and might depend on any part of the response)
+CONNECTION_FIELDS = (
+    '__typename',
+    'edges',
+    'facets',
+    'pageInfo',
+    'totalCount',
+    'totalCountExact',
+)
+
+# Python field names by the GraphQL ones, per type (and case conversion)
+_FIELD_NAMES_CACHE = {}
+
+
+def get_field_names(graphene_type, auto_camelcase=True):
+    """Get Python names of the fields of the type, by GraphQL name.
+
+    :param graphene_type: Object type.
+    :param auto_camelcase: Whether the names are camel cased in the schema.
+    :return: Dictionary of Python field names by GraphQL field names.
+    :rtype: dict
+    """
+    key = (graphene_type, auto_camelcase)
+    names = _FIELD_NAMES_CACHE.get(key)
+    if names is None:
+        names = {}
+        for name, field in graphene_type._meta.fields.items():
+            graphql_name = getattr(field, 'name', None)
+            if not graphql_name:
+                graphql_name = to_camel_case(name) if auto_camelcase \
+                    else name
+            names[graphql_name] = name
+        _FIELD_NAMES_CACHE[key] = names
+    return names
+
+
+def iter_selected_fields(selection_set, fragments):
+    """Iterate over the fields of the selection set, including fragments.
+
+    :param selection_set: Selection set.
+    :param fragments: Fragment definitions of the operation, by name.
+    :type selection_set: graphql.language.ast.SelectionSet
+    :type fragments: dict
+    :return: Generator of fields.
+    """
+    if selection_set is None:
+        return
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            yield selection
+        elif isinstance(selection, ast.InlineFragment):
+            yield from iter_selected_fields(
+                selection.selection_set,
+                fragments
+            )
+        elif isinstance(selection, ast.FragmentSpread):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                yield from iter_selected_fields(
+                    fragment.selection_set,
+                    fragments
+                )
+
+
+def get_selection_sets(info, path):
+    """Get selection sets at the given path of the resolved field.
+
+    :param info: Resolve info.
+    :param path: GraphQL field names (for instance, ``("edges", "node")``).
+    :type info: graphql.execution.base.ResolveInfo
+    :type path: tuple
+    :return: List of selection sets.
+    :rtype: list
+    """
+    selection_sets = [
+        field_ast.selection_set for field_ast in info.field_asts
+    ]
+    for name in path:
+        selection_sets = [
+            field.selection_set
+            for selection_set in selection_sets
+            for field in iter_selected_fields(selection_set, info.fragments)
+            if field.name.value == name
+        ]
+    return selection_sets
+
+
+def get_selected_fields(info, path=()):
+    """Get names of the fields selected at the given path.
+
+    :param info: Resolve info.
+    :param path: GraphQL field names (for instance, ``("pageInfo",)``).
+    :type info: graphql.execution.base.ResolveInfo
+    :type path: tuple
+    :return: Set of GraphQL field names.
+    :rtype: set
+    """
+    return {
+        field.name.value
+        for selection_set in get_selection_sets(info, path)
+        for field in iter_selected_fields(selection_set, info.fragments)
+    }
+
+
+def unwrap_type(graphene_type):
+    """Unwrap `List` and `NonNull` structures."""
+    while isinstance(graphene_type, Structure):
+        graphene_type = graphene_type.of_type
+    return graphene_type
+
+
+def collect_object_paths(selection_set, graphene_type, prefix, info, paths,
+                         auto_camelcase):
+    """Collect paths of the fields selected on an object (inner) type.
+
+    Inner object types are generated from the mapping, thus each of their
+    fields is a document path. If the type can't be inspected, the whole
+    object is fetched.
+    """
+    if selection_set is None or not hasattr(graphene_type, '_meta'):
+        paths.add(prefix)
+        return
+
+    names = get_field_names(graphene_type, auto_camelcase)
+    for field in iter_selected_fields(selection_set, info.fragments):
+        graphql_name = field.name.value
+        if graphql_name.startswith('__'):
+            continue
+        name = names.get(graphql_name)
+        if name is None:
+            paths.add(prefix)
+            return
+        collect_object_paths(
+            field.selection_set,
+            unwrap_type(graphene_type._meta.fields[name].type),
+            "{}.{}".format(prefix, name),
+            info,
+            paths,
+            auto_camelcase
+        )
+
+
+def get_source_fields(info, node_type):
+    """Get document paths of the fields selected on the connection nodes.
+
+    :param info: Resolve info of the connection field.
+    :param node_type: Node type of the connection.
+    :type info: graphql.execution.base.ResolveInfo
+    :type node_type: graphene_elastic.ElasticsearchObjectType
+    :return: Sorted list of paths (empty if no document fields are
+        selected) or None if the full document shall be fetched.
+    :rtype: list
+    """
+    auto_camelcase = getattr(info.schema, 'auto_camelcase', True)
+    names = get_field_names(node_type, auto_camelcase)
+    document_fields = get_document_fields(node_type._meta.document)
+    meta_fields = set(META_FIELDS).union(
+        getattr(node_type._meta, 'backend_fields', ())
+    )
+    paths = set()
+    for selection_set in get_selection_sets(info, ('edges', 'node')):
+        for field in iter_selected_fields(selection_set, info.fragments):
+            graphql_name = field.name.value
+            if graphql_name.startswith('__'):
+                continue
+            name = names.get(graphql_name)
+            if name in meta_fields:
+                continue
+            # Custom fields and fields with custom resolvers might depend
+            # on any of the document fields.
+            if name not in document_fields:
+                return None
+            node_field = node_type._meta.fields[name]
+            if getattr(node_field, 'resolver', None) \
+                    or getattr(node_type, 'resolve_{}'.format(name), None):
+                return None
+            collect_object_paths(
+                field.selection_set,
+                unwrap_type(node_field.type),
+                name,
+                info,
+                paths,
+                auto_camelcase
+            )
+    return sorted(paths)
@@ -24,6 +24,43 @@ DEFAULTS = {
     "RELAY_CONNECTION_ENFORCE_FIRST_OR_LAST": False,
     # Max items returned in ConnectionFields / FilterConnectionFields
     "RELAY_CONNECTION_MAX_LIMIT": 100,
+    # Set to True to take the total number of hits from the search response
+    # instead of making a separate count request
+    "RELAY_CONNECTION_SINGLE_ROUND_TRIP": False,
+    # Set to an integer to cap the total number of hits counted (the total
+    # becomes a lower bound past the cap) or to False to not count at all.
+    # Implies single round trip when not True.
+    "RELAY_CONNECTION_TRACK_TOTAL_HITS": True,
+    # Either "offset" (`from`/`size`) or "search_after" (keyset) pagination
+    "RELAY_CONNECTION_PAGINATION_MODE": "offset",
+    # Field to break ties in sort with, when "search_after" pagination
+    # is used. Shall have unique values. Use a keyword field with doc
+    # values, `_id` (expensive on large indices) is a fallback only.
+    "RELAY_CONNECTION_SEARCH_AFTER_TIEBREAKER": "_id",
+    # How long the point in time is kept alive between pages
+    "RELAY_CONNECTION_PIT_KEEP_ALIVE": "1m",
+    # Set to True to make the requests of all connection fields of a GraphQL
+    # request with a single `msearch` request (requires a context)
+    "RELAY_CONNECTION_MULTI_SEARCH": False,
+    # Set to False to always fetch the full documents, instead of the fields
+    # selected on the nodes only
+    "RELAY_CONNECTION_SOURCE_FROM_SELECTION": True,
+    # Set to False to always request aggregations, highlighting and hits,
+    # even if `facets`, `highlight` and `edges` are not selected
+    "RELAY_CONNECTION_SKIP_UNSELECTED": True,
+    # Set to True to resolve nodes from the raw hits of the response
+    # instead of materializing them into documents
+    "RELAY_CONNECTION_RAW_HITS": False,
+    # Set to False to always score hits, even if they are sorted by fields
+    # (not by `_score`) and `score` is not selected
+    "RELAY_CONNECTION_CONSTANT_SCORE": True,
+    # Set to False to fetch nodes by id one by one instead of batching
+    # them (per request and document) into a single `mget` request
+    "RELAY_NODE_BATCH_LOAD": True,
+    # Set to True to share a single GraphQL type between the dynamic types
+    # (filter backend input types, enums and object types) of identical
+    # shape. Names of the types then depend on the order of creation.
+    "INTERN_TYPES": False,
     "LOGGING_LEVEL": logging.ERROR,
 }
 
@@ -0,0 +1,94 @@
+import unittest
+from decimal import Decimal
+
+import mock
+from anysearch.search_dsl import Search
+from graphene.test import Client
+from schema import schema
+
+from ..filter_backends.base import BaseBackend
+from ..utils import FrozenDict
+
+__title__ = 'graphene_elastic.tests.test_frozen_args'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('FrozenArgsTest',)
+
+QUERY = """
+query {
+  allPostDocuments(
+    search:{title:{value:"alice", boost:2}, content:{value:"bob"}},
+    filter:{
+      numViews:{range:{lower:{decimal:"10"}, upper:{decimal:"20"}}},
+      category:{terms:["a", "b"]}
+    },
+    ordering:{title:ASC}
+  ) {
+    edges {
+      node {
+        title
+        score
+      }
+    }
+  }
+}
+"""
+
+
+class FrozenArgsTest(unittest.TestCase):
+    """
+    Tests of the query arguments shared by the filter backends.
+    """
+
+    def test_shared_args(self):
+        """Test that all backends share the same frozen arguments."""
+        backend_args = []
+        searches = []
+        init = BaseBackend.__init__
+
+        def __init__(backend, connection_field, args=None):
+            init(backend, connection_field, args=args)
+            if args:
+                backend_args.append(backend.args)
+
+        def execute(search, *args, **kwargs):
+            searches.append(search.to_dict())
+            search._response = search._response_class(
+                search,
+                {'hits': {'total': {'value': 0, 'relation': 'eq'},
+                          'hits': []}}
+            )
+            return search._response
+
+        with mock.patch.object(BaseBackend, '__init__', __init__), \
+                mock.patch.object(Search, 'execute', execute), \
+                mock.patch.object(Search, 'count', return_value=0):
+            executed = Client(schema).execute(QUERY)
+
+        self.assertNotIn('errors', executed)
+        self.assertTrue(backend_args)
+        self.assertIsInstance(backend_args[0], FrozenDict)
+        for args in backend_args:
+            self.assertIs(args, backend_args[0])
+
+        # Arguments are left as they were
+        self.assertEqual(
+            backend_args[0]['search']['title'],
+            {'value': 'alice', 'boost': 2}
+        )
+
+        query = searches[0]['query']['bool']
+        self.assertIn(
+            {'match': {'title': {'query': 'alice', 'boost': 2}}},
+            query['should']
+        )
+        self.assertIn(
+            {'range': {'num_views': {'gte': Decimal('10'),
+                                     'lte': Decimal('20')}}},
+            query['filter']
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import unittest
+
+import graphene
+import mock
+from schema import schema
+
+from ..interning import intern_enum, intern_type
+from ..settings import graphene_settings
+
+__title__ = 'graphene_elastic.tests.test_interning'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('InterningTest',)
+
+
+class InterningTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.interning`` module.
+    """
+
+    def setUp(self):
+        patcher = mock.patch.object(graphene_settings, 'INTERN_TYPES', True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_identical_types(self):
+        """Test that identical shapes share the type."""
+        first = intern_type(
+            'InterningTestFirst',
+            (graphene.InputObjectType,),
+            {'interning_value': graphene.String(),
+             'interning_boost': graphene.Int()}
+        )
+        second = intern_type(
+            'InterningTestSecond',
+            (graphene.InputObjectType,),
+            {'interning_value': graphene.String(),
+             'interning_boost': graphene.Int()}
+        )
+        self.assertIs(first, second)
+        self.assertEqual(first.__name__, 'InterningTestFirst')
+
+    def test_different_types(self):
+        """Test that different shapes (or field order) are not shared."""
+        def make(name, **fields):
+            return intern_type(name, (graphene.InputObjectType,), fields)
+
+        first = make(
+            'InterningTestDifferentFirst',
+            different_value=graphene.String(),
+            different_boost=graphene.Int()
+        )
+        other_types = make(
+            'InterningTestDifferentTypes',
+            different_value=graphene.Int(),
+            different_boost=graphene.Int()
+        )
+        boost = graphene.Int()
+        other_order = make(
+            'InterningTestDifferentOrder',
+            different_value=graphene.String(),
+            different_boost=boost
+        )
+        self.assertIsNot(first, other_types)
+        self.assertIsNot(first, other_order)
+        self.assertEqual(
+            list(other_order._meta.fields),
+            ['different_boost', 'different_value']
+        )
+
+    def test_unsigned_types(self):
+        """Test that types which can't be signed are not interned."""
+        attrs = {'value': graphene.String(default_value=object())}
+        first = intern_type(
+            'InterningTestUnsignedFirst',
+            (graphene.InputObjectType,),
+            dict(attrs)
+        )
+        second = intern_type(
+            'InterningTestUnsignedSecond',
+            (graphene.InputObjectType,),
+            dict(attrs)
+        )
+        self.assertIsNot(first, second)
+
+    def test_enums(self):
+        """Test that identical enums are shared."""
+        first = intern_enum('InterningTestEnum', [('a', 'a'), ('b', 'b')])
+        second = intern_enum('InterningTestOtherEnum', {'a': 'a', 'b': 'b'})
+        third = intern_enum('InterningTestThirdEnum', [('a', 'a')])
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+
+    def test_disabled(self):
+        """Test that types are not interned unless turned on."""
+        attrs = {'disabled_value': graphene.String()}
+        with mock.patch.object(graphene_settings, 'INTERN_TYPES', False):
+            first = intern_type(
+                'InterningTestDisabledFirst',
+                (graphene.InputObjectType,),
+                dict(attrs)
+            )
+            second = intern_type(
+                'InterningTestDisabledSecond',
+                (graphene.InputObjectType,),
+                dict(attrs)
+            )
+            first_enum = intern_enum('InterningTestDisabledEnum', [('a', 'a')])
+            second_enum = intern_enum(
+                'InterningTestDisabledOtherEnum',
+                [('a', 'a')]
+            )
+        self.assertIsNot(first, second)
+        self.assertIsNot(first_enum, second_enum)
+
+    def test_schema(self):
+        """Test that names of the types are kept by default."""
+        query = schema.get_query_type()
+        filter_type = query.fields['allPostDocuments'].args['filter'].type
+        self.assertEqual(
+            filter_type.fields['category'].type.name,
+            'GrapheneElasticFilterPostConnectionCategory'
+        )
+        self.assertIsNot(
+            filter_type,
+            query.fields['cappedTotalHitsPostDocuments'].args['filter'].type,
+        )
+
+if __name__ == '__main__':
+    unittest.main()
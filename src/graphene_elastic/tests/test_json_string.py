@@ -0,0 +1,66 @@
+import datetime
+import json
+import unittest
+
+import mock
+from anysearch.search_dsl import AttrDict, AttrList
+
+from ..types import json_string
+from ..types.json_string import ElasticJSONString, to_plain, to_serializable
+
+__title__ = 'graphene_elastic.tests.test_json_string'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('ElasticJSONStringTest',)
+
+
+class ElasticJSONStringTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.types.json_string`` module.
+    """
+
+    value = AttrDict({
+        'tags': {
+            'doc_count': 3,
+            'aggs': {
+                'buckets': AttrList([
+                    {'key': 'python', 'doc_count': 2},
+                    {'key': 'django', 'doc_count': 1},
+                ]),
+            },
+        },
+        'published': (True, None, 1.5),
+        'created_at': datetime.datetime(2020, 1, 2, 3, 4, 5),
+        1: datetime.date(2020, 1, 1),
+    })
+
+    def get_expected(self, value):
+        return json.loads(json.dumps(value, default=to_serializable))
+
+    def test_to_plain(self):
+        """Test that `to_plain` matches the JSON round trip."""
+        self.assertEqual(to_plain(self.value), self.get_expected(self.value))
+        self.assertEqual(to_plain('facets'), 'facets')
+
+    def test_to_plain_deeply_nested(self):
+        """Test that deeply nested values do not hit recursion limit."""
+        value = nested = {}
+        for _ in range(5000):
+            nested['nested'] = {}
+            nested = nested['nested']
+        self.assertIsInstance(to_plain(AttrDict(value)), dict)
+
+    def test_serialize(self):
+        """Test serialize with and without `orjson`."""
+        expected = self.get_expected(self.value)
+        self.assertEqual(ElasticJSONString.serialize(self.value), expected)
+        with mock.patch.object(json_string, 'orjson', None):
+            self.assertEqual(
+                ElasticJSONString.serialize(self.value),
+                expected
+            )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,201 @@
+import unittest
+
+import mock
+from graphene.relay import Node
+from graphene.test import Client
+from graphql_relay.connection.arrayconnection import offset_to_cursor
+from anysearch.search_dsl import connections, Search
+from schema import schema
+from search_index.documents import Post as PostDocument
+
+__title__ = 'graphene_elastic.tests.test_loaders'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'DocumentLoaderTest',
+    'MultiSearchLoaderTest',
+)
+
+
+class DocumentLoaderTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.loaders`` module.
+    """
+
+    query = """
+    query {
+      first: node(id: "%(first)s") {
+        ... on Post {
+          title
+        }
+      }
+      second: node(id: "%(second)s") {
+        ... on Post {
+          title
+        }
+      }
+      again: node(id: "%(first)s") {
+        ... on Post {
+          title
+        }
+      }
+      missing: node(id: "%(missing)s") {
+        ... on Post {
+          title
+        }
+      }
+    }
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Client(schema)
+        cls.query = cls.query % {
+            'first': Node.to_global_id('Post', '1'),
+            'second': Node.to_global_id('Post', '2'),
+            'missing': Node.to_global_id('Post', '3'),
+        }
+
+    @staticmethod
+    def mget(docs, *args, **kwargs):
+        return [
+            PostDocument(meta={'id': _id}, title='Post %s' % _id)
+            if _id != '3' else None
+            for _id in docs
+        ]
+
+    def test_nodes_batched(self):
+        """Test that nodes are fetched with a single mget request."""
+        with mock.patch.object(PostDocument, 'mget', side_effect=self.mget) \
+                as mget, \
+                mock.patch.object(PostDocument, 'get') as get:
+            executed = self.client.execute(self.query, context_value={})
+
+        self.assertNotIn('errors', executed)
+        self.assertEqual(
+            executed['data'],
+            {
+                'first': {'title': 'Post 1'},
+                'second': {'title': 'Post 2'},
+                'again': {'title': 'Post 1'},
+                'missing': None,
+            }
+        )
+        # Duplicate ids are fetched once
+        mget.assert_called_once_with(['1', '2', '3'], missing='none')
+        get.assert_not_called()
+
+    def test_nodes_not_batched_without_context(self):
+        """Test that nodes are fetched one by one without context."""
+        with mock.patch.object(PostDocument, 'mget') as mget, \
+                mock.patch.object(
+                    PostDocument,
+                    'get',
+                    side_effect=lambda _id, **kwargs: self.mget([_id])[0]
+                ) as get:
+            executed = self.client.execute(self.query)
+
+        self.assertNotIn('errors', executed)
+        self.assertEqual(executed['data']['second'], {'title': 'Post 2'})
+        self.assertIsNone(executed['data']['missing'])
+        mget.assert_not_called()
+        self.assertEqual(get.call_count, 4)
+        # Missing documents are None, as with the batched requests
+        get.assert_called_with('3', ignore=404)
+
+
+class MultiSearchLoaderTest(unittest.TestCase):
+    """
+    Tests of the ``graphene_elastic.loaders.MultiSearchLoader``.
+    """
+
+    query = """
+    query {
+      first: multiSearchPostDocuments(first: 2) {
+        totalCount
+        edges {
+          node {
+            title
+          }
+        }
+      }
+      second: multiSearchPostDocuments(first: 3, after: "%s") {
+        totalCount
+        edges {
+          node {
+            title
+          }
+        }
+      }
+    }
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Client(schema)
+        cls.query = cls.query % offset_to_cursor(4)
+
+    @staticmethod
+    def msearch(body):
+        responses = []
+        for header, search in zip(body[::2], body[1::2]):
+            start = search.get('from', 0)
+            end = min(start + search.get('size', 10), 33)
+            responses.append({
+                'hits': {
+                    'total': {'value': 33, 'relation': 'eq'},
+                    'hits': [
+                        {
+                            '_index': header['index'][0],
+                            '_id': str(_id),
+                            '_source': {'title': 'Post %s' % _id},
+                        }
+                        for _id in range(start, end)
+                    ],
+                }
+            })
+        return {'responses': responses}
+
+    def test_connections_batched(self):
+        """Test that connections are fetched with msearch requests."""
+        client = mock.Mock()
+        client.msearch.side_effect = self.msearch
+        with mock.patch.object(
+            connections,
+            'get_connection',
+            return_value=client
+        ):
+            executed = self.client.execute(self.query, context_value={})
+
+        self.assertNotIn('errors', executed)
+        self.assertEqual(executed['data']['first']['totalCount'], 33)
+        edges = executed['data']['second']['edges']
+        self.assertEqual(
+            [_edge['node']['title'] for _edge in edges],
+            ['Post 5', 'Post 6', 'Post 7']
+        )
+        # One for the counts and one for the searches (instead of four)
+        self.assertEqual(client.msearch.call_count, 2)
+        counts = client.msearch.call_args_list[0][1]['body']
+        self.assertEqual(len(counts), 4)
+        self.assertEqual(counts[1], {'size': 0, 'track_total_hits': True})
+
+    def test_connections_not_batched_without_context(self):
+        """Test that connections are fetched one by one without context."""
+        client = mock.Mock()
+        with mock.patch.object(
+            connections,
+            'get_connection',
+            return_value=client
+        ), mock.patch.object(Search, 'count', return_value=33) as count, \
+                mock.patch.object(Search, 'execute') as execute:
+            self.client.execute(self.query)
+
+        client.msearch.assert_not_called()
+        self.assertEqual(count.call_count, 2)
+        self.assertEqual(execute.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
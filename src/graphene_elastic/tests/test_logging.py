@@ -0,0 +1,78 @@
+import logging
+import unittest
+
+import mock
+from anysearch.search_dsl import Search
+
+from graphene_elastic.logging import (
+    add_query_trace_sink,
+    logger,
+    remove_query_trace_sink,
+    trace_query,
+)
+
+__title__ = 'graphene_elastic.tests.test_logging'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('LoggingTest',)
+
+
+class LoggingTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.logging`` module.
+    """
+
+    def setUp(self):
+        self.search = Search(index="test").filter("term", category="a")
+        self.traced = []
+        self.sink = add_query_trace_sink(
+            lambda event, body: self.traced.append((event, body))
+        )
+        self.logging_level = logger.level
+        logger.setLevel(logging.ERROR)
+
+    def tearDown(self):
+        remove_query_trace_sink(self.sink)
+        logger.setLevel(self.logging_level)
+
+    def test_trace_query(self):
+        """Test that traced queries are passed to the sinks."""
+        trace_query(self.search, "queryset")
+        self.assertEqual(
+            self.traced,
+            [("queryset", self.search.to_dict())]
+        )
+
+    def test_trace_query_faulty_sink(self):
+        """Test that a faulty sink does not affect the other sinks."""
+        def faulty_sink(event, body):
+            raise ValueError(event)
+
+        remove_query_trace_sink(self.sink)
+        add_query_trace_sink(faulty_sink)
+        add_query_trace_sink(self.sink)
+        self.addCleanup(remove_query_trace_sink, faulty_sink)
+        with self.assertLogs(logger, logging.ERROR):
+            trace_query(self.search, "queryset")
+        self.assertEqual(
+            self.traced,
+            [("queryset", self.search.to_dict())]
+        )
+
+    def test_trace_query_no_sinks(self):
+        """Test that search is not serialized if not needed."""
+        remove_query_trace_sink(self.sink)
+        with mock.patch.object(Search, "to_dict") as to_dict:
+            trace_query(self.search)
+            to_dict.assert_not_called()
+
+        logger.setLevel(logging.DEBUG)
+        with mock.patch.object(Search, "to_dict", return_value={}) as to_dict:
+            with self.assertLogs(logger, logging.DEBUG):
+                trace_query(self.search)
+            to_dict.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+
+import mock
+from anysearch.search_dsl.query import Q
+from schema.meta.post import AbstractPostDocumentMeta
+
+from ..filter_backends import SearchFilterBackend
+
+__title__ = 'graphene_elastic.tests.test_multi_match'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('MultiMatchTest',)
+
+FIELDS = ['title^4', 'content^2', 'category']
+
+
+class MultiMatchTest(unittest.TestCase):
+    """
+    Tests of the ``search_multi_match_options`` of the
+    ``SearchFilterBackend``.
+    """
+
+    def construct_search(self, args, search_multi_match_options=None):
+        """Construct search with the given multi match options."""
+        options = {'search_fields': AbstractPostDocumentMeta.search_fields}
+        if search_multi_match_options is not None:
+            options['search_multi_match_options'] = \
+                search_multi_match_options
+        with mock.patch.object(
+            SearchFilterBackend,
+            'compiled_options',
+            new_callable=mock.PropertyMock,
+            return_value=SearchFilterBackend.compile_options(options)
+        ):
+            backend = SearchFilterBackend(None, args={'search': args})
+            return backend.construct_search()
+
+    def test_match_per_field(self):
+        """Test that by default there's a match query per field."""
+        self.assertEqual(len(self.construct_search({'query': 'python'})), 3)
+
+    def test_multi_match(self):
+        """Test that search in all fields is a single multi match query."""
+        self.assertEqual(
+            self.construct_search(
+                {'query': 'python', 'title': {'value': 'graphql'}},
+                {'type': 'cross_fields', 'operator': 'and'}
+            ),
+            [
+                Q(
+                    'multi_match',
+                    query='python',
+                    fields=FIELDS,
+                    type='cross_fields',
+                    operator='and'
+                ),
+                Q('match', title={'query': 'graphql', 'boost': 4}),
+            ]
+        )
+
+    def test_combined_fields(self):
+        """Test that the `combined_fields` type makes such a query."""
+        queries = self.construct_search(
+            {'query': 'python'},
+            {'type': 'combined_fields'}
+        )
+        self.assertEqual(
+            [query.to_dict() for query in queries],
+            [{'combined_fields': {'query': 'python', 'fields': FIELDS}}]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
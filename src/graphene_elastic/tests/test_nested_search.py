@@ -0,0 +1,96 @@
+import unittest
+
+import mock
+from anysearch.search_dsl.query import Q
+from schema.meta.post import AbstractPostDocumentMeta
+
+from ..filter_backends import SearchFilterBackend
+
+__title__ = 'graphene_elastic.tests.test_nested_search'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('NestedSearchTest',)
+
+
+class NestedSearchTest(unittest.TestCase):
+    """
+    Tests of the nested search of the ``SearchFilterBackend``.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.compiled_options = SearchFilterBackend.compile_options({
+            'search_nested_fields':
+                AbstractPostDocumentMeta.search_nested_fields,
+        })
+
+    def setUp(self):
+        patcher = mock.patch.object(
+            SearchFilterBackend,
+            'compiled_options',
+            new_callable=mock.PropertyMock,
+            return_value=self.compiled_options
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_plan(self):
+        """Test that the nested search plan is indexed by field name."""
+        plan = self.compiled_options['search_nested_plan']
+        self.assertEqual(plan['comments']['path'], 'comments')
+        self.assertEqual(
+            plan['comments']['fields'],
+            {
+                'tag': ('comments.tag', {}),
+                'content': ('comments.content.raw', {'boost': 3}),
+            }
+        )
+        self.assertEqual(
+            plan['comments']['tree'],
+            {'tag': None, 'content': None, 'author': {'name': None}}
+        )
+        self.assertEqual(
+            plan['author']['fields'],
+            {'name': ('comments.author.name.raw', {'boost': 2})}
+        )
+
+    def test_construct_nested_search(self):
+        """Test that given fields take precedence over the `query`."""
+        backend = SearchFilterBackend(None, args={
+            'search': {
+                'comments': {
+                    'query': 'python',
+                    'content': {'value': 'graphql'},
+                    'author': {},
+                },
+            },
+        })
+        self.assertEqual(
+            backend.construct_nested_search(),
+            [
+                Q(
+                    'nested',
+                    path='comments',
+                    query=(
+                        Q('match', **{'comments.tag': {'query': 'python'}})
+                        | Q('match', **{'comments.content.raw': {
+                            'query': 'graphql',
+                            'boost': 3,
+                        }})
+                    )
+                ),
+                Q(
+                    'nested',
+                    path='comments',
+                    query=Q('match', **{'comments.content.raw': {
+                        'query': 'graphql',
+                        'boost': 3,
+                    }})
+                ),
+            ]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,32 @@
+import asyncio
 import datetime
 import logging
 import unittest
 import dateutil
 import factories
+import mock
+from anysearch.search_dsl import Search
+from graphene.test import Client
+from graphql.execution.executors.asyncio import AsyncioExecutor
+from schema import schema
+from ..versions import (
+    LOOSE_ELASTICSEARCH_VERSION,
+    LOOSE_VERSION_7_0,
+    LOOSE_VERSION_7_10,
+)
 from .base import BaseGrapheneElasticTestCase
 
 __all__ = (
+    'PaginationAsyncTestCase',
+    'PaginationCachedTestCase',
+    'PaginationCappedTotalHitsTestCase',
+    'PaginationCompoundTestCase',
+    'PaginationMultiSearchTestCase',
+    'PaginationPointInTimeTestCase',
+    'PaginationSearchAfterTestCase',
+    'PaginationSingleRoundTripTestCase',
     'PaginationTestCase',
+    'SearchAfterTiebreakerTestCase',
 )
 
 logger = logging.getLogger(__name__)
@@ -249,5 +269,366 @@ class PaginationCompoundTestCase(PaginationTestCase):
     query_name = 'allReadOnlyPostDocuments'
 
 
+class PaginationSingleRoundTripTestCase(PaginationTestCase):
+
+    query_name = 'singleRoundTripPostDocuments'
+
+
+@unittest.skipIf(
+    LOOSE_ELASTICSEARCH_VERSION < LOOSE_VERSION_7_0,
+    'Capped total hits are not supported in Elasticsearch 6.x'
+)
+class PaginationCappedTotalHitsTestCase(PaginationTestCase):
+
+    query_name = 'cappedTotalHitsPostDocuments'
+
+    def __test_capped_total_count(self, first, expected_has_next_page):
+        """Test capped total count.
+
+        :param first:
+        :param expected_has_next_page:
+        :return:
+        """
+        _query = """
+        {
+          %s(first:%s) {
+            totalCount
+            totalCountExact
+            pageInfo {
+              hasNextPage
+            }
+            edges {
+              node {
+                title
+              }
+            }
+          }
+        }
+        """ % (self.query_name, first)
+        logger.info(_query)
+        executed = self.client.execute(_query)
+        data = executed['data'][self.query_name]
+        self.assertEqual(len(data['edges']), min(first, self.num_all_posts))
+        # Total is capped at 10 hits in the example schema
+        self.assertEqual(data['totalCount'], 10)
+        self.assertFalse(data['totalCountExact'])
+        self.assertEqual(
+            data['pageInfo']['hasNextPage'],
+            expected_has_next_page
+        )
+
+    def test_all(self):
+        super(PaginationCappedTotalHitsTestCase, self).test_all()
+
+        with self.subTest('Test capped total count, more hits available'):
+            self.__test_capped_total_count(
+                first=12,
+                expected_has_next_page=True
+            )
+
+        with self.subTest('Test capped total count, all hits fetched'):
+            self.__test_capped_total_count(
+                first=self.num_all_posts,
+                expected_has_next_page=False
+            )
+
+
+class PaginationSearchAfterTestCase(PaginationTestCase):
+
+    query_name = 'searchAfterPostDocuments'
+
+    def __test_search_after_pagination(self, first):
+        """Test walking through all pages using `after` cursors.
+
+        :param first:
+        :return:
+        """
+        _query = """
+        {
+          %s(first:%s%s, ordering:{numViews:DESC}) {
+            pageInfo {
+              endCursor
+              hasNextPage
+            }
+            edges {
+              cursor
+              node {
+                id
+                numViews
+              }
+            }
+          }
+        }
+        """
+        ids = []
+        num_views = []
+        after = ''
+        while True:
+            __query = _query % (self.query_name, first, after)
+            logger.info(__query)
+            executed = self.client.execute(__query)
+            data = executed['data'][self.query_name]
+            self.assertLessEqual(len(data['edges']), first)
+            for edge in data['edges']:
+                ids.append(edge['node']['id'])
+                num_views.append(edge['node']['numViews'])
+            if not data['pageInfo']['hasNextPage']:
+                break
+            after = ', after:"{}"'.format(data['pageInfo']['endCursor'])
+
+        self.assertEqual(len(ids), self.num_all_posts)
+        self.assertEqual(len(set(ids)), self.num_all_posts)
+        self.assertEqual(num_views, sorted(num_views, reverse=True))
+
+    def __test_search_after_backward_pagination(self):
+        """Test backward pagination is not supported.
+
+        :return:
+        """
+        _query = """
+        {
+          %s(last:5) {
+            edges {
+              cursor
+            }
+          }
+        }
+        """ % self.query_name
+        logger.info(_query)
+        executed = self.client.execute(_query)
+        self.assertIn('errors', executed)
+        self.assertIn('`first`', executed['errors'][0]['message'])
+
+    def test_all(self):
+        super(PaginationSearchAfterTestCase, self).test_all()
+
+        with self.subTest('Test walking through all pages'):
+            self.__test_search_after_pagination(first=7)
+
+        with self.subTest('Test backward pagination is not supported'):
+            self.__test_search_after_backward_pagination()
+
+
+@unittest.skipIf(
+    LOOSE_ELASTICSEARCH_VERSION < LOOSE_VERSION_7_10,
+    'Point in time requires Elasticsearch 7.10 or later'
+)
+class PaginationPointInTimeTestCase(PaginationSearchAfterTestCase):
+
+    query_name = 'pointInTimePostDocuments'
+
+
+class PaginationCachedTestCase(PaginationTestCase):
+
+    query_name = 'cachedPostDocuments'
+
+    def setUp(self):
+        from schema.post.object_type import CachedPost
+        CachedPost._meta.result_cache.clear()
+        super(PaginationCachedTestCase, self).setUp()
+
+    def __test_result_cache(self):
+        """Test that repeated queries are served from the cache.
+
+        :return:
+        """
+        _query = """
+        {
+          %s(first:12, filter:{category:{value:"Elastic"}}) {
+            pageInfo {
+              hasNextPage
+            }
+            edges {
+              node {
+                title
+              }
+            }
+          }
+        }
+        """ % self.query_name
+        logger.info(_query)
+        executed = self.client.execute(_query)
+        with mock.patch.object(Search, 'execute') as execute, \
+                mock.patch.object(Search, 'count') as count:
+            executed_cached = self.client.execute(_query)
+            execute.assert_not_called()
+            count.assert_not_called()
+
+        self.assertEqual(executed, executed_cached)
+        self.assertEqual(
+            len(executed['data'][self.query_name]['edges']),
+            12
+        )
+
+    def test_all(self):
+        super(PaginationCachedTestCase, self).test_all()
+
+        with self.subTest('Test result cache'):
+            self.__test_result_cache()
+
+
+class PaginationAsyncTestCase(PaginationTestCase):
+
+    query_name = 'asyncPostDocuments'
+
+    @classmethod
+    def setUpClass(cls):
+        super(PaginationAsyncTestCase, cls).setUpClass()
+        cls.loop = asyncio.new_event_loop()
+        cls.client = Client(
+            schema,
+            executor=AsyncioExecutor(loop=cls.loop)
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.loop.close()
+        super(PaginationAsyncTestCase, cls).tearDownClass()
+
+    def __test_max_limit(self):
+        """Test that requests over the limit are rejected before searching.
+
+        :return:
+        """
+        _query = """
+        {
+          %s(first:101) {
+            edges {
+              node {
+                title
+              }
+            }
+          }
+        }
+        """ % self.query_name
+        logger.info(_query)
+        with mock.patch.object(Search, 'execute') as execute, \
+                mock.patch.object(Search, 'count') as count:
+            executed = self.client.execute(_query)
+            execute.assert_not_called()
+            count.assert_not_called()
+
+        self.assertIn('errors', executed)
+        self.assertIn(
+            'exceeds the `first` limit of 100 records',
+            executed['errors'][0]['message']
+        )
+
+    def test_multi_search_not_supported(self):
+        """Test that multi search is rejected by the asynchronous field."""
+        from schema.post.object_type import Post
+        from ..async_fields import AsyncElasticsearchConnectionField
+
+        with self.assertRaises(AssertionError):
+            AsyncElasticsearchConnectionField(Post, multi_search=True)
+
+    def test_all(self):
+        super(PaginationAsyncTestCase, self).test_all()
+
+        with self.subTest('Test max limit'):
+            self.__test_max_limit()
+
+
+class SearchAfterTiebreakerTestCase(unittest.TestCase):
+    """Tests of the `search_after_tiebreaker` of the connection field."""
+
+    def test_id_tiebreaker_warning(self):
+        """Test that the `_id` tiebreaker is warned about."""
+        from schema.post.object_type import SearchAfterPost
+        from ..fields import ElasticsearchConnectionField
+        from ..logging import logger as graphene_elastic_logger
+
+        with mock.patch.object(graphene_elastic_logger, 'warning') as warning:
+            ElasticsearchConnectionField(
+                SearchAfterPost,
+                pagination_mode='search_after'
+            )
+            self.assertEqual(warning.call_count, 1)
+
+            ElasticsearchConnectionField(
+                SearchAfterPost,
+                pagination_mode='search_after',
+                search_after_tiebreaker='title.raw'
+            )
+            ElasticsearchConnectionField(SearchAfterPost)
+            self.assertEqual(warning.call_count, 1)
+
+
+class ContextClient(Client):
+    """Client giving a (new) context to each query."""
+
+    def execute(self, *args, **kwargs):
+        kwargs.setdefault('context_value', {})
+        return super(ContextClient, self).execute(*args, **kwargs)
+
+
+class PaginationMultiSearchTestCase(PaginationTestCase):
+
+    query_name = 'multiSearchPostDocuments'
+
+    @classmethod
+    def setUpClass(cls):
+        super(PaginationMultiSearchTestCase, cls).setUpClass()
+        cls.client = ContextClient(schema)
+
+    def __test_multi_search(self):
+        """Test that connections are fetched with msearch requests.
+
+        :return:
+        """
+        _query = """
+        {
+          elastic: %(query_name)s(
+            first:4,
+            filter:{category:{value:"Elastic"}}
+          ) {
+            totalCount
+            edges {
+              node {
+                category
+              }
+            }
+          }
+          django: %(query_name)s(
+            first:3,
+            filter:{category:{value:"Django"}}
+          ) {
+            totalCount
+            edges {
+              node {
+                category
+              }
+            }
+          }
+        }
+        """ % {'query_name': self.query_name}
+        logger.info(_query)
+        with mock.patch.object(Search, 'execute') as execute, \
+                mock.patch.object(Search, 'count') as count:
+            executed = self.client.execute(_query)
+            execute.assert_not_called()
+            count.assert_not_called()
+
+        self.assertNotIn('errors', executed)
+        self.assertEqual(
+            executed['data']['elastic']['totalCount'],
+            self.num_elastic_posts
+        )
+        self.assertEqual(len(executed['data']['elastic']['edges']), 4)
+        self.assertEqual(
+            executed['data']['django']['totalCount'],
+            self.num_django_posts
+        )
+        self.assertEqual(len(executed['data']['django']['edges']), 3)
+        for edge in executed['data']['django']['edges']:
+            self.assertEqual(edge['node']['category'], 'Django')
+
+    def test_all(self):
+        super(PaginationMultiSearchTestCase, self).test_all()
+
+        with self.subTest('Test multi search'):
+            self.__test_multi_search()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,150 @@
+import unittest
+
+import mock
+from anysearch.search_dsl import Search
+from graphene.test import Client
+from graphql_relay import to_global_id
+from schema import schema
+from search_index.documents import Post as PostDocument
+
+from ..hits import RawHit
+
+__title__ = 'graphene_elastic.tests.test_raw_hits'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'RawHitsTest',
+)
+
+HITS = [
+    {
+        '_index': PostDocument._index._name,
+        '_id': '1',
+        '_score': 1.5,
+        '_source': {
+            'title': 'Alpha',
+            'created_at': '2019-06-01T12:00:00',
+            'published': True,
+            'num_views': 10,
+            'tags': ['python', 'graphql'],
+            'comments': [
+                {
+                    'author': [{'name': 'John', 'age': 30}],
+                    'content': 'Nice',
+                    'created_at': '2019-06-02T08:30:00',
+                },
+            ],
+        },
+        'highlight': {'title': ['<b>Alpha</b>']},
+        'sort': [1.5, '1'],
+    },
+    {
+        '_index': PostDocument._index._name,
+        '_id': '2',
+        '_score': 0.5,
+        '_source': {
+            'title': 'Beta',
+        },
+        'sort': [0.5, '2'],
+    },
+]
+
+QUERY = """
+query {
+  %s(search:{title:{value:"alpha"}}, first: 2) {
+    edges {
+      node {
+        id
+        title
+        createdAt
+        published
+        numViews
+        tags
+        score
+        highlight
+        comments {
+          content
+          createdAt
+          author {
+            name
+            age
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+class RawHitsTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.hits`` module.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Client(schema)
+
+    def execute(self, field_name):
+        """Execute the query against the given field and return edges."""
+        def execute(search, *args, **kwargs):
+            search._response = search._response_class(
+                search,
+                {'hits': {'total': {'value': 2, 'relation': 'eq'},
+                          'hits': HITS}}
+            )
+            return search._response
+
+        with mock.patch.object(Search, 'execute', execute), \
+                mock.patch.object(Search, 'count', return_value=2):
+            executed = self.client.execute(QUERY % field_name)
+
+        self.assertNotIn('errors', executed)
+        return executed['data'][field_name]['edges']
+
+    def test_same_as_documents(self):
+        """Test that raw hits resolve the same as documents."""
+        raw_edges = self.execute('rawHitsPostDocuments')
+        edges = self.execute('allPostDocuments')
+        self.assertEqual(
+            raw_edges[0]['node']['id'],
+            to_global_id('RawHitsPost', '1')
+        )
+        # Global ids are made of the type name
+        for edge in raw_edges + edges:
+            edge['node'].pop('id')
+        self.assertEqual(raw_edges, edges)
+
+        node = raw_edges[0]['node']
+        self.assertEqual(node['title'], 'Alpha')
+        self.assertEqual(node['createdAt'], '2019-06-01T12:00:00')
+        self.assertEqual(node['score'], 1.5)
+        self.assertEqual(
+            node['comments'][0]['createdAt'],
+            '2019-06-02T08:30:00'
+        )
+        self.assertEqual(node['comments'][0]['author'][0]['age'], 30)
+
+        # Missing fields are empty
+        node = raw_edges[1]['node']
+        self.assertIsNone(node['createdAt'])
+        self.assertEqual(node['comments'], [])
+
+    def test_raw_hit(self):
+        """Test the raw hit wrapper."""
+        hit = RawHit(HITS[0], PostDocument)
+        self.assertEqual(hit.title, 'Alpha')
+        self.assertEqual(hit.created_at.year, 2019)
+        self.assertEqual(hit.comments[0].author[0].name, 'John')
+        self.assertEqual(hit.meta.id, '1')
+        self.assertEqual(hit.meta.sort, [1.5, '1'])
+        self.assertEqual(hit.to_dict(), HITS[0]['_source'])
+        self.assertIsNone(hit.content)
+        with self.assertRaises(AttributeError):
+            getattr(hit, 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
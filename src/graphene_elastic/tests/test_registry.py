@@ -0,0 +1,118 @@
+import unittest
+
+import mock
+from anysearch.search_dsl import Document, InnerDoc, Keyword, Nested, Text
+from schema import Query
+
+from ..registry import Registry
+from ..types import ElasticsearchObjectType
+from ..utils import get_document_dependencies
+
+__title__ = 'graphene_elastic.tests.test_registry'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('RegistryTest',)
+
+
+class RegistryAuthor(InnerDoc):
+    name = Text()
+
+
+class RegistryComment(InnerDoc):
+    author = Nested(RegistryAuthor)
+    content = Text()
+
+
+class RegistryArticle(Document):
+    title = Text()
+    comments = Nested(RegistryComment)
+
+
+class RegistryTag(Document):
+    name = Keyword()
+
+
+class RegistryTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.registry`` module.
+    """
+
+    def test_document_dependencies(self):
+        """Test documents referred to at any depth are found."""
+        self.assertEqual(
+            get_document_dependencies(RegistryArticle),
+            {RegistryComment, RegistryAuthor}
+        )
+        self.assertEqual(get_document_dependencies(RegistryTag), set())
+
+    def test_register_rescans_dependent_types(self):
+        """Test that only the types referring to the document are rescanned."""
+        type_registry = Registry()
+        rescanned = []
+
+        def rescan_fields(cls):
+            rescanned.append(cls.__name__)
+
+        with mock.patch.object(
+            ElasticsearchObjectType,
+            'rescan_fields',
+            classmethod(rescan_fields)
+        ):
+            class Article(ElasticsearchObjectType):
+                class Meta:
+                    document = RegistryArticle
+                    registry = type_registry
+
+            class Tag(ElasticsearchObjectType):
+                class Meta:
+                    document = RegistryTag
+                    registry = type_registry
+
+            class Comment(ElasticsearchObjectType):
+                class Meta:
+                    document = RegistryComment
+                    registry = type_registry
+
+        self.assertEqual(rescanned, ['Article'])
+        self.assertIs(type_registry.get_type_for_document(RegistryTag), Tag)
+        self.assertIn('comments', Article._meta.fields)
+        self.assertIn('author', Comment._meta.fields)
+
+    def test_converted_fields(self):
+        """Test that field conversions are kept per field instance."""
+        type_registry = Registry()
+        field = Text()
+        converted = object()
+        type_registry.register_converted_field(field, converted)
+        self.assertIs(type_registry.get_converted_field(field), converted)
+        self.assertIsNone(type_registry.get_converted_field(Text()))
+
+    def test_connection_field_args(self):
+        """Test that arguments of the connection field are memoized."""
+        field = Query._meta.fields['all_post_documents']
+        args = field.args
+        self.assertIs(field.args, args)
+        self.assertIn('filter', args)
+
+    def test_rescan_fields(self):
+        """Test that rescan keeps the fields converted initially."""
+        type_registry = Registry()
+
+        class Article(ElasticsearchObjectType):
+            class Meta:
+                document = RegistryArticle
+                registry = type_registry
+                exclude_fields = ('title',)
+
+        fields = dict(Article._meta.fields)
+        del Article._meta.fields['comments']
+        Article.rescan_fields()
+
+        self.assertNotIn('title', Article._meta.fields)
+        self.assertIn('comments', Article._meta.fields)
+        self.assertIs(Article._meta.fields['_id'], fields['_id'])
+
+
+if __name__ == '__main__':
+    unittest.main()
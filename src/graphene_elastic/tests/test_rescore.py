@@ -0,0 +1,111 @@
+import unittest
+
+import mock
+from anysearch.search_dsl import Search
+from anysearch.search_dsl.query import Q
+
+from ..constants import PAGINATION_MODE_OFFSET, PAGINATION_MODE_SEARCH_AFTER
+from ..filter_backends import RescoreFilterBackend
+
+__title__ = 'graphene_elastic.tests.test_rescore'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('RescoreFilterBackendTest',)
+
+
+def get_rescore_query(backend):
+    """Phrase proximity on the searched terms."""
+    query = dict(backend.args).get('search', {}).get('query')
+    if query:
+        return Q('match_phrase', title={'query': query, 'slop': 2})
+
+
+class RescoreFilterBackendTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.filter_backends.score.rescore`` module.
+    """
+
+    def filter(self, queryset, rescore_options, args=None,
+               pagination_mode=PAGINATION_MODE_OFFSET):
+        """Filter the queryset with the given rescore options."""
+        connection_field = mock.Mock(pagination_mode=pagination_mode)
+        with mock.patch.object(
+            RescoreFilterBackend,
+            'compiled_options',
+            new_callable=mock.PropertyMock,
+            return_value=RescoreFilterBackend.compile_options({
+                'rescore_options': rescore_options,
+            })
+        ):
+            backend = RescoreFilterBackend(connection_field, args=args)
+            return backend.filter(queryset).to_dict()
+
+    def test_rescore(self):
+        """Test that the rescore query is applied to the window."""
+        queryset = Search().query('match', title='alice')
+        body = self.filter(
+            queryset,
+            {
+                'window_size': 50,
+                'rescore_query': {
+                    'function_score': {
+                        'functions': [
+                            {'gauss': {'created_at': {'scale': '30d'}}},
+                        ],
+                    },
+                },
+                'query_weight': 0.7,
+            }
+        )
+        self.assertEqual(body['query'], queryset.to_dict()['query'])
+        self.assertEqual(
+            body['rescore'],
+            {
+                'window_size': 50,
+                'query': {
+                    'rescore_query': {
+                        'function_score': {
+                            'functions': [
+                                {'gauss': {'created_at': {'scale': '30d'}}},
+                            ],
+                        },
+                    },
+                    'query_weight': 0.7,
+                },
+            }
+        )
+
+    def test_callable(self):
+        """Test that the rescore query might be made per request."""
+        options = {'rescore_query': get_rescore_query}
+        body = self.filter(
+            Search().sort('_score'),
+            options,
+            args={'search': {'query': 'alice'}}
+        )
+        self.assertEqual(
+            body['rescore']['query']['rescore_query'],
+            {'match_phrase': {'title': {'query': 'alice', 'slop': 2}}}
+        )
+        self.assertNotIn('rescore', self.filter(Search(), options))
+
+    def test_not_sorted_by_score(self):
+        """Test that hits sorted by fields are not rescored."""
+        options = {'rescore_query': {'match_all': {}}}
+        self.assertNotIn(
+            'rescore',
+            self.filter(Search().sort('-num_views'), options)
+        )
+        self.assertNotIn(
+            'rescore',
+            self.filter(
+                Search(),
+                options,
+                pagination_mode=PAGINATION_MODE_SEARCH_AFTER
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
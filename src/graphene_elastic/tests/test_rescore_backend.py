@@ -0,0 +1,116 @@
+import unittest
+import logging
+import factories
+from .base import BaseGrapheneElasticTestCase
+from ..constants import ALL
+
+__all__ = (
+    'RescoreBackendElasticTestCase',
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RescoreBackendElasticTestCase(BaseGrapheneElasticTestCase):
+
+    def setUp(self):
+        super(RescoreBackendElasticTestCase, self).setUp()
+        self.phrase = "Alice Bob"
+        # Terms of the phrase next to each other, but in a long title
+        # (scored lower by the main query)
+        self.num_phrase_posts = 3
+        self.phrase_posts = factories.PostFactory.create_batch(
+            self.num_phrase_posts
+        )
+        for _index, _post in enumerate(self.phrase_posts):
+            _post.title = "Alice Bob lorem ipsum dolor sit amet {}".format(
+                _index
+            )
+            _post.content = "Lorem ipsum"
+            _post.save()
+
+        # Terms of the phrase far from each other, in a short title
+        # (scored higher by the main query)
+        self.num_scattered_posts = 6
+        self.scattered_posts = factories.PostFactory.create_batch(
+            self.num_scattered_posts
+        )
+        for _index, _post in enumerate(self.scattered_posts):
+            _post.title = "Alice lorem ipsum dolor Bob {}".format(_index)
+            _post.content = "Lorem ipsum"
+            _post.save()
+
+        self.sleep(2)
+
+    def __get_titles(self, query_name, args):
+        """Get titles of the posts found.
+
+        :param query_name:
+        :param args:
+        :return:
+        """
+        query = """
+        query {
+          %s(%s) {
+            edges {
+              node {
+                title
+                score
+              }
+            }
+          }
+        }
+        """ % (query_name, args)
+        logger.info(query)
+        executed = self.client.execute(query)
+        self.assertNotIn('errors', executed)
+        edges = executed['data'][query_name]['edges']
+        self.assertEqual(
+            len(edges),
+            self.num_phrase_posts + self.num_scattered_posts
+        )
+        return [edge['node']['title'] for edge in edges]
+
+    def _test_rescore(self):
+        """Test that top hits are reordered by the rescore query.
+
+        :return:
+        """
+        search = 'search:{%s:"%s"}' % (ALL, self.phrase)
+        phrase_titles = {_post.title for _post in self.phrase_posts}
+
+        with self.subTest('Test phrase posts scored lower without rescore'):
+            titles = self.__get_titles(
+                'allPostDocuments',
+                search + ', ordering:{score:DESC}'
+            )
+            self.assertFalse(
+                set(titles[:self.num_phrase_posts]) & phrase_titles
+            )
+
+        with self.subTest('Test phrase posts come first with rescore'):
+            titles = self.__get_titles('rescorePostDocuments', search)
+            self.assertEqual(
+                set(titles[:self.num_phrase_posts]),
+                phrase_titles
+            )
+
+        with self.subTest('Test hits sorted by fields are not rescored'):
+            titles = self.__get_titles(
+                'rescorePostDocuments',
+                search + ', ordering:{title:ASC}'
+            )
+            self.assertEqual(titles, sorted(titles))
+
+    def test_all(self):
+        """Test all.
+
+        Since we don't write in specific tests, it's more efficient to run
+        them all from a single method in order to save on speed ups between
+        tests.
+        """
+        self._test_rescore()
+
+
+if __name__ == '__main__':
+    unittest.main()
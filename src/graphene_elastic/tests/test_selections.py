@@ -0,0 +1,258 @@
+import unittest
+
+import mock
+from anysearch.search_dsl import Search
+from graphene.test import Client
+from schema import schema
+
+__title__ = 'graphene_elastic.tests.test_selections'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = (
+    'SkipUnselectedTest',
+    'SourceFromSelectionTest',
+)
+
+
+class SourceFromSelectionTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.selections`` module.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Client(schema)
+
+    def get_source(self, query):
+        """Execute the query and return `_source` of the search made."""
+        sources = []
+
+        def execute(search, *args, **kwargs):
+            sources.append(search.to_dict().get('_source'))
+            search._response = search._response_class(
+                search,
+                {'hits': {'total': {'value': 0, 'relation': 'eq'},
+                          'hits': []}}
+            )
+            return search._response
+
+        with mock.patch.object(Search, 'execute', execute), \
+                mock.patch.object(Search, 'count', return_value=0):
+            executed = self.client.execute(query)
+
+        self.assertNotIn('errors', executed)
+        self.assertEqual(len(sources), 1)
+        return sources[0]
+
+    def test_selected_fields(self):
+        """Test that only the selected fields are fetched."""
+        source = self.get_source("""
+        query {
+          allPostDocuments {
+            edges {
+              node {
+                id
+                title
+                highlight
+                comments {
+                  tag
+                  author {
+                    name
+                  }
+                }
+              }
+            }
+          }
+        }
+        """)
+        self.assertEqual(
+            source,
+            ['comments.author.name', 'comments.tag', 'title']
+        )
+
+    def test_fragments(self):
+        """Test that fields selected in fragments are fetched."""
+        source = self.get_source("""
+        query {
+          allPostDocuments {
+            edges {
+              ...PostEdgeFields
+            }
+          }
+        }
+        fragment PostEdgeFields on PostEdge {
+          node {
+            ... on Post {
+              numViews
+            }
+          }
+        }
+        """)
+        self.assertEqual(source, ['num_views'])
+
+    def test_no_document_fields(self):
+        """Test that `_source` is disabled if no fields are selected."""
+        source = self.get_source("""
+        query {
+          allPostDocuments {
+            totalCount
+            edges {
+              node {
+                id
+              }
+            }
+          }
+        }
+        """)
+        self.assertIs(source, False)
+
+    def test_explicit_source(self):
+        """Test that the `source` argument takes precedence."""
+        source = self.get_source("""
+        query {
+          allPostDocuments(source: [title]) {
+            edges {
+              node {
+                content
+              }
+            }
+          }
+        }
+        """)
+        self.assertEqual(source, ['title'])
+
+
+class SkipUnselectedTest(unittest.TestCase):
+    """
+    Tests of skipping the parts of the search that aren't selected.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = Client(schema)
+
+    def get_requests(self, query):
+        """Execute the query and return the requests made."""
+        requests = []
+
+        def execute(search, *args, **kwargs):
+            requests.append(('search', search.to_dict()))
+            search._response = search._response_class(
+                search,
+                {'hits': {'total': {'value': 40, 'relation': 'eq'},
+                          'hits': []},
+                 'aggregations': {}}
+            )
+            return search._response
+
+        def count(search, *args, **kwargs):
+            requests.append(('count', search.to_dict(count=True)))
+            return 40
+
+        with mock.patch.object(Search, 'execute', execute), \
+                mock.patch.object(Search, 'count', count):
+            executed = self.client.execute(query)
+
+        self.assertNotIn('errors', executed)
+        return requests
+
+    def test_total_count_only(self):
+        """Test that no search is made if only the total is selected."""
+        requests = self.get_requests("""
+        query {
+          allPostDocuments(first: 5) {
+            totalCount
+            pageInfo {
+              hasNextPage
+            }
+          }
+        }
+        """)
+        self.assertEqual([_request[0] for _request in requests], ['count'])
+
+    def test_facets_only(self):
+        """Test that no hits are fetched if only facets are selected."""
+        requests = self.get_requests("""
+        query {
+          allPostDocuments {
+            facets
+          }
+        }
+        """)
+        self.assertEqual(len(requests), 2)
+        body = requests[1][1]
+        self.assertEqual(body['size'], 0)
+        self.assertIn('aggs', body)
+        self.assertNotIn('highlight', body)
+
+    def test_edges_only(self):
+        """Test that aggregations and highlight are dropped."""
+        requests = self.get_requests("""
+        query {
+          allPostDocuments(first: 5) {
+            edges {
+              node {
+                title
+              }
+            }
+          }
+        }
+        """)
+        body = requests[1][1]
+        self.assertEqual(body['size'], 5)
+        self.assertNotIn('aggs', body)
+        self.assertNotIn('highlight', body)
+
+    def test_highlight_selected(self):
+        """Test that highlight is kept if selected."""
+        requests = self.get_requests("""
+        query {
+          allPostDocuments(first: 5) {
+            edges {
+              node {
+                title
+                highlight
+              }
+            }
+          }
+        }
+        """)
+        body = requests[1][1]
+        self.assertIn('highlight', body)
+        self.assertNotIn('aggs', body)
+
+    def test_constant_score(self):
+        """Test that hits sorted by fields are not scored."""
+        requests = self.get_requests("""
+        query {
+          allPostDocuments(search:{query:"python"}, first: 5) {
+            edges {
+              node {
+                title
+              }
+            }
+          }
+        }
+        """)
+        body = requests[1][1]
+        query = body['query']['constant_score']['filter']
+        self.assertIn('should', query['bool'])
+        self.assertIs(body['track_scores'], False)
+
+    def test_score_needed(self):
+        """Test that hits are scored if sorted by or selected."""
+        for query in (
+            'allPostDocuments(search:{query:"python"}, '
+            'ordering:{score:DESC}, first: 5) '
+            '{ edges { node { title } } }',
+            'allPostDocuments(search:{query:"python"}, first: 5) '
+            '{ edges { node { title score } } }',
+        ):
+            body = self.get_requests('query { %s }' % query)[1][1]
+            self.assertIn('bool', body['query'])
+            self.assertNotIn('track_scores', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
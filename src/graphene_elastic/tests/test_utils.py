@@ -0,0 +1,59 @@
+import copy
+import unittest
+
+from graphene_elastic.utils import freeze, FrozenDict, is_score_sort
+
+__title__ = 'graphene_elastic.tests.test_utils'
+__author__ = 'Artur Barseghyan'
+__copyright__ = 'Copyright (c) 2019-2020 Artur Barseghyan'
+__license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
+__all__ = ('UtilsTest',)
+
+
+class UtilsTest(unittest.TestCase):
+    """
+    Tests of ``graphene_elastic.utils`` module.
+    """
+
+    def test_freeze(self):
+        """Test freeze."""
+        frozen = freeze({'a': {'b': [1, {'c': 2}]}})
+        self.assertIsInstance(frozen, FrozenDict)
+        self.assertIsInstance(frozen['a'], FrozenDict)
+        self.assertEqual(frozen['a']['b'], (1, {'c': 2}))
+        self.assertIsInstance(frozen['a']['b'][1], FrozenDict)
+
+    def test_frozen_dict_is_immutable(self):
+        """Test that FrozenDict can not be modified."""
+        frozen = freeze({'a': 1})
+        with self.assertRaises(TypeError):
+            frozen['b'] = 2
+        with self.assertRaises(TypeError):
+            frozen.pop('a')
+        with self.assertRaises(TypeError):
+            frozen.update({'a': 2})
+        with self.assertRaises(TypeError):
+            del frozen['a']
+        self.assertEqual(frozen, {'a': 1})
+
+    def test_frozen_dict_copy(self):
+        """Test that copies of FrozenDict are mutable."""
+        frozen = freeze({'a': {'b': 1}})
+        shallow = copy.copy(frozen)
+        shallow['c'] = 3
+        deep = copy.deepcopy(frozen)
+        deep['a']['b'] = 2
+        self.assertEqual(frozen, {'a': {'b': 1}})
+
+    def test_is_score_sort(self):
+        """Test detection of the sorts involving the score."""
+        self.assertTrue(is_score_sort(['-_score']))
+        self.assertTrue(is_score_sort([{'_score': {'order': 'desc'}}]))
+        self.assertTrue(is_score_sort([{'_script': {'type': 'number'}}]))
+        self.assertFalse(
+            is_score_sort(['title.raw', {'num_views': {'order': 'desc'}}])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ from six import iteritems
 
 from ..constants import DYNAMIC_CLASS_NAME_PREFIX
 from ..converter import convert_elasticsearch_field
+from ..interning import intern_type
 from .json_string import ElasticJSONString
 
 
@@ -46,7 +47,7 @@ def generate_dynamic_elastic_object_type(field, registry=None):
         for name, _field in iteritems(mapping)
     }
 
-    cls = type(
+    cls = intern_type(
         "{}{}ObjectNode{}".format(
             DYNAMIC_CLASS_NAME_PREFIX,
             field.name.capitalize(),
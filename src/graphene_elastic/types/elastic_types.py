@@ -11,7 +11,10 @@ from graphene.types.utils import yank_fields_from_attrs
 
 # from ..fields import ElasticsearchConnectionField
 from ..relay.connection import Connection
+from ..cache import BaseResultCache
 from ..converter import convert_elasticsearch_field
+from ..hits import RawHit
+from ..loaders import load_document
 from ..registry import Registry, get_global_registry
 from ..utils import (
     get_document_fields,
@@ -95,6 +98,20 @@ def construct_self_referenced_fields(self_referenced, registry):
     return fields
 
 
+def compile_backend_options(backends, options):
+    """Compile backend options.
+
+    :param backends: Filter backend classes.
+    :param options: Meta options.
+    :return: Compiled options keyed by the backend class.
+    :rtype: dict
+    """
+    return {
+        backend_cls: backend_cls.compile_options(options)
+        for backend_cls in backends
+    }
+
+
 def construct_backend_fields(backends, connection):
     """Construct backend fields.
 
@@ -117,6 +134,12 @@ class ElasticsearchObjectTypeOptions(ObjectTypeOptions):
     connection = None  # type: Type[Connection]
     # filter_backends = []
     # filter_backend_options = {}
+    # Backend options compiled once (keyed by the backend class)
+    compiled_filter_backend_options = None  # type: dict
+    # Cache of the search results (see `graphene_elastic.cache`)
+    result_cache = None  # type: BaseResultCache
+    # Names of the fields added by the filter backends
+    backend_fields = ()  # type: tuple
 
 
 class ElasticsearchObjectType(ObjectType):
@@ -193,6 +216,13 @@ class ElasticsearchObjectType(ObjectType):
         else:
             _meta = ElasticsearchObjectTypeOptions(cls)
 
+        result_cache = options.get('result_cache')
+        if result_cache is not None:
+            assert isinstance(result_cache, BaseResultCache), (
+                'The attribute result_cache in {}.Meta must be an instance of '
+                'BaseResultCache. Received "{}" instead.'
+            ).format(cls.__name__, type(result_cache))
+
         backend_fields = construct_backend_fields(
             backends=options.get('filter_backends', []),
             connection=connection
@@ -204,6 +234,12 @@ class ElasticsearchObjectType(ObjectType):
         _meta.fields = document_fields
         _meta.filter_backends = options.get('filter_backends', [])
         _meta.filter_backend_options = dict(options)
+        _meta.compiled_filter_backend_options = compile_backend_options(
+            backends=_meta.filter_backends,
+            options=_meta.filter_backend_options
+        )
+        _meta.result_cache = result_cache
+        _meta.backend_fields = tuple(backend_fields)
         _meta.connection = connection
         _meta.connection_field_class = connection_field_class
         # Save them for later
@@ -233,9 +269,22 @@ class ElasticsearchObjectType(ObjectType):
         """Attempts to rescan fields and will insert any not converted
         initially."""
 
+        only_fields = cls._meta.only_fields
+        exclude_fields = cls._meta.exclude_fields
+        # Only the fields not converted yet are constructed again
+        missing_fields = [
+            name
+            for name in get_document_fields(cls._meta.document)
+            if name not in cls._meta.fields
+            and name not in exclude_fields
+            and (not only_fields or name in only_fields)
+        ]
+        if not missing_fields:
+            return
+
         converted_fields, self_referenced = construct_fields(
             cls._meta.document, cls._meta.registry,
-            cls._meta.only_fields, cls._meta.exclude_fields
+            missing_fields, exclude_fields
         )
 
         document_fields = yank_fields_from_attrs(
@@ -254,6 +303,10 @@ class ElasticsearchObjectType(ObjectType):
         if isinstance(root, cls):
             return True
 
+        if isinstance(root, RawHit):
+            return root.document is None \
+                or issubclass(root.document, cls._meta.document)
+
         if not is_valid_elasticsearch_document(type(root)):
             raise Exception((
                 'Received incompatible instance "{}".'
@@ -262,11 +315,14 @@ class ElasticsearchObjectType(ObjectType):
 
     @classmethod
     def get_node(cls, info, id):
-        return cls._meta.document.get(id)
+        # Batched (per request) with the other nodes of the same document
+        return load_document(info, cls._meta.document, id)
 
     @property
     def id(self):
         return self.meta.id
 
     def resolve_id(self, info):
+        if isinstance(self, RawHit):
+            return self.hit.get('_id')
         return self.meta.id
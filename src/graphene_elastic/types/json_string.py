@@ -1,17 +1,23 @@
 import datetime
-import json
 
 from anysearch.search_dsl import InnerDoc, Document, AttrDict, AttrList
 from graphene.types.json import JSONString as OriginalJSONString
 
+from ..compat import json_dumps, json_loads, orjson
+
 __author__ = 'Artur Barseghyan <artur.barseghyan@gmail.com>'
 __copyright__ = '2019-2022 Artur Barseghyan'
 __license__ = 'GPL-2.0-only OR LGPL-2.1-or-later'
 __all__ = (
     'ElasticJSONString',
+    'to_plain',
     'to_serializable',
+    'unwrap',
 )
 
+# Types returned as is
+SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
 
 def to_serializable(o):
     if isinstance(o, (datetime.date, datetime.datetime)):
@@ -28,8 +34,91 @@ def to_serializable(o):
     return o
 
 
+def to_plain_key(key):
+    """Convert dictionary key the way JSON encoding would."""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, bool):
+        return 'true' if key else 'false'
+    if key is None:
+        return 'null'
+    return str(key)
+
+
+def unwrap(value):
+    """Unwrap `AttrDict`, `AttrList` and documents."""
+    if isinstance(value, AttrDict):
+        return value._d_
+    if isinstance(value, AttrList):
+        return value._l_
+    if isinstance(value, (InnerDoc, Document)):
+        return value.to_dict()
+    return value
+
+
+def to_plain(value):
+    """Convert value to plain (JSON compatible) Python structures.
+
+    Equivalent of `json.loads(json.dumps(value, default=to_serializable))`,
+    but without encoding to (and decoding from) a string. Walks the
+    `AttrDict`/`AttrList` wrappers (facets, highlights) iteratively, so
+    that deeply nested structures do not hit the recursion limit. Values of
+    unknown types are converted with the JSON round trip.
+
+    :param value: Value to convert.
+    :return: Plain value (dictionaries, lists and scalars).
+    """
+    value = unwrap(value)
+    if type(value) in SCALAR_TYPES:
+        return value
+
+    result = [None]
+    # Items to be converted: (container, key or index, value)
+    stack = [(result, 0, value)]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        container, key, item = pop()
+        if isinstance(item, dict):
+            plain = container[key] = {}
+            for _key, _value in item.items():
+                if type(_key) is not str:
+                    _key = to_plain_key(_key)
+                if type(_value) in SCALAR_TYPES:
+                    plain[_key] = _value
+                else:
+                    plain[_key] = None
+                    push((plain, _key, unwrap(_value)))
+        elif isinstance(item, (list, tuple)):
+            plain = container[key] = list(item)
+            for _index, _value in enumerate(item):
+                if type(_value) not in SCALAR_TYPES:
+                    push((plain, _index, unwrap(_value)))
+        elif isinstance(item, (datetime.date, datetime.datetime)):
+            container[key] = item.isoformat()
+        elif isinstance(item, (str, int, float)):
+            container[key] = item
+        else:
+            container[key] = json_loads(
+                json_dumps(item, default=to_serializable)
+            )
+
+    return result[0]
+
+
 class ElasticJSONString(OriginalJSONString):
     @staticmethod
     def serialize(dt):
-        # return to_serializable(dt)
-        return json.loads(json.dumps(dt, default=to_serializable))
+        # The round trip is done in C by `orjson`, which is faster still
+        if orjson is not None:
+            try:
+                return orjson.loads(
+                    orjson.dumps(
+                        dt,
+                        default=to_serializable,
+                        option=orjson.OPT_NON_STR_KEYS
+                    )
+                )
+            except TypeError:
+                pass
+        return to_plain(dt)
@@ -2,6 +2,7 @@ from __future__ import unicode_literals
 
 import inspect
 from collections import OrderedDict
+from copy import deepcopy
 
 from anysearch.search_dsl import (
     field as elasticsearch_fields,
@@ -16,11 +17,15 @@ __author__ = "Artur Barseghyan <artur.barseghyan@gmail.com>"
 __copyright__ = "2019-2022 Artur Barseghyan"
 __license__ = "GPL-2.0-only OR LGPL-2.1-or-later"
 __all__ = (
+    "freeze",
+    "FrozenDict",
+    "get_document_dependencies",
     "get_document_fields",
     "get_field_description",
     "get_node_from_global_id",
     "get_type_for_document",
     "import_single_dispatch",
+    "is_score_sort",
     "is_valid_elasticsearch_document",
 )
 
@@ -38,6 +43,31 @@ def get_document_fields(document, excluding=None):
     return OrderedDict(sorted(attributes.items()))
 
 
+def get_document_dependencies(document):
+    """Get documents the fields of the given document refer to.
+
+    Inner documents of the object (and nested) fields are followed, so that
+    documents referred to at any depth (including the document itself, in
+    case of self-reference) are returned.
+
+    :param document: Document class.
+    :type document: elasticsearch_dsl.Document
+    :return: Set of document (or inner document) classes.
+    :rtype: set
+    """
+    dependencies = set()
+    pending = [document]
+    while pending:
+        properties = pending.pop()._doc_type.mapping.properties.properties
+        for field in properties._d_.values():
+            doc_class = getattr(field, '_doc_class', None)
+            if doc_class is None or doc_class in dependencies:
+                continue
+            dependencies.add(doc_class)
+            pending.append(doc_class)
+    return dependencies
+
+
 def is_valid_elasticsearch_document(document):
     return inspect.isclass(document) and (
         issubclass(document, Document)
@@ -113,3 +143,80 @@ def get_node_from_global_id(node, info, global_id):
                 return interface.get_node_from_global_id(info, global_id)
     except AttributeError:
         return Node.get_node_from_global_id(info, global_id)
+
+
+def is_score_sort(sort):
+    """Whether the sort involves the score.
+
+    Script based sorts might use the score, thus are considered to.
+
+    :param sort: Sort (`_sort` of the search), such as
+        ``["-num_views", {"_score": {"order": "desc"}}]``.
+    :type sort: list
+    :return: True if hits are sorted by the score.
+    :rtype: bool
+    """
+    for item in sort:
+        if isinstance(item, dict):
+            names = item.keys()
+        else:
+            names = [item]
+        for name in names:
+            if name.lstrip("-") in ("_score", "_script"):
+                return True
+    return False
+
+
+class FrozenDict(dict):
+    """Immutable dictionary.
+
+    Used for configuration compiled once and shared between requests. Any
+    attempt to modify it raises a ``TypeError``. Copies (both shallow and
+    deep) are plain (mutable) dictionaries, so that the usual
+    ``copy(options)`` followed by ``options.pop(...)`` keeps working.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(
+            "'{}' object is immutable".format(self.__class__.__name__)
+        )
+
+    __setitem__ = _immutable
+    __delitem__ = _immutable
+    clear = _immutable
+    pop = _immutable
+    popitem = _immutable
+    setdefault = _immutable
+    update = _immutable
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {
+            deepcopy(key, memo): deepcopy(value, memo)
+            for key, value in self.items()
+        }
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
+def freeze(value):
+    """Recursively freeze the given value.
+
+    Dictionaries become ``FrozenDict``, lists and tuples become tuples.
+    Anything else is returned as is.
+
+    :param value: Value to freeze.
+    :return: Frozen value.
+    """
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict(
+            (key, freeze(_value)) for key, _value in value.items()
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(_value) for _value in value)
+    return value
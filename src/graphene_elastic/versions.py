@@ -58,6 +58,7 @@ LOOSE_VERSIONS = (
     '7.2',
     '7.3',
     '7.4',
+    '7.10',
     '8.0',
     '9.0',
 )